@@ -0,0 +1,107 @@
+"""Compare JSON decoding backends on private.filter.get payloads.
+
+Builds filter pages shaped like HelpSpot's responses (one record per
+request, with a note body of a few hundred bytes) and times each installed
+backend decoding them from bytes, against httpx's ``Response.json()``.
+
+Usage:
+    python benchmarks/bench_json.py [--requests 250 1000 5000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from helpspot.codec import get_decoder
+
+NOTE = (
+    "<p>Hello,</p><p>Since this morning the export job fails with a timeout after "
+    "about ten minutes. We already restarted the worker and cleared the queue, but "
+    "the problem persists. Logs are attached; please advise.</p><p>Thanks,<br>Jane</p>"
+)
+
+
+def filter_page(n: int, seed: int = 0) -> bytes:
+    """Return a private.filter.get response body with n requests."""
+    rng = random.Random(seed)
+    requests = [
+        {
+            "xRequest": 100000 + i,
+            "fOpenedVia": rng.choice(["Email", "Web Service", "Portal", "Phone"]),
+            "xOpenedViaId": rng.randint(1, 5),
+            "xPersonOpenedBy": "",
+            "xPersonAssignedTo": rng.choice(["Support Agent", "Ian Landsman", ""]),
+            "fOpen": rng.randint(0, 1),
+            "xStatus": rng.choice(["Active", "Pending", "Problem Solved"]),
+            "fUrgent": rng.randint(0, 1),
+            "xCategory": rng.choice(["Bugs", "Billing", "Sales", "General"]),
+            "dtGMTOpened": 1700000000 + rng.randint(0, 10**7),
+            "dtGMTClosed": None,
+            "sRequestPassword": f"{rng.getrandbits(24):06x}",
+            "sTitle": f"Ticket {i}: export job fails",
+            "sUserId": str(rng.randint(1000, 99999)),
+            "sFirstName": "Jane",
+            "sLastName": "Smith",
+            "sEmail": f"user{i}@example.com",
+            "sPhone": "555-5678",
+            "iLastReplyBy": "Support Agent",
+            "fTrash": 0,
+            "dtGMTTrashed": None,
+            "fullname": "Jane Smith",
+            "tNote": NOTE,
+            "accesskey": f"{100000 + i}abc",
+            "Custom1": rng.choice(["Gold", "Silver", ""]),
+        }
+        for i in range(n)
+    ]
+    payload = {"filter": {"xFilter": 42, "sFilterName": "Inbox", "request": requests}}
+    return json.dumps(payload).encode()
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, nargs="+", default=[250, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends: dict[str, Callable[[bytes], Any]] = {}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            backends[name] = get_decoder(name)
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(f"{'requests':>8} {'size':>9} {'backend':<16} {'ms':>8} {'MB/s':>8} {'speedup':>8}")
+    for n in args.requests:
+        body = filter_page(n)
+        response = httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        baseline = timed(response.json, args.repeat)
+        rows = [("Response.json()", baseline)]
+        for name, decode in backends.items():
+            rows.append((name, timed(lambda d=decode: d(body), args.repeat)))
+        for name, ms in rows:
+            print(
+                f"{n:>8} {len(body) / 1024:>8.0f}K {name:<16} {ms:>8.2f} "
+                f"{len(body) / 1024 / 1024 / (ms / 1000):>8.1f} {baseline / ms:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
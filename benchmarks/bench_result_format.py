@@ -0,0 +1,74 @@
+"""Compare result formats for parsing large request lists.
+
+Times parse_request_list on private.filter.get pages (10,000 rows by
+default) with result_format="model" (validated Request objects), "trusted"
+(unvalidated Request objects), "lazy" (LazyRequest views), "dict" (raw
+rows) and "batch" (one columnar RequestBatch), both alone and followed by
+reading three fields of every row, which is where lazy views pay their
+conversion cost. Also reports the memory each result holds on top of the
+decoded rows. JSON decoding is excluded.
+
+Usage:
+    python benchmarks/bench_result_format.py [--requests 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from typing import Any
+
+from bench_json import filter_page, timed
+
+from helpspot.api.requests import RESULT_FORMATS, parse_request_list
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = json.loads(filter_page(args.requests))
+
+    def parse(result_format: str) -> Any:
+        return parse_request_list(result, "filter", result_format)  # type: ignore[arg-type]
+
+    def held_mb(result_format: str) -> float:
+        tracemalloc.start()
+        parsed = parse(result_format)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del parsed
+        return size / 2**20
+
+    def parse_and_read(result_format: str) -> None:
+        parsed = parse(result_format)
+        if result_format == "batch":
+            parsed.column("x_request"), parsed.column("title"), parsed.column("is_open")
+            return
+        for row in parsed:
+            if isinstance(row, dict):
+                row["xRequest"], row["sTitle"], row["fOpen"]
+            else:
+                row.x_request, row.title, row.is_open
+
+    print(f"{args.requests} rows per page")
+    print(
+        f"{'format':<8} {'parse ms':>9} {'speedup':>8} {'+read 3 ms':>11} {'speedup':>8} "
+        f"{'held MB':>8}"
+    )
+    baseline = None
+    for result_format in RESULT_FORMATS:
+        ms = timed(lambda f=result_format: parse(f), args.repeat)
+        read_ms = timed(lambda f=result_format: parse_and_read(f), args.repeat)
+        baseline = baseline or (ms, read_ms)
+        print(
+            f"{result_format:<8} {ms:>9.2f} {baseline[0] / ms:>7.1f}x "
+            f"{read_ms:>11.2f} {baseline[1] / read_ms:>7.1f}x {held_mb(result_format):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare JSON and XML output for private.filter.get pages.
+
+Renders the same filter pages as HelpSpot's JSON and XML output and reports
+body size (raw and gzip-compressed, as sent with Content-Encoding: gzip)
+and the CPU time to turn each body into rows and into Request objects,
+both decoding the whole document and streaming it in 64 KB chunks through
+JSONItemScanner / XMLItemScanner. JSON is timed with the fastest installed
+backend and with the standard library.
+
+Usage:
+    python benchmarks/bench_xml.py [--requests 250 1000 5000] [--repeat 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+from collections.abc import Callable
+from typing import Any
+from xml.sax.saxutils import escape
+
+from bench_json import filter_page, timed
+
+from helpspot.api.base import items_at
+from helpspot.codec import AUTO_BACKENDS, decode_xml, get_decoder
+from helpspot.models import Request
+from helpspot.streaming import JSONItemScanner, XMLItemScanner
+
+PATH = ("filter", "request")
+CHUNK = 64 * 1024
+
+
+def to_xml(value: Any, tag: str) -> str:
+    """Render a decoded JSON value the way HelpSpot's XML output does."""
+    if isinstance(value, dict):
+        return f"<{tag}>{''.join(to_xml(v, k) for k, v in value.items())}</{tag}>"
+    if isinstance(value, list):
+        return "".join(to_xml(v, tag) for v in value)
+    if value is None:
+        return f"<{tag}></{tag}>"
+    return f"<{tag}>{escape(str(value))}</{tag}>"
+
+
+def stream(scanner: JSONItemScanner | XMLItemScanner, body: bytes) -> list[Any]:
+    """Feed a body to a scanner in CHUNK-sized pieces and collect the rows."""
+    rows: list[Any] = []
+    for pos in range(0, len(body), CHUNK):
+        rows += scanner.feed(body[pos : pos + CHUNK])
+    scanner.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, nargs="+", default=[250, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # The backend json_decoder="auto" picks
+    for backend in AUTO_BACKENDS:
+        try:
+            loads = get_decoder(backend)
+            break
+        except ImportError:
+            continue
+
+    print(
+        f"{'requests':>8} {'format':<16} {'size':>9} {'gzip':>8} "
+        f"{'rows ms':>8} {'models ms':>10} {'stream ms':>10}"
+    )
+    for n in args.requests:
+        json_body = filter_page(n)
+        xml_body = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            + to_xml(json.loads(json_body)["filter"], "filter")
+        ).encode()
+        cases: list[tuple[str, bytes, Callable[[bytes], Any], Callable[[], Any]]] = [
+            (f"json ({backend})", json_body, loads, lambda: JSONItemScanner(PATH, loads)),
+            ("json (json)", json_body, json.loads, lambda: JSONItemScanner(PATH)),
+            ("xml", xml_body, decode_xml, lambda: XMLItemScanner(PATH)),
+        ]
+        for name, body, decode, scanner in cases:
+            rows_ms = timed(lambda b=body, d=decode: items_at(d(b), PATH), args.repeat)
+            models_ms = timed(
+                lambda b=body, d=decode: [Request(**r) for r in items_at(d(b), PATH)],
+                args.repeat,
+            )
+            stream_ms = timed(lambda b=body, s=scanner: stream(s(), b), args.repeat)
+            print(
+                f"{n:>8} {name:<16} {len(body) / 1024:>8.0f}K "
+                f"{len(gzip.compress(body)) / 1024:>7.0f}K "
+                f"{rows_ms:>8.2f} {models_ms:>10.2f} {stream_ms:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
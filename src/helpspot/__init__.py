@@ -13,7 +13,11 @@ Example:
     >>> print(request.title)
 """
 
-from helpspot.client import HelpSpotClient
+from helpspot.batch import RequestBatch
+from helpspot.bulk import BulkResult
+from helpspot.cache import ResponseCache, cache_control
+from helpspot.client import AsyncHelpSpotClient, HelpSpotClient
+from helpspot.dates import DateParser
 from helpspot.exceptions import (
     APIDisabledError,
     APIError,
@@ -23,11 +27,14 @@ from helpspot.exceptions import (
     HTTPError,
     ValidationError,
 )
+from helpspot.export import ExportResult, export_requests
+from helpspot.mirror import SyncResult, TicketMirror
 from helpspot.models import (
     Category,
     Customer,
     CustomField,
     Filter,
+    LazyRequest,
     Request,
     RequestCreate,
     RequestHistory,
@@ -35,11 +42,28 @@ from helpspot.models import (
     StatusType,
     VersionInfo,
 )
+from helpspot.ratelimit import RateLimiter
+from helpspot.retry import RetryPolicy
+from helpspot.transport import AsyncSharedTransport, SharedTransport
 
 __version__ = "0.1.0"
 
 __all__ = [
     "HelpSpotClient",
+    "AsyncHelpSpotClient",
+    "BulkResult",
+    "RequestBatch",
+    "TicketMirror",
+    "SyncResult",
+    "ExportResult",
+    "export_requests",
+    "DateParser",
+    "ResponseCache",
+    "cache_control",
+    "RetryPolicy",
+    "RateLimiter",
+    "SharedTransport",
+    "AsyncSharedTransport",
     # Exceptions
     "HelpSpotError",
     "AuthenticationError",
@@ -50,6 +74,7 @@ __all__ = [
     "HTTPError",
     # Models
     "Request",
+    "LazyRequest",
     "RequestHistory",
     "RequestCreate",
     "RequestUpdate",
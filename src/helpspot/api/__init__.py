@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from .base import BaseAPI
-from .categories import CategoriesAPI
-from .custom_fields import CustomFieldsAPI
-from .customers import CustomersAPI
-from .filters import FiltersAPI
-from .requests import RequestsAPI
-from .status_types import StatusTypesAPI
+from .base import AsyncBaseAPI, BaseAPI
+from .categories import AsyncCategoriesAPI, CategoriesAPI
+from .custom_fields import AsyncCustomFieldsAPI, CustomFieldsAPI
+from .customers import AsyncCustomersAPI, CustomersAPI
+from .filters import AsyncFiltersAPI, FiltersAPI
+from .requests import AsyncRequestsAPI, RequestsAPI
+from .status_types import AsyncStatusTypesAPI, StatusTypesAPI
 
 __all__ = [
     "BaseAPI",
@@ -18,4 +18,11 @@ __all__ = [
     "CustomFieldsAPI",
     "FiltersAPI",
     "StatusTypesAPI",
+    "AsyncBaseAPI",
+    "AsyncRequestsAPI",
+    "AsyncCustomersAPI",
+    "AsyncCategoriesAPI",
+    "AsyncCustomFieldsAPI",
+    "AsyncFiltersAPI",
+    "AsyncStatusTypesAPI",
 ]
@@ -2,24 +2,241 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import AsyncGenerator, Generator, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
+from pydantic import BaseModel
 
+from helpspot.cache import call_key, current_cache_control
+from helpspot.codec import JSONDecoder
 from helpspot.exceptions import (
     APIDisabledError,
     APIError,
     AuthenticationRequiredError,
     HTTPError,
 )
+from helpspot.streaming import JSONItemScanner, XMLItemScanner
+from helpspot.uploads import form_content
 
 if TYPE_CHECKING:
-    from helpspot.client import HelpSpotClient
+    from helpspot.client import AsyncHelpSpotClient, HelpSpotClient
+    from helpspot.retry import RetryPolicy
 
 logger = logging.getLogger("helpspot")
 
 
+def build_request(
+    client: HelpSpotClient | AsyncHelpSpotClient,
+    api_method: str,
+    params: dict[str, Any] | None = None,
+    require_auth: bool = False,
+) -> tuple[str, dict[str, Any]]:
+    """Build the URL and query parameters for an API call.
+
+    Args:
+        client: The client the call is made through.
+        api_method: HelpSpot API method name (e.g., 'request.get').
+        params: Query parameters.
+        require_auth: Whether authentication is required.
+
+    Returns:
+        Tuple of (url, query parameters).
+
+    Raises:
+        AuthenticationRequiredError: If auth required but not provided.
+    """
+    if require_auth and not client.auth:
+        raise AuthenticationRequiredError(
+            f"Authentication required for method '{api_method}'. "
+            "Please provide api_token or username/password."
+        )
+
+    # Build URL
+    url = f"{client.base_url}/api/index.php"
+
+    # Build parameters
+    request_params = {"method": api_method, "output": client.output_format}
+    if params:
+        request_params.update(params)
+
+    return url, request_params
+
+
+def map_http_error(error: httpx.HTTPError, retries: int = 0) -> HTTPError:
+    """Convert an httpx exception into the library's HTTPError.
+
+    Args:
+        error: The exception raised by httpx.
+        retries: Number of retries made before giving up.
+
+    Returns:
+        HTTPError chained to the original exception by the caller.
+    """
+    suffix = f" (after {retries} retries)" if retries else ""
+    if isinstance(error, httpx.HTTPStatusError):
+        logger.error(f"HTTP error: {error}{suffix}")
+        return HTTPError(
+            f"HTTP request failed: {error}{suffix}",
+            status_code=error.response.status_code,
+            retries=retries,
+        )
+    logger.error(f"Request error: {error}{suffix}")
+    return HTTPError(f"Request failed: {error}{suffix}", retries=retries)
+
+
+def retry_delay(
+    policy: RetryPolicy | None,
+    retries: int,
+    method: str,
+    api_method: str,
+    error: httpx.HTTPError,
+) -> float | None:
+    """Return how long to wait before retrying a failed request, or None to give up."""
+    if policy is None:
+        return None
+    delay = policy.next_delay(retries, method, api_method, error)
+    if delay is not None:
+        logger.warning(
+            f"{method} {api_method} failed ({error}); "
+            f"retry {retries + 1}/{policy.max_retries} in {delay:.2f}s"
+        )
+    return delay
+
+
+def parse_response(
+    response: httpx.Response, loads: JSONDecoder = json.loads, output_format: str = "json"
+) -> dict[str, Any]:
+    """Decode a response body and map HelpSpot error payloads to exceptions.
+
+    Args:
+        response: A successful (2xx) HTTP response.
+        loads: Decoder applied to the raw body bytes (the client's
+            body_decoder: a JSON backend, or helpspot.codec.decode_xml).
+        output_format: Format the body was requested in, for error messages.
+
+    Returns:
+        Parsed response.
+
+    Raises:
+        APIError: If the API returns an error.
+        APIDisabledError: If the API is not enabled.
+        HTTPError: If the body cannot be decoded.
+    """
+    return parse_body(response.content, loads, output_format)
+
+
+def parse_body(
+    content: bytes, loads: JSONDecoder = json.loads, output_format: str = "json"
+) -> dict[str, Any]:
+    """Decode a response body. See parse_response."""
+    kind = output_format.upper()
+    try:
+        result: dict[str, Any] = loads(content)
+    except Exception as e:
+        logger.error(f"Failed to parse {kind} response: {e}")
+        raise HTTPError(f"Invalid {kind} response: {e}") from e
+
+    # Check for API errors
+    if "errors" in result:
+        errors = result["errors"]
+        if isinstance(errors, dict) and "error" in errors:
+            error = errors["error"]
+            if isinstance(error, list):
+                error = error[0]
+            # XML replies carry the ID as text
+            error_id = int(error.get("id") or 0)
+            description = error.get("description", "Unknown error")
+            raise APIError(error_id, description)
+
+    if "reply" in result and "not enabled" in str(result["reply"]).lower():
+        raise APIDisabledError(result["reply"])
+
+    return result
+
+
+def items_at(result: dict[str, Any], path: Sequence[str]) -> list[Any]:
+    """Return the list at ``path`` in a parsed response.
+
+    A single object there (HelpSpot's form for one result) becomes a
+    one-element list; a missing or empty value an empty one.
+    """
+    value: Any = result
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    if isinstance(value, dict):
+        return [value]
+    return list(value) if isinstance(value, list) else []
+
+
+def _unwrapped(result: dict[str, Any], path: Sequence[str], optional_root: bool) -> Sequence[str]:
+    """Return ``path`` without its first key if that is optional and missing."""
+    if optional_root and path and path[0] not in result:
+        return path[1:]
+    return path
+
+
+def item_scanner(
+    client: HelpSpotClient | AsyncHelpSpotClient, path: Sequence[str]
+) -> JSONItemScanner | XMLItemScanner:
+    """Return a scanner for the list at ``path`` in the client's output format."""
+    if client.output_format == "xml":
+        return XMLItemScanner(path)
+    return JSONItemScanner(path, client.json_decoder)
+
+
+def cached_response(
+    client: HelpSpotClient | AsyncHelpSpotClient,
+    api_method: str,
+    request_params: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Look up a GET call in the client's response and disk caches.
+
+    Honours the innermost cache_control() block.
+
+    Returns:
+        The cached response, or None on a miss.
+    """
+    max_age, no_cache = current_cache_control()
+    if no_cache:
+        return None
+    if client.response_cache is not None:
+        cached = client.response_cache.get(api_method, request_params, max_age)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+    if client.disk_cache is not None:
+        return client.disk_cache.get(api_method, request_params)
+    return None
+
+
+def store_response(
+    client: HelpSpotClient | AsyncHelpSpotClient,
+    api_method: str,
+    request_params: dict[str, Any],
+    result: dict[str, Any],
+) -> None:
+    """Store a GET response in the client's response and disk caches."""
+    if client.response_cache is not None:
+        client.response_cache.set(api_method, request_params, result)
+    if client.disk_cache is not None:
+        client.disk_cache.set(api_method, request_params, result)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def copy_models(models: Iterable[ModelT]) -> list[ModelT]:
+    """Return deep copies of models kept in the client's reference cache.
+
+    Callers may change what they get back without changing later cache hits.
+    """
+    return [model.model_copy(deep=True) for model in models]
+
+
 class BaseAPI:
     """Base class for all API endpoint classes."""
 
@@ -41,6 +258,10 @@ class BaseAPI:
     ) -> dict[str, Any]:
         """Make an API request.
 
+        GET calls are served from the client's response cache (and disk cache)
+        when enabled, and concurrent identical GETs share one HTTP request.
+        POST calls invalidate the cached reads they affect.
+
         Args:
             method: HTTP method (GET or POST).
             api_method: HelpSpot API method name (e.g., 'request.get').
@@ -57,58 +278,295 @@ class BaseAPI:
             APIDisabledError: If the API is not enabled.
             HTTPError: If the HTTP request fails.
         """
-        if require_auth and not self.client.auth:
-            raise AuthenticationRequiredError(
-                f"Authentication required for method '{api_method}'. "
-                "Please provide api_token or username/password."
-            )
+        url, request_params = build_request(self.client, api_method, params, require_auth)
 
-        # Build URL
-        url = f"{self.client.base_url}/api/index.php"
+        if method.upper() == "GET":
+            cached = cached_response(self.client, api_method, request_params)
+            if cached is not None:
+                return cached
+            if self.client.single_flight is not None:
+                return self.client.single_flight.do(
+                    call_key(api_method, request_params),
+                    lambda: self._send(method, api_method, url, request_params, data),
+                )
 
-        # Build parameters
-        request_params = {"method": api_method, "output": self.client.output_format}
-        if params:
-            request_params.update(params)
+        return self._send(method, api_method, url, request_params, data)
 
+    def _send(
+        self,
+        method: str,
+        api_method: str,
+        url: str,
+        request_params: dict[str, Any],
+        data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Send a built request, parse the response and update the caches."""
+        is_get = method.upper() == "GET"
         logger.debug(f"Making {method} request to {api_method}")
 
         try:
-            if method.upper() == "GET":
-                response = self.client._http_client.get(url, params=request_params)
-            elif method.upper() == "POST":
-                response = self.client._http_client.post(url, params=request_params, data=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
-            raise HTTPError(f"HTTP request failed: {e}") from e
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise HTTPError(f"Request failed: {e}") from e
-
-        # Parse response
+            response = self._exchange(method, api_method, url, request_params, data)
+        finally:
+            # A failed write may still have been applied
+            if not is_get and self.client.response_cache is not None:
+                self.client.response_cache.invalidate_request({**request_params, **(data or {})})
+
+        result = parse_response(response, self.client.body_decoder, self.client.output_format)
+        if is_get:
+            store_response(self.client, api_method, request_params, result)
+        return result
+
+    def _stream(
+        self,
+        api_method: str,
+        path: Sequence[str],
+        params: dict[str, Any] | None = None,
+        require_auth: bool = False,
+        optional_root: bool = False,
+    ) -> Generator[Any, None, None]:
+        """Make a GET request and yield the list at ``path`` one element at a time.
+
+        Elements are decoded as their bytes arrive (see
+        helpspot.streaming.JSONItemScanner and XMLItemScanner), so memory is bounded by one
+        element rather than the whole response. Streamed calls bypass the
+        response caches. Failures before the first element is yielded are
+        retried per the client's policy; later ones are raised.
+
+        Args:
+            api_method: HelpSpot API method name (e.g., 'private.filter.get').
+            path: Keys leading to the list, such as ("filter", "request").
+            params: Query parameters.
+            require_auth: Whether authentication is required.
+            optional_root: The response may leave out ``path[0]``, a wrapper
+                such as private.request.get's "request" object. An unwrapped
+                response is read whole before its elements are yielded.
+
+        Yields:
+            The decoded list elements, in order.
+
+        Raises:
+            AuthenticationRequiredError: If auth required but not provided.
+            APIError: If the API returns an error.
+            APIDisabledError: If the API is not enabled.
+            HTTPError: If the HTTP request fails or the body cannot be decoded.
+        """
+        url, request_params = build_request(self.client, api_method, params, require_auth)
+        logger.debug(f"Streaming GET request to {api_method}")
+
+        retries = 0
+        while True:
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire(api_method)
+            scanner = item_scanner(self.client, path)
+            yielded = False
+            try:
+                with self.client._http_client.stream("GET", url, params=request_params) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes():
+                        for item in scanner.feed(chunk):
+                            yielded = True
+                            yield item
+                    body = scanner.close()
+                break
+            except httpx.HTTPError as e:
+                delay = None
+                if not yielded:
+                    delay = retry_delay(self.client.retry, retries, "GET", api_method, e)
+                if delay is None:
+                    raise map_http_error(e, retries) from e
+            except ValueError as e:
+                kind = self.client.output_format.upper()
+                raise HTTPError(f"Invalid {kind} response: {e}") from e
+            time.sleep(delay)
+            retries += 1
+
+        if body is not None:
+            # The list was never reached: an error reply or an empty result
+            result = parse_body(body, self.client.body_decoder, self.client.output_format)
+            yield from items_at(result, _unwrapped(result, path, optional_root))
+
+    def _exchange(
+        self,
+        method: str,
+        api_method: str,
+        url: str,
+        request_params: dict[str, Any],
+        data: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send the HTTP request, retrying transient failures per the client's policy.
+
+        Every attempt waits for the client's rate limiter, if any. Form data
+        holding FileUploads is streamed as multipart/form-data, re-read from
+        the files on each attempt.
+        """
+        retries = 0
+        while True:
+            if self.client.rate_limiter is not None:
+                self.client.rate_limiter.acquire(api_method)
+            try:
+                if method.upper() == "GET":
+                    response = self.client._http_client.get(url, params=request_params)
+                elif method.upper() == "POST":
+                    response = self.client._http_client.post(
+                        url, params=request_params, **form_content(data)
+                    )
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                response.raise_for_status()
+                return response
+
+            except httpx.HTTPError as e:
+                delay = retry_delay(self.client.retry, retries, method, api_method, e)
+                if delay is None:
+                    raise map_http_error(e, retries) from e
+            time.sleep(delay)
+            retries += 1
+
+
+class AsyncBaseAPI:
+    """Base class for all asyncio API endpoint classes."""
+
+    def __init__(self, client: AsyncHelpSpotClient) -> None:
+        """Initialize the API with a client reference.
+
+        Args:
+            client: The AsyncHelpSpotClient instance.
+        """
+        self.client = client
+
+    async def _request(
+        self,
+        method: str,
+        api_method: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        require_auth: bool = False,
+    ) -> dict[str, Any]:
+        """Make an API request without blocking the event loop.
+
+        Takes the same arguments as BaseAPI._request and raises the same
+        exceptions.
+        """
+        url, request_params = build_request(self.client, api_method, params, require_auth)
+
+        if method.upper() == "GET":
+            cached = cached_response(self.client, api_method, request_params)
+            if cached is not None:
+                return cached
+            if self.client.single_flight is not None:
+                return await self.client.single_flight.do(
+                    call_key(api_method, request_params),
+                    lambda: self._send(method, api_method, url, request_params, data),
+                )
+
+        return await self._send(method, api_method, url, request_params, data)
+
+    async def _send(
+        self,
+        method: str,
+        api_method: str,
+        url: str,
+        request_params: dict[str, Any],
+        data: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Send a built request, parse the response and update the caches."""
+        is_get = method.upper() == "GET"
+        logger.debug(f"Making async {method} request to {api_method}")
+
         try:
-            result = response.json()
-        except Exception as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            raise HTTPError(f"Invalid JSON response: {e}") from e
-
-        # Check for API errors
-        if "errors" in result:
-            errors = result["errors"]
-            if isinstance(errors, dict) and "error" in errors:
-                error = errors["error"]
-                if isinstance(error, list):
-                    error = error[0]
-                error_id = error.get("id", 0)
-                description = error.get("description", "Unknown error")
-                raise APIError(error_id, description)
-
-        if "reply" in result and "not enabled" in str(result["reply"]).lower():
-            raise APIDisabledError(result["reply"])
+            response = await self._exchange(method, api_method, url, request_params, data)
+        finally:
+            # A failed write may still have been applied
+            if not is_get and self.client.response_cache is not None:
+                self.client.response_cache.invalidate_request({**request_params, **(data or {})})
 
+        result = parse_response(response, self.client.body_decoder, self.client.output_format)
+        if is_get:
+            store_response(self.client, api_method, request_params, result)
         return result
+
+    async def _stream(
+        self,
+        api_method: str,
+        path: Sequence[str],
+        params: dict[str, Any] | None = None,
+        require_auth: bool = False,
+        optional_root: bool = False,
+    ) -> AsyncGenerator[Any, None]:
+        """Make a GET request and yield the list at ``path`` one element at a time.
+
+        See BaseAPI._stream.
+        """
+        url, request_params = build_request(self.client, api_method, params, require_auth)
+        logger.debug(f"Streaming async GET request to {api_method}")
+
+        retries = 0
+        while True:
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.aacquire(api_method)
+            scanner = item_scanner(self.client, path)
+            yielded = False
+            try:
+                async with self.client._http_client.stream(
+                    "GET", url, params=request_params
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        for item in scanner.feed(chunk):
+                            yielded = True
+                            yield item
+                    body = scanner.close()
+                break
+            except httpx.HTTPError as e:
+                delay = None
+                if not yielded:
+                    delay = retry_delay(self.client.retry, retries, "GET", api_method, e)
+                if delay is None:
+                    raise map_http_error(e, retries) from e
+            except ValueError as e:
+                kind = self.client.output_format.upper()
+                raise HTTPError(f"Invalid {kind} response: {e}") from e
+            await asyncio.sleep(delay)
+            retries += 1
+
+        if body is not None:
+            result = parse_body(body, self.client.body_decoder, self.client.output_format)
+            for item in items_at(result, _unwrapped(result, path, optional_root)):
+                yield item
+
+    async def _exchange(
+        self,
+        method: str,
+        api_method: str,
+        url: str,
+        request_params: dict[str, Any],
+        data: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send the HTTP request, retrying transient failures per the client's policy.
+
+        Every attempt waits for the client's rate limiter, if any.
+        """
+        retries = 0
+        while True:
+            if self.client.rate_limiter is not None:
+                await self.client.rate_limiter.aacquire(api_method)
+            try:
+                if method.upper() == "GET":
+                    response = await self.client._http_client.get(url, params=request_params)
+                elif method.upper() == "POST":
+                    response = await self.client._http_client.post(
+                        url, params=request_params, **form_content(data, asynchronous=True)
+                    )
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                response.raise_for_status()
+                return response
+
+            except httpx.HTTPError as e:
+                delay = retry_delay(self.client.retry, retries, method, api_method, e)
+                if delay is None:
+                    raise map_http_error(e, retries) from e
+            await asyncio.sleep(delay)
+            retries += 1
@@ -2,10 +2,34 @@
 
 from __future__ import annotations
 
-from helpspot.api.base import BaseAPI
+from typing import Any
+
+from helpspot.api.base import AsyncBaseAPI, BaseAPI, copy_models
 from helpspot.models import Category
 
 
+def _parse_categories(result: dict[str, Any]) -> list[Category]:
+    """Parse a getCategories response."""
+    # Handle response format
+    # The API returns {"category": {"43": {...}, "35": {...}, ...}}
+    categories_dict = result.get("category", {})
+
+    # If empty or not a dict, try alternative format
+    if not categories_dict:
+        categories_data = result.get("categories", {}).get("category", [])
+        if isinstance(categories_data, dict):
+            categories_data = [categories_data]
+        return [Category(**cat) for cat in categories_data]
+
+    # Convert dict of categories (keyed by ID) to list
+    if isinstance(categories_dict, dict):
+        categories_list = list(categories_dict.values())
+    else:
+        categories_list = [categories_dict] if categories_dict else []
+
+    return [Category(**cat) for cat in categories_list]
+
+
 class CategoriesAPI(BaseAPI):
     """API methods for category operations."""
 
@@ -13,6 +37,8 @@ class CategoriesAPI(BaseAPI):
         """List all categories.
 
         Works for both public and private API depending on authentication.
+        Served from the client's reference cache when ``reference_cache_ttl``
+        is configured.
 
         Returns:
             List of Category objects.
@@ -20,26 +46,32 @@ class CategoriesAPI(BaseAPI):
         Raises:
             APIError: If the API returns an error.
         """
+        cached = self.client.reference_cache.get("categories")
+        if cached is not None:
+            return copy_models(cached)
+
         method = "private.request.getCategories" if self.client.auth else "request.getCategories"
         require_auth = self.client.auth is not None
 
         result = self._request("GET", method, require_auth=require_auth)
+        categories = _parse_categories(result)
+        self.client.reference_cache.set("categories", (), categories)
+        return copy_models(categories)
+
 
-        # Handle response format
-        # The API returns {"category": {"43": {...}, "35": {...}, ...}}
-        categories_dict = result.get("category", {})
+class AsyncCategoriesAPI(AsyncBaseAPI):
+    """Asyncio API methods for category operations."""
 
-        # If empty or not a dict, try alternative format
-        if not categories_dict:
-            categories_data = result.get("categories", {}).get("category", [])
-            if isinstance(categories_data, dict):
-                categories_data = [categories_data]
-            return [Category(**cat) for cat in categories_data]
+    async def list(self) -> list[Category]:
+        """List all categories. See CategoriesAPI.list."""
+        cached = self.client.reference_cache.get("categories")
+        if cached is not None:
+            return copy_models(cached)
 
-        # Convert dict of categories (keyed by ID) to list
-        if isinstance(categories_dict, dict):
-            categories_list = list(categories_dict.values())
-        else:
-            categories_list = [categories_dict] if categories_dict else []
+        method = "private.request.getCategories" if self.client.auth else "request.getCategories"
+        require_auth = self.client.auth is not None
 
-        return [Category(**cat) for cat in categories_list]
+        result = await self._request("GET", method, require_auth=require_auth)
+        categories = _parse_categories(result)
+        self.client.reference_cache.set("categories", (), categories)
+        return copy_models(categories)
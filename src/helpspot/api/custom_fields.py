@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
-from helpspot.api.base import BaseAPI
+from typing import Any
+
+from helpspot.api.base import AsyncBaseAPI, BaseAPI, copy_models
 from helpspot.models import CustomField
 
 
+def _custom_fields_params(category_id: int | None) -> dict[str, Any]:
+    """Build the query parameters for getCustomFields."""
+    params = {}
+    if category_id is not None:
+        params["xCategory"] = str(category_id)
+    return params
+
+
+def _parse_custom_fields(result: dict[str, Any]) -> list[CustomField]:
+    """Parse a getCustomFields response."""
+    # Handle response format
+    fields_data = result.get("customfields", {}).get("field", [])
+    if isinstance(fields_data, dict):
+        fields_data = [fields_data]
+
+    return [CustomField(**field) for field in fields_data]
+
+
 class CustomFieldsAPI(BaseAPI):
     """API methods for custom field operations."""
 
@@ -13,6 +33,8 @@ class CustomFieldsAPI(BaseAPI):
         """List all custom fields.
 
         Works for both public and private API depending on authentication.
+        Served from the client's reference cache when ``reference_cache_ttl``
+        is configured.
 
         Args:
             category_id: Optional category ID to filter fields (private API only).
@@ -23,9 +45,11 @@ class CustomFieldsAPI(BaseAPI):
         Raises:
             APIError: If the API returns an error.
         """
-        params = {}
-        if category_id is not None:
-            params["xCategory"] = str(category_id)
+        cached = self.client.reference_cache.get("custom_fields", (category_id,))
+        if cached is not None:
+            return copy_models(cached)
+
+        params = _custom_fields_params(category_id)
 
         method = (
             "private.request.getCustomFields" if self.client.auth else "request.getCustomFields"
@@ -33,10 +57,28 @@ class CustomFieldsAPI(BaseAPI):
         require_auth = self.client.auth is not None
 
         result = self._request("GET", method, params=params, require_auth=require_auth)
+        fields = _parse_custom_fields(result)
+        self.client.reference_cache.set("custom_fields", (category_id,), fields)
+        return copy_models(fields)
+
 
-        # Handle response format
-        fields_data = result.get("customfields", {}).get("field", [])
-        if isinstance(fields_data, dict):
-            fields_data = [fields_data]
+class AsyncCustomFieldsAPI(AsyncBaseAPI):
+    """Asyncio API methods for custom field operations."""
+
+    async def list(self, category_id: int | None = None) -> list[CustomField]:
+        """List all custom fields. See CustomFieldsAPI.list."""
+        cached = self.client.reference_cache.get("custom_fields", (category_id,))
+        if cached is not None:
+            return copy_models(cached)
+
+        params = _custom_fields_params(category_id)
+
+        method = (
+            "private.request.getCustomFields" if self.client.auth else "request.getCustomFields"
+        )
+        require_auth = self.client.auth is not None
 
-        return [CustomField(**field) for field in fields_data]
+        result = await self._request("GET", method, params=params, require_auth=require_auth)
+        fields = _parse_custom_fields(result)
+        self.client.reference_cache.set("custom_fields", (category_id,), fields)
+        return copy_models(fields)
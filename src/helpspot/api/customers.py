@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-from helpspot.api.base import BaseAPI
-from helpspot.models import Request
+from typing import Any
+
+from helpspot.api.base import AsyncBaseAPI, BaseAPI
+from helpspot.api.requests import ResultFormat, parse_request_list
+from helpspot.batch import RequestBatch
 
 
 class CustomersAPI(BaseAPI):
     """API methods for customer operations."""
 
-    def get_requests(self, email: str, password: str) -> list[Request]:
+    def get_requests(
+        self, email: str, password: str, result_format: ResultFormat = "model"
+    ) -> list[Any] | RequestBatch:
         """Get all requests for a customer (public API).
 
         Args:
             email: Customer email address.
             password: Customer portal password.
+            result_format: "model" (validated Request objects), "trusted"
+                (unvalidated Request objects), "lazy" (LazyRequest views),
+                "dict" (raw API rows) or "batch" (one columnar RequestBatch).
 
         Returns:
-            List of Request objects for the customer.
+            List of Request objects (or dicts) for the customer, or a
+            RequestBatch for result_format="batch".
 
         Raises:
             APIError: If authentication fails or API returns error.
@@ -25,10 +34,21 @@ class CustomersAPI(BaseAPI):
         params = {"sEmail": email, "sPassword": password}
 
         result = self._request("GET", "customer.getRequests", params=params)
+        return parse_request_list(
+            result, result_format=result_format, date_parser=self.client.date_parser
+        )
+
 
-        # Handle both single request and array
-        requests_data = result.get("requests", {}).get("request", [])
-        if isinstance(requests_data, dict):
-            requests_data = [requests_data]
+class AsyncCustomersAPI(AsyncBaseAPI):
+    """Asyncio API methods for customer operations."""
+
+    async def get_requests(
+        self, email: str, password: str, result_format: ResultFormat = "model"
+    ) -> list[Any] | RequestBatch:
+        """Get all requests for a customer (public API). See CustomersAPI.get_requests."""
+        params = {"sEmail": email, "sPassword": password}
 
-        return [Request(**req) for req in requests_data]
+        result = await self._request("GET", "customer.getRequests", params=params)
+        return parse_request_list(
+            result, result_format=result_format, date_parser=self.client.date_parser
+        )
@@ -2,10 +2,88 @@
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from typing import Any, cast
 
-from helpspot.api.base import BaseAPI
+from helpspot.api.base import AsyncBaseAPI, BaseAPI
+from helpspot.api.requests import (
+    ResultFormat,
+    check_row_format,
+    parse_request_list,
+    row_converter,
+)
+from helpspot.batch import RequestBatch
+from helpspot.export import ROW_GROUP_SIZE, ExportResult, export_requests
 from helpspot.models import Filter, Request
+from helpspot.pagination import aiter_pages_concurrent, iter_pages_concurrent
+
+
+def _filter_params(
+    filter_id: str, start: int = 0, length: int = 50, raw_values: bool = False
+) -> dict[str, Any]:
+    """Build the query parameters for private.filter.get."""
+    params: dict[str, Any] = {
+        "xFilter": filter_id,
+        "start": str(start),
+        "length": str(length),
+    }
+
+    if raw_values:
+        params["fRawValues"] = "1"
+
+    return params
+
+
+def _parse_filters(result: dict[str, Any]) -> list[Filter]:
+    """Parse a private.user.getFilters response."""
+    # Handle response format
+    filters_data = result.get("filters", {}).get("filter", [])
+    if isinstance(filters_data, dict):
+        filters_data = [filters_data]
+
+    return [Filter(**f) for f in filters_data]
+
+
+def _filter_count(filters: list[Filter], filter_id: str) -> int:
+    """Return the known result count for a filter, or 0 if it is unknown."""
+    for flt in filters:
+        if str(flt.x_filter) == str(filter_id):
+            return flt.count or 0
+    return 0
+
+
+def _check_fan_out(page_size: int, concurrency: int) -> None:
+    """Reject get_all() options before its lazy iterator is started."""
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+
+def _request_id(request: Request | dict[str, Any]) -> int:
+    """Return the ID of a request row in any result format."""
+    return int(request["xRequest"] if isinstance(request, dict) else request.x_request)
+
+
+def _unique_requests(requests: Iterator[Any]) -> Iterator[Any]:
+    """Drop requests already yielded (rows can shift between pages)."""
+    seen: set[int] = set()
+    for request in requests:
+        request_id = _request_id(request)
+        if request_id not in seen:
+            seen.add(request_id)
+            yield request
+
+
+async def _aunique_requests(requests: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Asyncio version of _unique_requests."""
+    seen: set[int] = set()
+    async for request in requests:
+        request_id = _request_id(request)
+        if request_id not in seen:
+            seen.add(request_id)
+            yield request
 
 
 class FiltersAPI(BaseAPI):
@@ -21,13 +99,7 @@ class FiltersAPI(BaseAPI):
             AuthenticationRequiredError: If not authenticated.
         """
         result = self._request("GET", "private.user.getFilters", require_auth=True)
-
-        # Handle response format
-        filters_data = result.get("filters", {}).get("filter", [])
-        if isinstance(filters_data, dict):
-            filters_data = [filters_data]
-
-        return [Filter(**f) for f in filters_data]
+        return _parse_filters(result)
 
     def get(
         self,
@@ -35,7 +107,8 @@ class FiltersAPI(BaseAPI):
         start: int = 0,
         length: int = 50,
         raw_values: bool = False,
-    ) -> list[Request]:
+        result_format: ResultFormat = "model",
+    ) -> list[Any] | RequestBatch:
         """Get results from a filter.
 
         Args:
@@ -43,27 +116,231 @@ class FiltersAPI(BaseAPI):
             start: Starting position for pagination.
             length: Number of results to return.
             raw_values: Return raw numeric values.
+            result_format: "model" (validated Request objects), "trusted"
+                (unvalidated Request objects), "lazy" (LazyRequest views),
+                "dict" (raw API rows) or "batch" (one columnar RequestBatch).
 
         Returns:
-            List of Request objects matching the filter.
+            List of Request objects (or dicts) matching the filter, or a
+            RequestBatch for result_format="batch".
 
         Raises:
             AuthenticationRequiredError: If not authenticated.
         """
-        params: dict[str, Any] = {
-            "xFilter": filter_id,
-            "start": str(start),
-            "length": str(length),
-        }
-
-        if raw_values:
-            params["fRawValues"] = "1"
+        params = _filter_params(filter_id, start, length, raw_values)
 
         result = self._request("GET", "private.filter.get", params=params, require_auth=True)
+        return parse_request_list(result, "filter", result_format, self.client.date_parser)
+
+    def get_all(
+        self,
+        filter_id: str,
+        count: int | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> Iterator[Any]:
+        """Iterate over every request in a filter, fetching pages concurrently.
 
-        # Handle response format
-        requests_data = result.get("filter", {}).get("request", [])
-        if isinstance(requests_data, dict):
-            requests_data = [requests_data]
+        The filter's result count (from ``count`` or, if omitted, from
+        list() when iteration starts) determines every ``start`` offset up
+        front, and up to
+        ``concurrency`` pages are fetched at once. Requests are yielded in
+        filter order with duplicates removed. Filters without a known count
+        are walked page by page.
+
+        Args:
+            filter_id: Filter ID (can be 'inbox', 'myq', or numeric ID).
+            count: Known number of results. Looked up via list() if None.
+            page_size: Number of results requested per page.
+            concurrency: Maximum number of pages in flight.
+            raw_values: Return raw numeric values.
+            result_format: "model", "trusted", "lazy" or "dict". See get().
+                For a RequestBatch, pass the "dict" rows to
+                RequestBatch.from_rows().
+
+        Returns:
+            Iterator of Request objects (or dicts) matching the filter.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If result_format is "batch", or page_size or
+                concurrency is not positive.
+
+        Example:
+            >>> for request in client.filters.get_all("12", concurrency=8):
+            ...     print(request.x_request)
+        """
+        check_row_format(result_format)
+        _check_fan_out(page_size, concurrency)
+
+        def fetch_page(offset: int, length: int) -> list[Any]:
+            page = self.get(filter_id, offset, length, raw_values, result_format)
+            return cast(list[Any], page)
+
+        def iterate() -> Iterator[Any]:
+            total = count
+            if total is None:
+                total = _filter_count(self.list(), filter_id)
+            yield from iter_pages_concurrent(fetch_page, total, 0, page_size, concurrency)
+
+        return _unique_requests(iterate())
+
+    def stream(
+        self,
+        filter_id: str,
+        start: int = 0,
+        length: int = 50,
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> Iterator[Any]:
+        """Get results from a filter, parsing them as the response arrives.
+
+        Takes the same arguments as get() but yields each request as soon as
+        it has been read from the response body, so memory is bounded by one
+        ticket rather than the page. Results are not cached.
+
+        Args:
+            filter_id: Filter ID (can be 'inbox', 'myq', or numeric ID).
+            start: Starting position for pagination.
+            length: Number of results to return.
+            raw_values: Return raw numeric values.
+            result_format: "model", "trusted", "lazy" or "dict". See get().
+
+        Yields:
+            Request objects (or dicts) matching the filter.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If result_format is "batch" or unknown.
+
+        Example:
+            >>> batch = RequestBatch.from_rows(
+            ...     client.filters.stream("12", length=5000, result_format="dict")
+            ... )
+        """
+        convert = row_converter(result_format, self.client.date_parser)
+        params = _filter_params(filter_id, start, length, raw_values)
+
+        for row in self._stream("private.filter.get", ("filter", "request"), params, True):
+            yield convert(row)
+
+    def export(
+        self,
+        filter_id: str,
+        path: str | os.PathLike[str],
+        format: str | None = None,
+        compression: str | None = None,
+        columns: Sequence[str] | None = None,
+        page_size: int = 500,
+        concurrency: int = 4,
+        row_group_size: int = ROW_GROUP_SIZE,
+        progress: Callable[[int], None] | None = None,
+    ) -> ExportResult:
+        """Write every request in a filter to a JSONL, CSV or Parquet file.
+
+        Pages are fetched with get_all() while the file is written, and rows
+        are converted and written ``row_group_size`` at a time, so memory
+        stays flat however large the filter. See helpspot.export.export_requests.
+
+        Args:
+            filter_id: Filter ID (can be 'inbox', 'myq', or numeric ID).
+            path: File to write; the format is guessed from its name.
+            format: "jsonl", "csv" or "parquet".
+            compression: "gzip", "bz2" or "xz" for JSONL/CSV; a Parquet codec.
+            columns: Request attribute names to write. Default: all.
+            page_size: Requests fetched per page.
+            concurrency: Maximum number of pages in flight.
+            row_group_size: Rows converted and written at a time.
+            progress: Called with the number of rows written so far.
+
+        Returns:
+            The file written and its row count.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If the format, compression or a column is unknown.
+
+        Example:
+            >>> client.filters.export("12", "open-bugs.csv.gz")
+        """
+        rows = self.get_all(
+            filter_id, page_size=page_size, concurrency=concurrency, result_format="dict"
+        )
+        return export_requests(
+            rows,
+            path,
+            format,
+            compression,
+            columns,
+            row_group_size,
+            progress,
+            self.client.date_parser,
+        )
+
+
+class AsyncFiltersAPI(AsyncBaseAPI):
+    """Asyncio API methods for filter operations (private API only)."""
+
+    async def list(self) -> list[Filter]:
+        """List all filters for the authenticated user. See FiltersAPI.list."""
+        result = await self._request("GET", "private.user.getFilters", require_auth=True)
+        return _parse_filters(result)
+
+    async def get(
+        self,
+        filter_id: str,
+        start: int = 0,
+        length: int = 50,
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> list[Any] | RequestBatch:
+        """Get results from a filter. See FiltersAPI.get."""
+        params = _filter_params(filter_id, start, length, raw_values)
+
+        result = await self._request("GET", "private.filter.get", params=params, require_auth=True)
+        return parse_request_list(result, "filter", result_format, self.client.date_parser)
+
+    def get_all(
+        self,
+        filter_id: str,
+        count: int | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> AsyncIterator[Any]:
+        """Iterate over every request in a filter. See FiltersAPI.get_all."""
+        check_row_format(result_format)
+        _check_fan_out(page_size, concurrency)
+
+        async def fetch_page(offset: int, length: int) -> list[Any]:
+            page = await self.get(filter_id, offset, length, raw_values, result_format)
+            return cast(list[Any], page)
+
+        async def iterate() -> AsyncIterator[Any]:
+            total = count
+            if total is None:
+                total = _filter_count(await self.list(), filter_id)
+            async for request in aiter_pages_concurrent(
+                fetch_page, total, 0, page_size, concurrency
+            ):
+                yield request
+
+        return _aunique_requests(iterate())
+
+    async def stream(
+        self,
+        filter_id: str,
+        start: int = 0,
+        length: int = 50,
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> AsyncIterator[Any]:
+        """Get results from a filter as they arrive. See FiltersAPI.stream."""
+        convert = row_converter(result_format, self.client.date_parser)
+        params = _filter_params(filter_id, start, length, raw_values)
 
-        return [Request(**req) for req in requests_data]
+        async for row in self._stream("private.filter.get", ("filter", "request"), params, True):
+            yield convert(row)
@@ -2,13 +2,376 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import aclosing, closing
+from functools import partial
+from typing import Any, Literal, cast
 
-from helpspot.api.base import BaseAPI
-from helpspot.models import Request
+from helpspot.api.base import AsyncBaseAPI, BaseAPI, items_at
+from helpspot.batch import RequestBatch
+from helpspot.bulk import BulkResult, amap_concurrent, batched, coalesce_updates, map_concurrent
+from helpspot.dates import DateParser, default_parser
+from helpspot.exceptions import ValidationError
+from helpspot.export import ROW_GROUP_SIZE, ExportResult, export_requests
+from helpspot.mirror import TicketMirror
+from helpspot.models import LazyRequest, Request, RequestHistory, RequestUpdate
+from helpspot.models.request import DATE_FIELDS
+from helpspot.pagination import aiter_pages, iter_pages
+from helpspot.uploads import FileSpec
 from helpspot.utils import prepare_custom_fields, prepare_file_uploads
 
 
+def _create_data(
+    note: str,
+    category_id: int | None = None,
+    email: str | None = None,
+    first_name: str | None = None,
+    last_name: str | None = None,
+    user_id: str | None = None,
+    phone: str | None = None,
+    title: str | None = None,
+    is_urgent: bool = False,
+    portal_id: int | None = None,
+    custom_fields: dict[int, str] | None = None,
+    files: list[FileSpec] | None = None,
+) -> dict[str, Any]:
+    """Build the form data for request.create."""
+    data: dict[str, Any] = {"tNote": note}
+
+    if category_id is not None:
+        data["xCategory"] = str(category_id)
+    if email:
+        data["sEmail"] = email
+    if first_name:
+        data["sFirstName"] = first_name
+    if last_name:
+        data["sLastName"] = last_name
+    if user_id:
+        data["sUserId"] = user_id
+    if phone:
+        data["sPhone"] = phone
+    if title:
+        data["sTitle"] = title
+    if is_urgent:
+        data["fUrgent"] = "1"
+    if portal_id is not None:
+        data["xPortal"] = str(portal_id)
+
+    # Add custom fields
+    if custom_fields:
+        data.update(prepare_custom_fields(custom_fields))
+
+    # Add file uploads
+    if files:
+        data.update(prepare_file_uploads(files))
+
+    return data
+
+
+def _get_params(
+    request_id: int | None, access_key: str | None, raw_values: bool
+) -> tuple[str, dict[str, Any], bool]:
+    """Build (api_method, params, require_auth) for request.get."""
+    params: dict[str, Any] = {}
+
+    if access_key:
+        # Public API
+        params["accesskey"] = access_key
+        return "request.get", params, False
+    if request_id is not None:
+        # Private API
+        params["xRequest"] = str(request_id)
+        if raw_values:
+            params["fRawValues"] = "1"
+        return "private.request.get", params, True
+
+    raise ValidationError("Either request_id or access_key must be provided")
+
+
+def _update_data(
+    note: str | None,
+    request_id: int | None = None,
+    access_key: str | None = None,
+    category_id: int | None = None,
+    assigned_to: int | None = None,
+    status_id: int | None = None,
+    is_open: bool | None = None,
+    is_urgent: bool | None = None,
+    title: str | None = None,
+    custom_fields: dict[int, str] | None = None,
+    files: list[FileSpec] | None = None,
+) -> tuple[str, dict[str, Any], bool]:
+    """Build (api_method, form data, require_auth) for request.update.
+
+    A note of None leaves tNote out, for updates that only change fields.
+    """
+    data: dict[str, Any] = {} if note is None else {"tNote": note}
+
+    if access_key:
+        # Public API
+        data["accesskey"] = access_key
+        method = "request.update"
+        require_auth = False
+    elif request_id is not None:
+        # Private API
+        data["xRequest"] = str(request_id)
+        method = "private.request.update"
+        require_auth = True
+    else:
+        raise ValidationError("Either request_id or access_key must be provided")
+
+    # Add optional fields
+    if category_id is not None:
+        data["xCategory"] = str(category_id)
+    if assigned_to is not None:
+        data["xPersonAssignedTo"] = str(assigned_to)
+    if status_id is not None:
+        data["xStatus"] = str(status_id)
+    if is_open is not None:
+        data["fOpen"] = "1" if is_open else "0"
+    if is_urgent is not None:
+        data["fUrgent"] = "1" if is_urgent else "0"
+    if title:
+        data["sTitle"] = title
+
+    # Add custom fields
+    if custom_fields:
+        data.update(prepare_custom_fields(custom_fields))
+
+    # Add file uploads
+    if files:
+        data.update(prepare_file_uploads(files))
+
+    return method, data, require_auth
+
+
+def _search_params(
+    query: str | None = None,
+    request_id: int | None = None,
+    user_id: str | None = None,
+    email: str | None = None,
+    status_id: int | None = None,
+    category_id: int | None = None,
+    is_open: bool | None = None,
+    assigned_to: int | None = None,
+    opened_after: int | None = None,
+    start: int = 0,
+    length: int = 50,
+    order_by: str | None = None,
+    order_dir: str = "desc",
+    raw_values: bool = False,
+) -> dict[str, Any]:
+    """Build the query parameters for private.request.search."""
+    params: dict[str, Any] = {
+        "start": str(start),
+        "length": str(length),
+        "orderByDir": order_dir,
+    }
+
+    if query:
+        params["sSearch"] = query
+    if request_id is not None:
+        params["xRequest"] = str(request_id)
+    if user_id:
+        params["sUserId"] = user_id
+    if email:
+        params["sEmail"] = email
+    if status_id is not None:
+        params["xStatus"] = str(status_id)
+    if category_id is not None:
+        params["xCategory"] = str(category_id)
+    if is_open is not None:
+        params["fOpen"] = "1" if is_open else "0"
+    if assigned_to is not None:
+        params["xPersonAssignedTo"] = str(assigned_to)
+    if opened_after is not None:
+        params["afterDate"] = str(opened_after)
+    if order_by:
+        params["orderBy"] = order_by
+    if raw_values:
+        params["fRawValues"] = "1"
+
+    return params
+
+
+def _parse_changed(result: dict[str, Any]) -> list[int]:
+    """Parse a request.getChanged response into request IDs."""
+    container = result.get("requests", result)
+    ids = container.get("xRequest") if isinstance(container, dict) else None
+    if ids is None or ids == "":
+        return []
+    return [int(i) for i in (ids if isinstance(ids, list) else [ids])]
+
+
+def _parse_created_request(result: dict[str, Any]) -> Request:
+    """Parse a request.create response."""
+    # The create endpoint returns just the xRequest ID directly, not wrapped in "request"
+    # Response format: {"xRequest": "123456"}
+    if "request" in result:
+        return Request(**result["request"])
+    else:
+        # Direct response - create minimal Request object with just the ID
+        return Request(xRequest=int(result.get("xRequest", 0)))
+
+
+def _parse_request(result: dict[str, Any], date_parser: DateParser | None = None) -> Request:
+    """Parse a request.get or request.update response."""
+    # Check if response is wrapped in "request" key or is direct
+    data = result["request"] if "request" in result else result
+    return Request.model_validate(data, context={"date_parser": date_parser})
+
+
+#: API field names of the Request date fields.
+_DATE_ALIASES: tuple[str, ...] = tuple(
+    Request.model_fields[name].alias or name for name in DATE_FIELDS
+)
+
+
+#: How list endpoints return requests: validated Request models ("model"),
+#: Request models built without validation ("trusted"), LazyRequest views
+#: validating fields on first access ("lazy"), the API's own dicts ("dict"),
+#: or one columnar RequestBatch ("batch", single-page endpoints only).
+ResultFormat = Literal["model", "trusted", "lazy", "dict", "batch"]
+
+RESULT_FORMATS: tuple[str, ...] = ("model", "trusted", "lazy", "dict", "batch")
+
+
+def check_row_format(result_format: ResultFormat) -> None:
+    """Reject result_format="batch" for iterators, which yield one request at a time.
+
+    Raises:
+        ValueError: If result_format is "batch".
+    """
+    if result_format == "batch":
+        raise ValueError(
+            "Iterators yield single requests; build a batch from all pages with "
+            'RequestBatch.from_rows(<iterator with result_format="dict">)'
+        )
+
+
+def parse_request_list(
+    result: dict[str, Any],
+    container: str = "requests",
+    result_format: ResultFormat = "model",
+    date_parser: DateParser | None = None,
+) -> list[Any] | RequestBatch:
+    """Parse a list of requests nested as ``result[container]["request"]``.
+
+    Args:
+        result: Parsed API response.
+        container: Key holding the request list ("requests" or "filter").
+        result_format: "model" validates every row into a Request. "trusted"
+            builds Requests without validation (see
+            HelpSpotBaseModel.construct_trusted; fields keep the API's raw
+            values). "lazy" wraps each row in a LazyRequest that validates
+            fields on first access. "dict" returns the rows as decoded, keyed
+            by HelpSpot field names. "batch" stores them in one RequestBatch.
+        date_parser: Parser for formatted dates (the client's). Defaults to
+            helpspot.dates.default_parser.
+
+    Returns:
+        List of Request objects, LazyRequest views for result_format="lazy",
+        dicts for result_format="dict", or a RequestBatch for
+        result_format="batch".
+
+    Raises:
+        ValueError: If result_format is unknown.
+    """
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(
+            f"Unknown result_format '{result_format}'. Use one of: {', '.join(RESULT_FORMATS)}"
+        )
+
+    requests_data = items_at(result, (container, "request"))
+    if result_format == "batch":
+        return RequestBatch.from_rows(requests_data, date_parser)
+    if result_format == "dict":
+        return requests_data
+    if result_format == "model":
+        return _validate_page(requests_data, date_parser)
+    convert = row_converter(result_format, date_parser)
+    return [convert(req) for req in requests_data]
+
+
+def _validate_page(rows: list[dict[str, Any]], date_parser: DateParser | None) -> list[Request]:
+    """Validate a page of rows, parsing each date column with one parse_many() call."""
+    parser = date_parser or default_parser
+    rows = [dict(row) for row in rows]
+    for alias in _DATE_ALIASES:
+        values = parser.parse_many((row.get(alias) for row in rows), strict=False)
+        for row, value in zip(rows, values):
+            if alias in row:
+                row[alias] = value
+    context = {"date_parser": date_parser}
+    return [Request.model_validate(row, context=context) for row in rows]
+
+
+def row_converter(
+    result_format: ResultFormat, date_parser: DateParser | None = None
+) -> Callable[[dict[str, Any]], Any]:
+    """Return the function turning one API row into the given result format.
+
+    Args:
+        result_format: See parse_request_list.
+        date_parser: Parser for formatted dates. Defaults to
+            helpspot.dates.default_parser.
+
+    Raises:
+        ValueError: If result_format is unknown or "batch".
+    """
+    check_row_format(result_format)
+    if result_format == "dict":
+        return lambda row: row
+    if result_format == "trusted":
+        return Request.construct_trusted
+    if result_format == "lazy":
+        return partial(LazyRequest, date_parser=date_parser)
+    if result_format == "model":
+        return partial(Request.model_validate, context={"date_parser": date_parser})
+    raise ValueError(
+        f"Unknown result_format '{result_format}'. Use one of: {', '.join(RESULT_FORMATS)}"
+    )
+
+
+def _client_mirror(client: Any, use: str = "search_local()") -> TicketMirror:
+    """Return the client's ticket mirror, which ``use`` needs."""
+    if client.mirror is None:
+        raise ValueError(f"{use} needs a ticket mirror: pass mirror= to the client")
+    return cast(TicketMirror, client.mirror)
+
+
+#: Where private.request.get puts a ticket's history items. The "request"
+#: wrapper may be missing, as in _parse_request.
+HISTORY_PATH = ("request", "request_history", "item")
+
+
+class _NewHistory:
+    """Picks the history items newer than the last one seen, as they stream in.
+
+    HelpSpot has no parameter to ask for part of a history, so the whole
+    ticket is requested. If the items arrive newest first, the first seen
+    item ends the new ones, and the rest of the response is not read.
+    """
+
+    def __init__(self, after: int | None) -> None:
+        self.after = after
+        self.previous: int | None = None
+
+    def check(self, item: dict[str, Any]) -> bool | None:
+        """Return True for a new item, False for a seen one, None to stop reading."""
+        if self.after is None:
+            return True
+        current = int(item["xRequestHistory"])
+        previous, self.previous = self.previous, current
+        if current > self.after:
+            return True
+        if previous is not None and previous > current:
+            return None
+        return False
+
+
 class RequestsAPI(BaseAPI):
     """API methods for managing requests."""
 
@@ -25,7 +388,7 @@ class RequestsAPI(BaseAPI):
         is_urgent: bool = False,
         portal_id: int | None = None,
         custom_fields: dict[int, str] | None = None,
-        files: list[dict[str, Any]] | None = None,
+        files: list[FileSpec] | None = None,
     ) -> Request:
         """Create a new request.
 
@@ -44,7 +407,10 @@ class RequestsAPI(BaseAPI):
             is_urgent: Mark request as urgent.
             portal_id: Portal ID.
             custom_fields: Dict mapping custom field ID to value.
-            files: List of file dicts with 'filename', 'mime_type', 'content' keys.
+            files: Attachments: paths or binary file objects (streamed from
+                disk while sending, with the filename and MIME type guessed),
+                or dicts with 'filename', 'mime_type' and one of 'content'
+                (bytes), 'path' or 'file'.
 
         Returns:
             Created Request object with xRequest and accesskey.
@@ -53,48 +419,27 @@ class RequestsAPI(BaseAPI):
             ValidationError: If required fields are missing.
             APIError: If the API returns an error.
         """
-        data: dict[str, Any] = {"tNote": note}
-
-        if category_id is not None:
-            data["xCategory"] = str(category_id)
-        if email:
-            data["sEmail"] = email
-        if first_name:
-            data["sFirstName"] = first_name
-        if last_name:
-            data["sLastName"] = last_name
-        if user_id:
-            data["sUserId"] = user_id
-        if phone:
-            data["sPhone"] = phone
-        if title:
-            data["sTitle"] = title
-        if is_urgent:
-            data["fUrgent"] = "1"
-        if portal_id is not None:
-            data["xPortal"] = str(portal_id)
-
-        # Add custom fields
-        if custom_fields:
-            data.update(prepare_custom_fields(custom_fields))
-
-        # Add file uploads
-        if files:
-            data.update(prepare_file_uploads(files))
+        data = _create_data(
+            note,
+            category_id=category_id,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            user_id=user_id,
+            phone=phone,
+            title=title,
+            is_urgent=is_urgent,
+            portal_id=portal_id,
+            custom_fields=custom_fields,
+            files=files,
+        )
 
         # Determine if using private or public API
         method = "private.request.create" if self.client.auth else "request.create"
         require_auth = self.client.auth is not None
 
         result = self._request("POST", method, data=data, require_auth=require_auth)
-
-        # The create endpoint returns just the xRequest ID directly, not wrapped in "request"
-        # Response format: {"xRequest": "123456"}
-        if "request" in result:
-            return Request(**result["request"])
-        else:
-            # Direct response - create minimal Request object with just the ID
-            return Request(xRequest=int(result.get("xRequest", 0)))
+        return _parse_created_request(result)
 
     def get(
         self,
@@ -118,33 +463,155 @@ class RequestsAPI(BaseAPI):
             ValidationError: If neither request_id nor access_key provided.
             APIError: If the API returns an error.
         """
-        params: dict[str, Any] = {}
-
-        if access_key:
-            # Public API
-            params["accesskey"] = access_key
-            method = "request.get"
-            require_auth = False
-        elif request_id is not None:
-            # Private API
-            params["xRequest"] = str(request_id)
-            if raw_values:
-                params["fRawValues"] = "1"
-            method = "private.request.get"
-            require_auth = True
-        else:
-            from helpspot.exceptions import ValidationError
-
-            raise ValidationError("Either request_id or access_key must be provided")
+        method, params, require_auth = _get_params(request_id, access_key, raw_values)
 
         result = self._request("GET", method, params=params, require_auth=require_auth)
+        return _parse_request(result, self.client.date_parser)
 
-        # Check if response is wrapped in "request" key or is direct
-        if "request" in result:
-            return Request(**result["request"])
-        else:
-            # Direct response format
-            return Request(**result)
+    def changed(self, since: int) -> list[int]:
+        """List the requests changed since a time (private API only).
+
+        Any change counts: new notes, status or category changes, and new
+        requests. Fetch the requests themselves with get_many().
+
+        Args:
+            since: Unix timestamp.
+
+        Returns:
+            IDs of the changed requests.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+        """
+        params = {"dtGMTChange": str(since)}
+        result = self._request(
+            "GET", "private.request.getChanged", params=params, require_auth=True
+        )
+        return _parse_changed(result)
+
+    def get_many(
+        self,
+        request_ids: Iterable[int],
+        concurrency: int = 8,
+        ordered: bool = True,
+        raw_values: bool = False,
+    ) -> Iterator[BulkResult[int, Request]]:
+        """Get many requests by ID concurrently (private API only).
+
+        Up to ``concurrency`` private.request.get calls run at once over the
+        client's connection pool. A failed lookup is reported in its
+        BulkResult and does not abort the batch.
+
+        Args:
+            request_ids: Request IDs to fetch. Consumed lazily.
+            concurrency: Maximum number of requests in flight.
+            ordered: Yield results in input order (True) or completion order (False).
+            raw_values: Return raw numeric values instead of text.
+
+        Yields:
+            BulkResult with the request ID as ``key`` and the Request as ``value``,
+            or the raised exception as ``error``.
+
+        Example:
+            >>> for result in client.requests.get_many([123, 124, 125], concurrency=16):
+            ...     if result.ok:
+            ...         print(result.value.title)
+            ...     else:
+            ...         print(f"#{result.key} failed: {result.error}")
+        """
+
+        def fetch(request_id: int) -> Request:
+            return self.get(request_id=request_id, raw_values=raw_values)
+
+        return map_concurrent(fetch, request_ids, concurrency, ordered)
+
+    def history(
+        self, request_id: int, new_only: bool = False, raw_values: bool = False
+    ) -> Iterator[RequestHistory]:
+        """Iterate over a request's history (private API only).
+
+        The history comes from private.request.get, streamed: items are
+        parsed and validated one at a time as the response arrives, so a
+        long history is never held in memory as a whole.
+
+        If the client has a ticket mirror (``HelpSpotClient(mirror=...)``),
+        the items are stored in it once the history has been read to the
+        end, and ``new_only=True`` yields only the items newer than the
+        newest one stored; older items are skipped without being validated.
+        Read the stored history with ``TicketMirror.history()``.
+
+        Args:
+            request_id: Request ID.
+            new_only: Only items added since the last complete read.
+            raw_values: Return raw numeric values.
+
+        Yields:
+            RequestHistory items, in API order.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If new_only is set and the client has no mirror.
+
+        Example:
+            >>> for item in client.requests.history(12345, new_only=True):
+            ...     audit(item.x_request_history, item.log)
+        """
+        after = None
+        if new_only:
+            after = _client_mirror(self.client, "new_only").last_history_id(request_id)
+        new = _NewHistory(after)
+        _, params, _ = _get_params(request_id, None, raw_values)
+        read = []
+        stream = self._stream("private.request.get", HISTORY_PATH, params, True, optional_root=True)
+        # Closing the stream early drops the connection instead of reading on
+        with closing(stream) as items:
+            for item in items:
+                keep = new.check(item)
+                if keep is None:
+                    break
+                if keep:
+                    read.append(item)
+                    yield RequestHistory.model_validate(
+                        item, context={"date_parser": self.client.date_parser}
+                    )
+        if self.client.mirror is not None:
+            self.client.mirror.store_history(request_id, read)
+
+    def history_many(
+        self,
+        request_ids: Iterable[int],
+        concurrency: int = 8,
+        ordered: bool = True,
+        new_only: bool = False,
+        raw_values: bool = False,
+    ) -> Iterator[BulkResult[int, list[RequestHistory]]]:
+        """Get the histories of many requests concurrently (private API only).
+
+        Runs history() for up to ``concurrency`` requests at once. Each
+        history is collected into a list; a failed lookup is reported in its
+        BulkResult and does not abort the batch.
+
+        Args:
+            request_ids: Request IDs. Consumed lazily.
+            concurrency: Maximum number of requests in flight.
+            ordered: Yield results in input order (True) or completion order (False).
+            new_only: Only items added since the last complete read; needs a
+                client mirror. See history().
+            raw_values: Return raw numeric values.
+
+        Yields:
+            BulkResult with the request ID as ``key`` and its history as ``value``.
+
+        Example:
+            >>> for result in client.requests.history_many(ids, new_only=True):
+            ...     if result.ok:
+            ...         audit(result.key, result.value)
+        """
+
+        def fetch(request_id: int) -> list[RequestHistory]:
+            return list(self.history(request_id, new_only, raw_values))
+
+        return map_concurrent(fetch, request_ids, concurrency, ordered)
 
     def update(
         self,
@@ -158,7 +625,7 @@ class RequestsAPI(BaseAPI):
         is_urgent: bool | None = None,
         title: str | None = None,
         custom_fields: dict[int, str] | None = None,
-        files: list[dict[str, Any]] | None = None,
+        files: list[FileSpec] | None = None,
     ) -> Request:
         """Update an existing request.
 
@@ -175,7 +642,7 @@ class RequestsAPI(BaseAPI):
             is_urgent: Mark as urgent.
             title: Update title.
             custom_fields: Custom field values.
-            files: File attachments.
+            files: Attachments, as for create().
 
         Returns:
             Updated Request object.
@@ -183,52 +650,77 @@ class RequestsAPI(BaseAPI):
         Raises:
             ValidationError: If neither request_id nor access_key provided.
         """
-        data: dict[str, Any] = {"tNote": note}
-
-        if access_key:
-            # Public API
-            data["accesskey"] = access_key
-            method = "request.update"
-            require_auth = False
-        elif request_id is not None:
-            # Private API
-            data["xRequest"] = str(request_id)
-            method = "private.request.update"
-            require_auth = True
-        else:
-            from helpspot.exceptions import ValidationError
-
-            raise ValidationError("Either request_id or access_key must be provided")
-
-        # Add optional fields
-        if category_id is not None:
-            data["xCategory"] = str(category_id)
-        if assigned_to is not None:
-            data["xPersonAssignedTo"] = str(assigned_to)
-        if status_id is not None:
-            data["xStatus"] = str(status_id)
-        if is_open is not None:
-            data["fOpen"] = "1" if is_open else "0"
-        if is_urgent is not None:
-            data["fUrgent"] = "1" if is_urgent else "0"
-        if title:
-            data["sTitle"] = title
-
-        # Add custom fields
-        if custom_fields:
-            data.update(prepare_custom_fields(custom_fields))
-
-        # Add file uploads
-        if files:
-            data.update(prepare_file_uploads(files))
+        method, data, require_auth = _update_data(
+            note,
+            request_id=request_id,
+            access_key=access_key,
+            category_id=category_id,
+            assigned_to=assigned_to,
+            status_id=status_id,
+            is_open=is_open,
+            is_urgent=is_urgent,
+            title=title,
+            custom_fields=custom_fields,
+            files=files,
+        )
 
         result = self._request("POST", method, data=data, require_auth=require_auth)
+        return _parse_request(result, self.client.date_parser)
 
-        # Check if response is wrapped or direct
-        if "request" in result:
-            return Request(**result["request"])
-        else:
-            return Request(**result)
+    def update_many(
+        self,
+        updates: Iterable[RequestUpdate | dict[str, Any]],
+        concurrency: int = 8,
+        window: int = 1000,
+    ) -> Iterator[BulkResult[int | str, Request]]:
+        """Apply a stream of updates, merging changes per request.
+
+        Updates are read in windows of ``window`` intents. Within a window,
+        intents for the same request are coalesced (see
+        helpspot.bulk.coalesce_updates) so that, for example, a status change
+        followed by a reassignment becomes one update call. Requests are then
+        updated concurrently; the calls for any one request run in order.
+
+        Args:
+            updates: RequestUpdate objects (or dicts of their fields).
+            concurrency: Maximum number of requests updated at once.
+            window: Number of intents coalesced together.
+
+        Yields:
+            One BulkResult per request, keyed by request ID (or access key),
+            holding the Request returned by its last update call.
+
+        Raises:
+            ValidationError: If an intent has neither request_id nor access_key.
+
+        Example:
+            >>> updates = [
+            ...     {"request_id": 123, "status_id": 2},
+            ...     {"request_id": 123, "assigned_to": 7, "note": "Reassigned"},
+            ... ]
+            >>> for result in client.requests.update_many(updates):
+            ...     print(result.key, result.ok)
+        """
+        intents = (
+            u if isinstance(u, RequestUpdate) else RequestUpdate.model_validate(u) for u in updates
+        )
+
+        def send(update: RequestUpdate) -> Request:
+            fields = update.model_dump(exclude_none=True, exclude={"note"})
+            method, data, require_auth = _update_data(update.note, **fields)
+            result = self._request("POST", method, data=data, require_auth=require_auth)
+            return _parse_request(result, self.client.date_parser)
+
+        for batch in batched(intents, window):
+            plans = coalesce_updates(batch)
+
+            def apply(key: int | str) -> Request:
+                *earlier, last = plans[key]
+                for update in earlier:
+                    send(update)
+                return send(last)
+
+            yield from map_concurrent(apply, plans, concurrency, ordered=False)
 
     def search(
         self,
@@ -240,12 +732,14 @@ class RequestsAPI(BaseAPI):
         category_id: int | None = None,
         is_open: bool | None = None,
         assigned_to: int | None = None,
+        opened_after: int | None = None,
         start: int = 0,
         length: int = 50,
         order_by: str | None = None,
         order_dir: str = "desc",
         raw_values: bool = False,
-    ) -> list[Request]:
+        result_format: ResultFormat = "model",
+    ) -> list[Any] | RequestBatch:
         """Search for requests (private API only).
 
         Args:
@@ -257,50 +751,613 @@ class RequestsAPI(BaseAPI):
             category_id: Filter by category.
             is_open: Filter by open/closed status.
             assigned_to: Filter by assigned staff ID.
+            opened_after: Only requests opened after this Unix timestamp.
             start: Starting position for pagination.
             length: Number of results to return.
             order_by: Field to order by.
             order_dir: Order direction ('asc' or 'desc').
             raw_values: Return raw numeric values.
+            result_format: "model" (validated Request objects), "trusted"
+                (unvalidated Request objects), "lazy" (LazyRequest views),
+                "dict" (raw API rows) or "batch" (one columnar RequestBatch).
 
         Returns:
-            List of Request objects.
+            List of Request objects (or dicts), or a RequestBatch for
+            result_format="batch".
 
         Raises:
             AuthenticationRequiredError: If not authenticated.
         """
-        params: dict[str, Any] = {
-            "start": str(start),
-            "length": str(length),
-            "orderByDir": order_dir,
-        }
-
-        if query:
-            params["sSearch"] = query
-        if request_id is not None:
-            params["xRequest"] = str(request_id)
-        if user_id:
-            params["sUserId"] = user_id
-        if email:
-            params["sEmail"] = email
-        if status_id is not None:
-            params["xStatus"] = str(status_id)
-        if category_id is not None:
-            params["xCategory"] = str(category_id)
-        if is_open is not None:
-            params["fOpen"] = "1" if is_open else "0"
-        if assigned_to is not None:
-            params["xPersonAssignedTo"] = str(assigned_to)
-        if order_by:
-            params["orderBy"] = order_by
-        if raw_values:
-            params["fRawValues"] = "1"
+        params = _search_params(
+            query=query,
+            request_id=request_id,
+            user_id=user_id,
+            email=email,
+            status_id=status_id,
+            category_id=category_id,
+            is_open=is_open,
+            assigned_to=assigned_to,
+            opened_after=opened_after,
+            start=start,
+            length=length,
+            order_by=order_by,
+            order_dir=order_dir,
+            raw_values=raw_values,
+        )
 
         result = self._request("GET", "private.request.search", params=params, require_auth=True)
+        return parse_request_list(
+            result, result_format=result_format, date_parser=self.client.date_parser
+        )
+
+    def iter_search(
+        self,
+        query: str | None = None,
+        request_id: int | None = None,
+        user_id: str | None = None,
+        email: str | None = None,
+        status_id: int | None = None,
+        category_id: int | None = None,
+        is_open: bool | None = None,
+        assigned_to: int | None = None,
+        opened_after: int | None = None,
+        order_by: str | None = None,
+        order_dir: str = "desc",
+        raw_values: bool = False,
+        start: int = 0,
+        page_size: int = 100,
+        prefetch: bool = True,
+        result_format: ResultFormat = "model",
+    ) -> Iterator[Any]:
+        """Iterate over every search result, fetching pages as needed.
+
+        Pages are requested with increasing ``start`` offsets until the server
+        returns a short page. The next page is fetched in the background while
+        the current one is consumed, so memory stays bounded by two pages.
+
+        Args:
+            query: Full text search query.
+            request_id: Filter by request ID.
+            user_id: Filter by customer user ID.
+            email: Filter by customer email.
+            status_id: Filter by status.
+            category_id: Filter by category.
+            is_open: Filter by open/closed status.
+            assigned_to: Filter by assigned staff ID.
+            opened_after: Only requests opened after this Unix timestamp.
+            order_by: Field to order by.
+            order_dir: Order direction ('asc' or 'desc').
+            raw_values: Return raw numeric values.
+            start: Offset of the first result.
+            page_size: Number of results requested per page.
+            prefetch: Fetch the next page while the current one is consumed.
+            result_format: "model", "trusted", "lazy" or "dict". See search().
+                "batch" is not supported here; pass the "dict" rows to
+                RequestBatch.from_rows() instead.
+
+        Yields:
+            Request objects (or dicts) in result order.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If result_format is "batch".
+
+        Example:
+            >>> for request in client.requests.iter_search(is_open=True):
+            ...     print(request.x_request)
+        """
+
+        check_row_format(result_format)
+
+        def fetch_page(offset: int, length: int) -> list[Any]:
+            page = self.search(
+                query=query,
+                request_id=request_id,
+                user_id=user_id,
+                email=email,
+                status_id=status_id,
+                category_id=category_id,
+                is_open=is_open,
+                assigned_to=assigned_to,
+                opened_after=opened_after,
+                start=offset,
+                length=length,
+                order_by=order_by,
+                order_dir=order_dir,
+                raw_values=raw_values,
+                result_format=result_format,
+            )
+            return cast(list[Any], page)
+
+        return iter_pages(fetch_page, start, page_size, prefetch)
+
+    def stream_search(
+        self,
+        query: str | None = None,
+        request_id: int | None = None,
+        user_id: str | None = None,
+        email: str | None = None,
+        status_id: int | None = None,
+        category_id: int | None = None,
+        is_open: bool | None = None,
+        assigned_to: int | None = None,
+        opened_after: int | None = None,
+        start: int = 0,
+        length: int = 50,
+        order_by: str | None = None,
+        order_dir: str = "desc",
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> Iterator[Any]:
+        """Search for requests, parsing results as the response arrives.
+
+        Takes the same arguments as search() but yields each request as soon
+        as it has been read from the response body, so a page of thousands
+        of tickets with full notes never sits in memory at once. Results are
+        not cached.
+
+        Args:
+            query: Full text search query.
+            request_id: Filter by request ID.
+            user_id: Filter by customer user ID.
+            email: Filter by customer email.
+            status_id: Filter by status.
+            category_id: Filter by category.
+            is_open: Filter by open/closed status.
+            assigned_to: Filter by assigned staff ID.
+            opened_after: Only requests opened after this Unix timestamp.
+            start: Starting position for pagination.
+            length: Number of results to return.
+            order_by: Field to order by.
+            order_dir: Order direction ('asc' or 'desc').
+            raw_values: Return raw numeric values.
+            result_format: "model", "trusted", "lazy" or "dict". See search().
+
+        Yields:
+            Request objects (or dicts) in result order.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If result_format is "batch" or unknown.
+
+        Example:
+            >>> for row in client.requests.stream_search(length=5000, result_format="dict"):
+            ...     writer.writerow([row["xRequest"], row["sTitle"]])
+        """
+        convert = row_converter(result_format, self.client.date_parser)
+        params = _search_params(
+            query=query,
+            request_id=request_id,
+            user_id=user_id,
+            email=email,
+            status_id=status_id,
+            category_id=category_id,
+            is_open=is_open,
+            assigned_to=assigned_to,
+            opened_after=opened_after,
+            start=start,
+            length=length,
+            order_by=order_by,
+            order_dir=order_dir,
+            raw_values=raw_values,
+        )
+
+        for row in self._stream(
+            "private.request.search", ("requests", "request"), params, require_auth=True
+        ):
+            yield convert(row)
+
+    def export(
+        self,
+        path: str | os.PathLike[str],
+        format: str | None = None,
+        compression: str | None = None,
+        columns: Sequence[str] | None = None,
+        page_size: int = 500,
+        row_group_size: int = ROW_GROUP_SIZE,
+        progress: Callable[[int], None] | None = None,
+        **search: Any,
+    ) -> ExportResult:
+        """Write every request matching a search to a JSONL, CSV or Parquet file.
+
+        Pages are fetched with iter_search() (the next one prefetched) while
+        the file is written, and rows are converted and written
+        ``row_group_size`` at a time, so memory stays flat however many
+        requests match. See helpspot.export.export_requests.
+
+        Args:
+            path: File to write; the format is guessed from its name.
+            format: "jsonl", "csv" or "parquet".
+            compression: "gzip", "bz2" or "xz" for JSONL/CSV; a Parquet codec.
+            columns: Request attribute names to write. Default: all.
+            page_size: Requests fetched per page.
+            row_group_size: Rows converted and written at a time.
+            progress: Called with the number of rows written so far.
+            **search: Search criteria, as for iter_search() (query, email,
+                status_id, category_id, is_open, opened_after, ...).
+
+        Returns:
+            The file written and its row count.
+
+        Raises:
+            AuthenticationRequiredError: If not authenticated.
+            ValueError: If the format, compression or a column is unknown.
+
+        Example:
+            >>> client.requests.export("2024.parquet", opened_after=1704067200, is_open=False)
+        """
+        rows = self.iter_search(page_size=page_size, result_format="dict", **search)
+        return export_requests(
+            rows,
+            path,
+            format,
+            compression,
+            columns,
+            row_group_size,
+            progress,
+            self.client.date_parser,
+        )
+
+    def search_local(
+        self,
+        query: str | None = None,
+        email: str | None = None,
+        status: str | None = None,
+        category: str | None = None,
+        assigned_to: str | None = None,
+        is_open: bool | None = None,
+        is_urgent: bool | None = None,
+        length: int = 50,
+    ) -> list[Request]:
+        """Search the client's local ticket mirror instead of the server.
+
+        Runs against the SQLite full-text index of the mirror passed as
+        ``HelpSpotClient(mirror=...)``, so it takes milliseconds and makes
+        no API call; results are as current as the last TicketMirror.sync().
+        Every word of ``query`` must appear in the title, note or customer
+        name, email, user ID or phone; the best matches come first.
+
+        Args:
+            query: Words to search for; a trailing ``*`` matches a prefix.
+            email: Filter by customer email.
+            status: Filter by status name (the mirror stores names, not IDs).
+            category: Filter by category name.
+            assigned_to: Filter by assigned staff name.
+            is_open: Filter by open/closed status.
+            is_urgent: Filter by urgency.
+            length: Maximum number of results.
+
+        Returns:
+            List of Request objects.
+
+        Raises:
+            ValueError: If the client has no mirror.
+
+        Example:
+            >>> client = HelpSpotClient(base_url=..., api_token=..., mirror="tickets.sqlite3")
+            >>> client.requests.search_local("printer jam*", is_open=True)
+        """
+        return _client_mirror(self.client).search(
+            query,
+            email=email,
+            status=status,
+            category=category,
+            assigned_to=assigned_to,
+            is_open=is_open,
+            is_urgent=is_urgent,
+            limit=length,
+        )
+
+
+class AsyncRequestsAPI(AsyncBaseAPI):
+    """Asyncio API methods for managing requests.
+
+    Mirrors RequestsAPI; see its methods for argument documentation.
+    """
+
+    async def create(
+        self,
+        note: str,
+        category_id: int | None = None,
+        email: str | None = None,
+        first_name: str | None = None,
+        last_name: str | None = None,
+        user_id: str | None = None,
+        phone: str | None = None,
+        title: str | None = None,
+        is_urgent: bool = False,
+        portal_id: int | None = None,
+        custom_fields: dict[int, str] | None = None,
+        files: list[FileSpec] | None = None,
+    ) -> Request:
+        """Create a new request. See RequestsAPI.create."""
+        data = _create_data(
+            note,
+            category_id=category_id,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            user_id=user_id,
+            phone=phone,
+            title=title,
+            is_urgent=is_urgent,
+            portal_id=portal_id,
+            custom_fields=custom_fields,
+            files=files,
+        )
+
+        method = "private.request.create" if self.client.auth else "request.create"
+        require_auth = self.client.auth is not None
+
+        result = await self._request("POST", method, data=data, require_auth=require_auth)
+        return _parse_created_request(result)
+
+    async def get(
+        self,
+        request_id: int | None = None,
+        access_key: str | None = None,
+        raw_values: bool = False,
+    ) -> Request:
+        """Get request details. See RequestsAPI.get."""
+        method, params, require_auth = _get_params(request_id, access_key, raw_values)
+
+        result = await self._request("GET", method, params=params, require_auth=require_auth)
+        return _parse_request(result, self.client.date_parser)
 
-        # Handle both single request and array of requests
-        requests_data = result.get("requests", {}).get("request", [])
-        if isinstance(requests_data, dict):
-            requests_data = [requests_data]
+    async def changed(self, since: int) -> list[int]:
+        """List the requests changed since a time. See RequestsAPI.changed."""
+        params = {"dtGMTChange": str(since)}
+        result = await self._request(
+            "GET", "private.request.getChanged", params=params, require_auth=True
+        )
+        return _parse_changed(result)
 
-        return [Request(**req) for req in requests_data]
+    def get_many(
+        self,
+        request_ids: Iterable[int],
+        concurrency: int = 8,
+        ordered: bool = True,
+        raw_values: bool = False,
+    ) -> AsyncIterator[BulkResult[int, Request]]:
+        """Get many requests by ID concurrently. See RequestsAPI.get_many.
+
+        Example:
+            >>> async for result in client.requests.get_many(ids, concurrency=100):
+            ...     print(result.key, result.ok)
+        """
+
+        async def fetch(request_id: int) -> Request:
+            return await self.get(request_id=request_id, raw_values=raw_values)
+
+        return amap_concurrent(fetch, request_ids, concurrency, ordered)
+
+    async def history(
+        self, request_id: int, new_only: bool = False, raw_values: bool = False
+    ) -> AsyncIterator[RequestHistory]:
+        """Iterate over a request's history. See RequestsAPI.history."""
+        after = None
+        if new_only:
+            mirror = _client_mirror(self.client, "new_only")
+            after = await asyncio.to_thread(mirror.last_history_id, request_id)
+        new = _NewHistory(after)
+        _, params, _ = _get_params(request_id, None, raw_values)
+        read = []
+        stream = self._stream("private.request.get", HISTORY_PATH, params, True, optional_root=True)
+        async with aclosing(stream) as items:
+            async for item in items:
+                keep = new.check(item)
+                if keep is None:
+                    break
+                if keep:
+                    read.append(item)
+                    yield RequestHistory.model_validate(
+                        item, context={"date_parser": self.client.date_parser}
+                    )
+        if self.client.mirror is not None:
+            await asyncio.to_thread(self.client.mirror.store_history, request_id, read)
+
+    def history_many(
+        self,
+        request_ids: Iterable[int],
+        concurrency: int = 8,
+        ordered: bool = True,
+        new_only: bool = False,
+        raw_values: bool = False,
+    ) -> AsyncIterator[BulkResult[int, list[RequestHistory]]]:
+        """Get the histories of many requests concurrently. See RequestsAPI.history_many."""
+
+        async def fetch(request_id: int) -> list[RequestHistory]:
+            return [item async for item in self.history(request_id, new_only, raw_values)]
+
+        return amap_concurrent(fetch, request_ids, concurrency, ordered)
+
+    async def update(
+        self,
+        note: str,
+        request_id: int | None = None,
+        access_key: str | None = None,
+        category_id: int | None = None,
+        assigned_to: int | None = None,
+        status_id: int | None = None,
+        is_open: bool | None = None,
+        is_urgent: bool | None = None,
+        title: str | None = None,
+        custom_fields: dict[int, str] | None = None,
+        files: list[FileSpec] | None = None,
+    ) -> Request:
+        """Update an existing request. See RequestsAPI.update."""
+        method, data, require_auth = _update_data(
+            note,
+            request_id=request_id,
+            access_key=access_key,
+            category_id=category_id,
+            assigned_to=assigned_to,
+            status_id=status_id,
+            is_open=is_open,
+            is_urgent=is_urgent,
+            title=title,
+            custom_fields=custom_fields,
+            files=files,
+        )
+
+        result = await self._request("POST", method, data=data, require_auth=require_auth)
+        return _parse_request(result, self.client.date_parser)
+
+    async def search(
+        self,
+        query: str | None = None,
+        request_id: int | None = None,
+        user_id: str | None = None,
+        email: str | None = None,
+        status_id: int | None = None,
+        category_id: int | None = None,
+        is_open: bool | None = None,
+        assigned_to: int | None = None,
+        opened_after: int | None = None,
+        start: int = 0,
+        length: int = 50,
+        order_by: str | None = None,
+        order_dir: str = "desc",
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> list[Any] | RequestBatch:
+        """Search for requests (private API only). See RequestsAPI.search."""
+        params = _search_params(
+            query=query,
+            request_id=request_id,
+            user_id=user_id,
+            email=email,
+            status_id=status_id,
+            category_id=category_id,
+            is_open=is_open,
+            assigned_to=assigned_to,
+            opened_after=opened_after,
+            start=start,
+            length=length,
+            order_by=order_by,
+            order_dir=order_dir,
+            raw_values=raw_values,
+        )
+
+        result = await self._request(
+            "GET", "private.request.search", params=params, require_auth=True
+        )
+        return parse_request_list(
+            result, result_format=result_format, date_parser=self.client.date_parser
+        )
+
+    def iter_search(
+        self,
+        query: str | None = None,
+        request_id: int | None = None,
+        user_id: str | None = None,
+        email: str | None = None,
+        status_id: int | None = None,
+        category_id: int | None = None,
+        is_open: bool | None = None,
+        assigned_to: int | None = None,
+        opened_after: int | None = None,
+        order_by: str | None = None,
+        order_dir: str = "desc",
+        raw_values: bool = False,
+        start: int = 0,
+        page_size: int = 100,
+        prefetch: bool = True,
+        result_format: ResultFormat = "model",
+    ) -> AsyncIterator[Any]:
+        """Iterate over every search result. See RequestsAPI.iter_search.
+
+        Example:
+            >>> async for request in client.requests.iter_search(is_open=True):
+            ...     print(request.x_request)
+        """
+
+        check_row_format(result_format)
+
+        async def fetch_page(offset: int, length: int) -> list[Any]:
+            page = await self.search(
+                query=query,
+                request_id=request_id,
+                user_id=user_id,
+                email=email,
+                status_id=status_id,
+                category_id=category_id,
+                is_open=is_open,
+                assigned_to=assigned_to,
+                opened_after=opened_after,
+                start=offset,
+                length=length,
+                order_by=order_by,
+                order_dir=order_dir,
+                raw_values=raw_values,
+                result_format=result_format,
+            )
+            return cast(list[Any], page)
+
+        return aiter_pages(fetch_page, start, page_size, prefetch)
+
+    async def stream_search(
+        self,
+        query: str | None = None,
+        request_id: int | None = None,
+        user_id: str | None = None,
+        email: str | None = None,
+        status_id: int | None = None,
+        category_id: int | None = None,
+        is_open: bool | None = None,
+        assigned_to: int | None = None,
+        opened_after: int | None = None,
+        start: int = 0,
+        length: int = 50,
+        order_by: str | None = None,
+        order_dir: str = "desc",
+        raw_values: bool = False,
+        result_format: ResultFormat = "model",
+    ) -> AsyncIterator[Any]:
+        """Search for requests, parsing results as they arrive. See RequestsAPI.stream_search."""
+        convert = row_converter(result_format, self.client.date_parser)
+        params = _search_params(
+            query=query,
+            request_id=request_id,
+            user_id=user_id,
+            email=email,
+            status_id=status_id,
+            category_id=category_id,
+            is_open=is_open,
+            assigned_to=assigned_to,
+            opened_after=opened_after,
+            start=start,
+            length=length,
+            order_by=order_by,
+            order_dir=order_dir,
+            raw_values=raw_values,
+        )
+
+        async for row in self._stream(
+            "private.request.search", ("requests", "request"), params, require_auth=True
+        ):
+            yield convert(row)
+
+    async def search_local(
+        self,
+        query: str | None = None,
+        email: str | None = None,
+        status: str | None = None,
+        category: str | None = None,
+        assigned_to: str | None = None,
+        is_open: bool | None = None,
+        is_urgent: bool | None = None,
+        length: int = 50,
+    ) -> list[Request]:
+        """Search the local ticket mirror in a worker thread. See RequestsAPI.search_local."""
+        return await asyncio.to_thread(
+            _client_mirror(self.client).search,
+            query,
+            email=email,
+            status=status,
+            category=category,
+            assigned_to=assigned_to,
+            is_open=is_open,
+            is_urgent=is_urgent,
+            limit=length,
+        )
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-from helpspot.api.base import BaseAPI
+from typing import Any
+
+from helpspot.api.base import AsyncBaseAPI, BaseAPI, copy_models
 from helpspot.models import StatusType
 
 
+def _parse_status_types(result: dict[str, Any]) -> list[StatusType]:
+    """Parse a private.request.getStatusTypes response."""
+    # Handle response format
+    status_data = result.get("results", {}).get("status", [])
+    if isinstance(status_data, dict):
+        status_data = [status_data]
+
+    return [StatusType(**status) for status in status_data]
+
+
 class StatusTypesAPI(BaseAPI):
     """API methods for status type operations (private API only)."""
 
     def list(self, active_only: bool = True) -> list[StatusType]:
         """List all status types.
 
+        Served from the client's reference cache when ``reference_cache_ttl``
+        is configured.
+
         Args:
             active_only: Return only active status types (default True).
 
@@ -21,15 +36,34 @@ class StatusTypesAPI(BaseAPI):
         Raises:
             AuthenticationRequiredError: If not authenticated.
         """
+        cached = self.client.reference_cache.get("status_types", (active_only,))
+        if cached is not None:
+            return copy_models(cached)
+
         params = {"fActiveOnly": "1" if active_only else "0"}
 
         result = self._request(
             "GET", "private.request.getStatusTypes", params=params, require_auth=True
         )
+        statuses = _parse_status_types(result)
+        self.client.reference_cache.set("status_types", (active_only,), statuses)
+        return copy_models(statuses)
 
-        # Handle response format
-        status_data = result.get("results", {}).get("status", [])
-        if isinstance(status_data, dict):
-            status_data = [status_data]
 
-        return [StatusType(**status) for status in status_data]
+class AsyncStatusTypesAPI(AsyncBaseAPI):
+    """Asyncio API methods for status type operations (private API only)."""
+
+    async def list(self, active_only: bool = True) -> list[StatusType]:
+        """List all status types. See StatusTypesAPI.list."""
+        cached = self.client.reference_cache.get("status_types", (active_only,))
+        if cached is not None:
+            return copy_models(cached)
+
+        params = {"fActiveOnly": "1" if active_only else "0"}
+
+        result = await self._request(
+            "GET", "private.request.getStatusTypes", params=params, require_auth=True
+        )
+        statuses = _parse_status_types(result)
+        self.client.reference_cache.set("status_types", (active_only,), statuses)
+        return copy_models(statuses)
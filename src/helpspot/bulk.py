@@ -0,0 +1,361 @@
+"""Bulk operations: running many API calls with bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Generic, TypeVar
+
+from pydantic import ValidationError as PydanticValidationError
+
+from helpspot.exceptions import ValidationError
+from helpspot.models import Request, RequestCreate, RequestUpdate
+
+if TYPE_CHECKING:
+    from helpspot.client import HelpSpotClient
+
+logger = logging.getLogger("helpspot")
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+_SENTINEL: object = object()
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[K, T]):
+    """Outcome of one call in a bulk operation.
+
+    Exactly one of ``value`` and ``error`` is set.
+    """
+
+    key: K
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+
+def _call(func: Callable[[K], T], key: K) -> BulkResult[K, T]:
+    try:
+        return BulkResult(key, value=func(key))
+    except Exception as e:
+        logger.debug(f"Bulk call for {key!r} failed: {e}")
+        return BulkResult(key, error=e)
+
+
+async def _acall(func: Callable[[K], Awaitable[T]], key: K) -> BulkResult[K, T]:
+    try:
+        return BulkResult(key, value=await func(key))
+    except Exception as e:
+        logger.debug(f"Bulk call for {key!r} failed: {e}")
+        return BulkResult(key, error=e)
+
+
+def map_concurrent(
+    func: Callable[[K], T],
+    keys: Iterable[K],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> Iterator[BulkResult[K, T]]:
+    """Call ``func`` for every key on a thread pool.
+
+    Keys are consumed lazily and at most ``concurrency`` calls are in flight.
+    A failing call is reported as a BulkResult with ``error`` set and does
+    not stop the remaining calls.
+
+    Args:
+        func: Callable invoked with each key.
+        keys: Keys to process.
+        concurrency: Maximum number of calls in flight.
+        ordered: Yield results in input order (True) or completion order (False).
+
+    Yields:
+        One BulkResult per key.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    key_iter = iter(keys)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="helpspot-bulk")
+    try:
+        if ordered:
+            window: deque[Future[BulkResult[K, T]]] = deque()
+            for key in key_iter:
+                window.append(executor.submit(_call, func, key))
+                if len(window) >= concurrency:
+                    break
+            while window:
+                result = window.popleft().result()
+                key = next(key_iter, _SENTINEL)
+                if key is not _SENTINEL:
+                    window.append(executor.submit(_call, func, key))
+                yield result
+        else:
+            pending: set[Future[BulkResult[K, T]]] = set()
+            for key in key_iter:
+                pending.add(executor.submit(_call, func, key))
+                if len(pending) >= concurrency:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = next(key_iter, _SENTINEL)
+                    if key is not _SENTINEL:
+                        pending.add(executor.submit(_call, func, key))
+                    yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def amap_concurrent(
+    func: Callable[[K], Awaitable[T]],
+    keys: Iterable[K],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[BulkResult[K, T]]:
+    """Asyncio version of map_concurrent.
+
+    Args:
+        func: Coroutine function invoked with each key.
+        keys: Keys to process.
+        concurrency: Maximum number of calls in flight.
+        ordered: Yield results in input order (True) or completion order (False).
+
+    Yields:
+        One BulkResult per key.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+
+    key_iter = iter(keys)
+    tasks: deque[asyncio.Task[BulkResult[K, T]]] = deque()
+    try:
+        for key in key_iter:
+            tasks.append(asyncio.ensure_future(_acall(func, key)))
+            if len(tasks) >= concurrency:
+                break
+
+        while tasks:
+            if ordered:
+                results = [await tasks.popleft()]
+            else:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.remove(task)
+                results = [task.result() for task in done]
+            for result in results:
+                key = next(key_iter, _SENTINEL)
+                if key is not _SENTINEL:
+                    tasks.append(asyncio.ensure_future(_acall(func, key)))
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class ImportJournal:
+    """Append-only checkpoint of imported JSONL lines.
+
+    Each successfully created request is recorded as a JSON line holding the
+    source line number and the new xRequest, so an interrupted import can be
+    resumed without creating the same tickets again.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (and load) a journal file.
+
+        Args:
+            path: Journal file path. Created on first write if missing.
+        """
+        self.path = Path(path)
+        self.completed: dict[int, int] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        self.completed[int(entry["line"])] = int(entry["xRequest"])
+                    except (ValueError, KeyError, TypeError):
+                        # A torn final line from a crash mid-write
+                        continue
+        self._file: IO[str] | None = None
+
+    def __contains__(self, line_no: object) -> bool:
+        """Whether the given source line was already imported."""
+        return line_no in self.completed
+
+    def record(self, line_no: int, request_id: int) -> None:
+        """Record a created request and flush it to disk."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps({"line": line_no, "xRequest": request_id}) + "\n")
+        self._file.flush()
+        self.completed[line_no] = request_id
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_jsonl(path: str | Path) -> Iterator[tuple[int, str]]:
+    """Stream (line number, line) pairs from a JSONL file.
+
+    Blank lines are skipped. Line numbers start at 1. Lines are returned
+    undecoded so that a malformed line can be reported on its own.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if line.strip():
+                yield line_no, line
+
+
+def parse_record(line_no: int, line: str) -> dict[str, Any]:
+    """Decode one JSONL line into a JSON object.
+
+    Raises:
+        ValidationError: If the line is not a JSON object.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValidationError(f"Line {line_no}: invalid JSON: {e}") from e
+    if not isinstance(record, dict):
+        raise ValidationError(f"Line {line_no}: expected a JSON object")
+    return record
+
+
+def import_requests(
+    client: HelpSpotClient,
+    path: str | Path,
+    concurrency: int = 8,
+    journal: ImportJournal | str | Path | None = None,
+) -> Iterator[BulkResult[int, Request]]:
+    """Create a request for every record of a JSONL file.
+
+    Each line is a JSON object whose keys are RequestsAPI.create arguments
+    (``note``, ``email``, ``category_id``, ``custom_fields``, ...). Lines are
+    read lazily and created with bounded concurrency. Lines already recorded
+    in the journal are skipped; successful creates are journaled as they
+    complete. A create that succeeds on the server but is interrupted before
+    it is journaled will be repeated on resume.
+
+    Args:
+        client: Client to create requests with.
+        path: JSONL file to import.
+        concurrency: Maximum number of creates in flight.
+        journal: Checkpoint journal, or a path to one. Defaults to
+            ``<path>.journal``.
+
+    Yields:
+        BulkResult keyed by source line number, in completion order.
+
+    Example:
+        >>> for result in import_requests(client, "tickets.jsonl", concurrency=16):
+        ...     if not result.ok:
+        ...         print(f"line {result.key}: {result.error}")
+    """
+    if not isinstance(journal, ImportJournal):
+        journal = ImportJournal(journal or f"{path}.journal")
+
+    pending = ((n, r) for n, r in read_jsonl(path) if n not in journal)
+
+    def create(item: tuple[int, str]) -> Request:
+        line_no, line = item
+        try:
+            params = RequestCreate.model_validate(parse_record(line_no, line))
+        except PydanticValidationError as e:
+            raise ValidationError(f"Line {line_no}: {e}") from e
+        return client.requests.create(**params.model_dump(exclude_none=True))
+
+    try:
+        for result in map_concurrent(create, pending, concurrency, ordered=False):
+            line_no = result.key[0]
+            if result.value is not None:
+                journal.record(line_no, result.value.x_request)
+            yield BulkResult(line_no, value=result.value, error=result.error)
+    finally:
+        journal.close()
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _update_key(update: RequestUpdate) -> int | str:
+    if update.request_id is not None:
+        return update.request_id
+    if update.access_key:
+        return update.access_key
+    raise ValidationError("Either request_id or access_key must be provided")
+
+
+def _can_merge(pending: RequestUpdate, update: RequestUpdate) -> bool:
+    # Each note becomes its own history entry, so never fold two together, even
+    # identical ones: the same text may be posted on purpose for separate events
+    return pending.note is None or update.note is None
+
+
+def _merge(pending: RequestUpdate, update: RequestUpdate) -> RequestUpdate:
+    changes = update.model_dump(exclude_none=True, exclude={"custom_fields"})
+    if pending.custom_fields or update.custom_fields:
+        changes["custom_fields"] = {**(pending.custom_fields or {}), **(update.custom_fields or {})}
+    return pending.model_copy(update=changes)
+
+
+def coalesce_updates(
+    updates: Iterable[RequestUpdate],
+) -> dict[int | str, list[RequestUpdate]]:
+    """Merge update intents per request.
+
+    Consecutive intents for the same request are folded into one update;
+    later field values win and custom fields are merged. Only field changes
+    are folded: every intent carrying a note stays a separate, ordered
+    update, so each note is added once per intent, even if two are the same.
+
+    Args:
+        updates: Update intents in the order they were issued.
+
+    Returns:
+        Mapping of request ID (or access key) to the updates to send, in order.
+
+    Raises:
+        ValidationError: If an intent has neither request_id nor access_key.
+
+    Example:
+        >>> plan = coalesce_updates([
+        ...     RequestUpdate(request_id=1, status_id=2),
+        ...     RequestUpdate(request_id=1, assigned_to=7),
+        ... ])
+        >>> len(plan[1])
+        1
+    """
+    plans: dict[int | str, list[RequestUpdate]] = {}
+    for update in updates:
+        chain = plans.setdefault(_update_key(update), [])
+        if chain and _can_merge(chain[-1], update):
+            chain[-1] = _merge(chain[-1], update)
+        else:
+            chain.append(update)
+    return plans
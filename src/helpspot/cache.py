@@ -0,0 +1,445 @@
+"""Caching for rarely-changing HelpSpot data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("helpspot")
+
+
+class TTLCache:
+    """Thread-safe in-memory cache with a time-to-live per namespace.
+
+    Entries are grouped in namespaces (one per endpoint, e.g. "categories")
+    and keyed by the call's parameters. A namespace with no TTL is not
+    cached at all.
+
+    Example:
+        >>> cache = TTLCache({"categories": 3600, "status_types": 600})
+        >>> cache.set("categories", (), ["..."])
+        >>> cache.get("categories", ())
+        ['...']
+        >>> cache.invalidate("categories")
+    """
+
+    def __init__(
+        self,
+        ttl: float | dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds to keep entries, either for every namespace or per
+                namespace. None disables caching.
+            clock: Monotonic time source (for tests).
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, namespace: str) -> float | None:
+        """Return the TTL configured for a namespace, or None if uncached."""
+        if isinstance(self.ttl, dict):
+            return self.ttl.get(namespace)
+        return self.ttl
+
+    def get(self, namespace: str, key: Hashable = ()) -> Any | None:
+        """Return a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            expires, value = entry
+            if self._clock() >= expires:
+                del self._entries[(namespace, key)]
+                return None
+        logger.debug(f"Cache hit for {namespace} {key!r}")
+        return value
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """Store a value if the namespace is cached."""
+        ttl = self.ttl_for(namespace)
+        if not ttl or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[(namespace, key)] = (self._clock() + ttl, value)
+
+    def invalidate(self, namespace: str | None = None, key: Hashable | None = None) -> None:
+        """Drop cached entries.
+
+        Args:
+            namespace: Namespace to clear. None clears everything.
+            key: Single key within the namespace to clear.
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            elif key is not None:
+                self._entries.pop((namespace, key), None)
+            else:
+                for entry_key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[entry_key]
+
+    def __len__(self) -> int:
+        """Number of stored (possibly expired) entries."""
+        return len(self._entries)
+
+
+#: Default seconds to keep each cacheable API method on disk. The filter list
+#: carries live counts, so it expires sooner than the rest.
+DISK_CACHE_TTLS: dict[str, float] = {
+    "version": 86400,
+    "request.getCategories": 3600,
+    "private.request.getCategories": 3600,
+    "request.getCustomFields": 3600,
+    "private.request.getCustomFields": 3600,
+    "private.request.getStatusTypes": 3600,
+    "private.user.getFilters": 300,
+}
+
+
+def default_cache_dir() -> Path:
+    """Return the default on-disk cache directory (``$XDG_CACHE_HOME/helpspot``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "helpspot"
+
+
+def cache_namespace(base_url: str, identity: str) -> str:
+    """Return a filesystem-safe namespace for a server and auth identity.
+
+    Args:
+        base_url: HelpSpot base URL.
+        identity: Opaque auth identity; hashed, never stored as-is.
+    """
+    return hashlib.sha256(f"{base_url}\0{identity}".encode()).hexdigest()[:16]
+
+
+class DiskCache:
+    """Persistent cache of raw API responses for rarely-changing methods.
+
+    Each entry is a JSON file named after a hash of the API method and its
+    parameters, so short-lived processes (e.g. CLI runs from cron) can reuse
+    reference data fetched by earlier runs. Only methods with a TTL in
+    ``ttl`` are cached.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding this cache's entries.
+            ttl: Seconds to keep each API method. Defaults to DISK_CACHE_TTLS.
+            clock: Wall-clock time source (for tests).
+        """
+        self.directory = Path(directory)
+        self.ttl = DISK_CACHE_TTLS if ttl is None else ttl
+        self._clock = clock
+
+    def _path(self, api_method: str, params: dict[str, Any]) -> Path:
+        key = json.dumps([api_method, sorted(params.items())], default=str)
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, api_method: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Return a cached response, or None if missing, expired or uncacheable."""
+        ttl = self.ttl.get(api_method)
+        if not ttl:
+            return None
+        try:
+            with open(self._path(api_method, params), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._clock() - entry.get("stored_at", 0) >= ttl:
+            return None
+        logger.debug(f"Disk cache hit for {api_method}")
+        result: dict[str, Any] = entry["result"]
+        return result
+
+    def set(self, api_method: str, params: dict[str, Any], result: dict[str, Any]) -> None:
+        """Store a response if the API method is cacheable.
+
+        Write failures are logged and otherwise ignored.
+        """
+        if not self.ttl.get(api_method):
+            return
+        entry = {
+            "method": api_method,
+            "params": params,
+            "stored_at": self._clock(),
+            "result": result,
+        }
+        path = self._path(api_method, params)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write disk cache entry for {api_method}: {e}")
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Describe stored entries.
+
+        Returns:
+            Dicts with "method", "params", "age" (seconds) and "expired" keys.
+        """
+        now = self._clock()
+        entries = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            age = now - entry.get("stored_at", 0)
+            ttl = self.ttl.get(entry.get("method", ""), 0)
+            entries.append(
+                {
+                    "method": entry.get("method"),
+                    "params": entry.get("params", {}),
+                    "age": age,
+                    "expired": age >= ttl,
+                }
+            )
+        return entries
+
+    def clear(self) -> int:
+        """Delete every entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+#: Default seconds to keep each read-only API method in a ResponseCache.
+RESPONSE_CACHE_TTLS: dict[str, float] = {
+    "request.get": 30,
+    "private.request.get": 30,
+    "private.request.search": 30,
+    "private.filter.get": 30,
+    "customer.getRequests": 30,
+    "private.user.getFilters": 60,
+    "request.getCategories": 3600,
+    "private.request.getCategories": 3600,
+    "request.getCustomFields": 3600,
+    "private.request.getCustomFields": 3600,
+    "private.request.getStatusTypes": 3600,
+}
+
+#: Methods returning many requests (or counts of them); any write may change
+#: their results, so they are dropped whenever a request is created or updated.
+LISTING_METHODS: frozenset[str] = frozenset(
+    {
+        "private.request.search",
+        "private.filter.get",
+        "customer.getRequests",
+        "private.user.getFilters",
+    }
+)
+
+_cache_control: ContextVar[tuple[float | None, bool]] = ContextVar(
+    "helpspot_cache_control", default=(None, False)
+)
+
+
+@contextmanager
+def cache_control(max_age: float | None = None, no_cache: bool = False) -> Iterator[None]:
+    """Override response cache freshness for calls made inside the block.
+
+    Args:
+        max_age: Accept cached responses at most this many seconds old,
+            instead of the method's TTL.
+        no_cache: Skip cached responses (fresh ones are still stored).
+
+    Example:
+        >>> with cache_control(no_cache=True):
+        ...     request = client.requests.get(12345)
+    """
+    token = _cache_control.set((max_age, no_cache))
+    try:
+        yield
+    finally:
+        _cache_control.reset(token)
+
+
+def current_cache_control() -> tuple[float | None, bool]:
+    """Return the (max_age, no_cache) set by the innermost cache_control block."""
+    return _cache_control.get()
+
+
+#: Identity of an API call: the method and its sorted, stringified parameters.
+CallKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def call_key(api_method: str, params: dict[str, Any]) -> CallKey:
+    """Return the key identifying identical API calls (for caching and coalescing)."""
+    return api_method, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+def _request_key(params: dict[str, Any]) -> str | None:
+    """Identify the request a call reads or writes (xRequest or access key)."""
+    if params.get("xRequest"):
+        return str(params["xRequest"])
+    if params.get("accesskey"):
+        return f"accesskey:{params['accesskey']}"
+    return None
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of parsed responses for read-only API methods.
+
+    Entries expire after the TTL of their API method and the least recently
+    used ones are evicted once either ``max_entries`` or ``max_bytes`` (the
+    summed size of the stored encodings) is exceeded. Writes to a request
+    drop every entry read for it, as well as all listing results.
+
+    Responses are stored JSON-encoded and decoded again on every hit, so each
+    caller gets its own copy and may modify it without affecting later hits.
+
+    Example:
+        >>> client = HelpSpotClient(
+        ...     base_url="https://support.example.com",
+        ...     api_token="...",
+        ...     response_cache=ResponseCache(max_bytes=32 * 1024 * 1024),
+        ... )
+    """
+
+    def __init__(
+        self,
+        ttl: float | dict[str, float] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds to keep responses, either for every read-only method
+                or per API method. Defaults to RESPONSE_CACHE_TTLS.
+            max_entries: Maximum number of cached responses.
+            max_bytes: Maximum summed size of cached responses, as stored.
+            clock: Monotonic time source (for tests).
+        """
+        self.ttl = RESPONSE_CACHE_TTLS if ttl is None else ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._clock = clock
+        # key -> (stored_at, size, request key, encoded result)
+        self._entries: OrderedDict[CallKey, tuple[float, int, str | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, api_method: str) -> float | None:
+        """Return the TTL for an API method, or None if it is not cached."""
+        if isinstance(self.ttl, dict):
+            return self.ttl.get(api_method)
+        return self.ttl if api_method in RESPONSE_CACHE_TTLS else None
+
+    def get(
+        self, api_method: str, params: dict[str, Any], max_age: float | None = None
+    ) -> Any | None:
+        """Return a cached response, or None if missing or stale.
+
+        Args:
+            api_method: HelpSpot API method name.
+            params: Full query parameters of the call.
+            max_age: Maximum acceptable age in seconds, overriding the TTL.
+        """
+        limit = self.ttl_for(api_method) if max_age is None else max_age
+        if limit is None:
+            return None
+        key = call_key(api_method, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, size, _, encoded = entry
+            if self._clock() - stored_at >= limit:
+                if max_age is None:
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+        logger.debug(f"Response cache hit for {api_method}")
+        return json.loads(encoded)
+
+    def set(self, api_method: str, params: dict[str, Any], result: Any) -> None:
+        """Store a response if its API method is cacheable.
+
+        Args:
+            api_method: HelpSpot API method name.
+            params: Full query parameters of the call.
+            result: Parsed response (JSON-serializable).
+        """
+        ttl = self.ttl_for(api_method)
+        if not ttl or ttl <= 0:
+            return
+        encoded = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode()
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+        key = call_key(api_method, params)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock(), size, _request_key(params), encoded)
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: CallKey) -> None:
+        self.nbytes -= self._entries.pop(key)[1]
+
+    def invalidate_request(self, params: dict[str, Any]) -> None:
+        """Drop entries affected by a write.
+
+        Args:
+            params: Parameters (or form data) of the write call. Entries for
+                the same xRequest/access key and all listings are dropped.
+        """
+        request_key = _request_key(params)
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] in LISTING_METHODS or (request_key and entry[2] == request_key)
+            ]
+            for key in stale:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        """Number of stored (possibly expired) entries."""
+        return len(self._entries)
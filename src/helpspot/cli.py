@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import os
 import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import click
 from rich.console import Console
@@ -13,7 +16,15 @@ from rich.panel import Panel
 from rich import box
 
 from helpspot import HelpSpotClient
+from helpspot.batch import RequestBatch
+from helpspot.bulk import ImportJournal, import_requests, parse_record, read_jsonl
+from helpspot.cache import DiskCache, cache_namespace, default_cache_dir
 from helpspot.exceptions import APIError, HTTPError, AuthenticationRequiredError
+from helpspot.export import EXPORT_FORMATS, ROW_GROUP_SIZE
+from helpspot.mirror import TicketMirror, default_mirror_path
+from helpspot.models import RequestUpdate
+from helpspot.ratelimit import RateLimiter
+from helpspot.retry import RetryPolicy
 
 console = Console()
 
@@ -24,8 +35,13 @@ def get_client(
     password: str | None,
     api_token: str | None,
     verify_ssl: bool,
+    cache_dir: Path | None = None,
+    retries: int = 3,
+    rate_limiter: RateLimiter | None = None,
+    mirror: Path | None = None,
 ) -> HelpSpotClient:
     """Create and return a HelpSpot client."""
+    retry = RetryPolicy(max_retries=retries) if retries > 0 else None
     try:
         if api_token:
             client = HelpSpotClient(
@@ -33,6 +49,10 @@ def get_client(
                 api_token=api_token,
                 verify_ssl=verify_ssl,
                 timeout=60.0,
+                cache_dir=cache_dir,
+                retry=retry,
+                rate_limit=rate_limiter,
+                mirror=mirror,
             )
         elif username and password:
             client = HelpSpotClient(
@@ -41,12 +61,20 @@ def get_client(
                 password=password,
                 verify_ssl=verify_ssl,
                 timeout=60.0,
+                cache_dir=cache_dir,
+                retry=retry,
+                rate_limit=rate_limiter,
+                mirror=mirror,
             )
         else:
             client = HelpSpotClient(
                 base_url=base_url,
                 verify_ssl=verify_ssl,
                 timeout=60.0,
+                cache_dir=cache_dir,
+                retry=retry,
+                rate_limit=rate_limiter,
+                mirror=mirror,
             )
         return client
     except Exception as e:
@@ -54,6 +82,40 @@ def get_client(
         sys.exit(1)
 
 
+def mirror_path(ctx: click.Context, db_path: Path | None) -> Path:
+    """Return the mirror file given with --db, or the default one for the server."""
+    if db_path is not None:
+        return db_path
+    return default_mirror_path(
+        ctx.obj["base_url"],
+        ctx.obj["api_token"] or ctx.obj["username"] or "",
+        ctx.obj["cache_root"],
+    )
+
+
+def local_name(mirror: TicketMirror, column: str, value: str | None) -> str | None:
+    """Match a --local status or category against the names stored in the mirror.
+
+    Names are matched case-insensitively, so no server lookup is needed.
+
+    Raises:
+        ValueError: If the mirror has no such name (IDs are not stored), listing
+            the names it has.
+    """
+    if value is None:
+        return None
+    names = mirror.names(column)
+    for name in names:
+        if name.casefold() == value.casefold():
+            return name
+    raise ValueError(
+        f"No {column} named '{value}' in the mirror; known: {', '.join(names) or 'none'}"
+    )
+
+
+MIRROR_HELP = "Mirror database (env: HELPSPOT_MIRROR, default: <cache-dir>/mirror/<server>.sqlite3)"
+
+
 @click.group()
 @click.option(
     "--base-url", envvar="HELPSPOT_URL", required=True, help="HelpSpot base URL (env: HELPSPOT_URL)"
@@ -76,8 +138,46 @@ def get_client(
 @click.option(
     "--no-verify-ssl", is_flag=True, default=False, help="Disable SSL certificate verification"
 )
+@click.option(
+    "--cache/--no-cache",
+    envvar="HELPSPOT_CACHE",
+    default=False,
+    help="Cache reference data on disk between runs (env: HELPSPOT_CACHE)",
+)
+@click.option(
+    "--cache-dir",
+    envvar="HELPSPOT_CACHE_DIR",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="On-disk cache directory (env: HELPSPOT_CACHE_DIR, default: ~/.cache/helpspot)",
+)
+@click.option(
+    "--retries",
+    envvar="HELPSPOT_RETRIES",
+    type=click.IntRange(min=0),
+    default=3,
+    show_default=True,
+    help="Retries for transient failures of read calls (env: HELPSPOT_RETRIES)",
+)
+@click.option(
+    "--rate-limit",
+    envvar="HELPSPOT_RATE_LIMIT",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum API calls per second, shared by all helpspot processes on this host "
+    "using the same server and credentials (env: HELPSPOT_RATE_LIMIT)",
+)
 @click.pass_context
-def cli(ctx, base_url, username, password, api_token, no_verify_ssl):
+def cli(
+    ctx,
+    base_url,
+    username,
+    password,
+    api_token,
+    no_verify_ssl,
+    cache,
+    cache_dir,
+    retries,
+    rate_limit,
+):
     """HelpSpot CLI - Manage tickets, categories, and more."""
     ctx.ensure_object(dict)
     ctx.obj["base_url"] = base_url
@@ -85,6 +185,18 @@ def cli(ctx, base_url, username, password, api_token, no_verify_ssl):
     ctx.obj["password"] = password
     ctx.obj["api_token"] = api_token
     ctx.obj["verify_ssl"] = not no_verify_ssl
+    ctx.obj["cache_dir"] = (cache_dir or default_cache_dir()) if cache else None
+    ctx.obj["cache_root"] = cache_dir or default_cache_dir()
+    ctx.obj["retries"] = retries
+    ctx.obj["rate_limiter"] = None
+    if rate_limit:
+        limiter = RateLimiter(
+            rate_limit,
+            shared_path=ctx.obj["cache_root"] / "ratelimit.sqlite3",
+            name=cache_namespace(base_url, api_token or username or ""),
+        )
+        ctx.call_on_close(limiter.close)
+        ctx.obj["rate_limiter"] = limiter
 
 
 @cli.command()
@@ -97,6 +209,9 @@ def version(ctx):
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -138,6 +253,9 @@ def create_ticket(ctx, note, email, first_name, last_name, title, category_id, u
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -170,6 +288,77 @@ def create_ticket(ctx, note, email, first_name, last_name, title, category_id, u
         client.close()
 
 
+@tickets.command("import")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--concurrency", "-j", type=int, default=8, help="Creates in flight at once (default: 8)"
+)
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Checkpoint file used to resume (default: FILE.journal)",
+)
+@click.pass_context
+def import_tickets(ctx, file, concurrency, journal):
+    """Create tickets from a JSONL file, one ticket per line.
+
+    Each line is a JSON object with create fields such as note, email,
+    category_id, title and custom_fields. Re-running the command after an
+    interruption skips lines already recorded in the journal.
+    """
+    client = get_client(
+        ctx.obj["base_url"],
+        ctx.obj["username"],
+        ctx.obj["password"],
+        ctx.obj["api_token"],
+        ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+    )
+
+    journal = ImportJournal(journal or f"{file}.journal")
+    skipped = len(journal.completed)
+    if skipped:
+        console.print(f"[yellow]Resuming: {skipped} lines already imported.[/yellow]")
+
+    created = 0
+    failed = 0
+    failures = []
+    started = time.monotonic()
+    try:
+        with console.status("[bold green]Importing tickets...") as status:
+            for result in import_requests(client, file, concurrency, journal):
+                if result.ok:
+                    created += 1
+                else:
+                    failed += 1
+                    if len(failures) < 20:
+                        failures.append(result)
+                elapsed = time.monotonic() - started
+                rate = (created + failed) / elapsed if elapsed else 0.0
+                status.update(
+                    f"[bold green]Importing tickets...[/bold green] "
+                    f"{created} created, {failed} failed ({rate:.1f} rows/s)"
+                )
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted. Re-run the command to resume.[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+    finally:
+        client.close()
+
+    elapsed = time.monotonic() - started
+    console.print(
+        f"[green]Created {created} tickets[/green] in {elapsed:.1f}s "
+        f"({created / elapsed if elapsed else 0.0:.1f} tickets/s)"
+    )
+    if failed:
+        console.print(f"[red]{failed} lines failed (re-run to retry them):[/red]")
+        for result in failures:
+            console.print(f"  line {result.key}: {result.error}")
+
+
 @tickets.command("get")
 @click.argument("ticket_id", type=int)
 @click.option("--raw", is_flag=True, help="Show raw field values (IDs instead of names)")
@@ -182,6 +371,9 @@ def get_ticket(ctx, ticket_id, raw):
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -202,6 +394,9 @@ def get_ticket(ctx, ticket_id, raw):
         table.add_row("Assigned To", ticket.person_assigned_to or "N/A")
         table.add_row("Urgent", "Yes" if ticket.is_urgent else "No")
         table.add_row("Open", "Yes" if ticket.is_open else "No")
+        for label, moment in (("Opened", ticket.opened_at), ("Closed", ticket.closed_at)):
+            if moment:
+                table.add_row(label, f"{moment:%Y-%m-%d %H:%M} UTC")
 
         console.print(table)
 
@@ -221,40 +416,189 @@ def get_ticket(ctx, ticket_id, raw):
         client.close()
 
 
+@tickets.command("update")
+@click.argument("ticket_id", type=int, required=False)
+@click.option("--note", "-n", default="", help="Note to add to the ticket")
+@click.option("--status", "-s", type=int, help="New status ID")
+@click.option("--category", "-c", type=int, help="New category ID")
+@click.option("--assign", "-a", type=int, help="Staff ID to assign to")
+@click.option("--title", "-t", help="New title")
+@click.option("--open/--close", "is_open", default=None, help="Reopen or close the ticket")
+@click.option("--urgent/--not-urgent", "is_urgent", default=None, help="Set urgency")
+@click.option(
+    "--from",
+    "from_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSONL file of updates to apply in bulk",
+)
+@click.option(
+    "--concurrency", "-j", type=int, default=8, help="Bulk updates in flight (default: 8)"
+)
+@click.pass_context
+def update_ticket(
+    ctx,
+    ticket_id,
+    note,
+    status,
+    category,
+    assign,
+    title,
+    is_open,
+    is_urgent,
+    from_file,
+    concurrency,
+):
+    """Update a ticket, or apply many updates with --from FILE.
+
+    In bulk mode each line is a JSON object with update fields such as
+    request_id, note, status_id, assigned_to, category_id, is_open and
+    custom_fields. Updates for the same ticket are merged into as few API
+    calls as possible.
+    """
+    if from_file is None and ticket_id is None:
+        raise click.UsageError("Provide TICKET_ID or --from FILE.")
+
+    client = get_client(
+        ctx.obj["base_url"],
+        ctx.obj["username"],
+        ctx.obj["password"],
+        ctx.obj["api_token"],
+        ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+    )
+
+    try:
+        if from_file is None:
+            with console.status(f"[bold green]Updating ticket #{ticket_id}..."):
+                ticket = client.requests.update(
+                    note=note,
+                    request_id=ticket_id,
+                    category_id=category,
+                    assigned_to=assign,
+                    status_id=status,
+                    is_open=is_open,
+                    is_urgent=is_urgent,
+                    title=title,
+                )
+            console.print(f"[green]Updated ticket #{ticket.x_request}[/green]")
+            return
+
+        valid = 0
+        invalid = []
+
+        def intents():
+            nonlocal valid
+            for line_no, line in read_jsonl(from_file):
+                try:
+                    update = RequestUpdate.model_validate(parse_record(line_no, line))
+                except Exception as e:
+                    invalid.append((line_no, e))
+                    continue
+                valid += 1
+                yield update
+
+        updated = 0
+        failures = []
+        with console.status("[bold green]Applying updates..."):
+            for result in client.requests.update_many(intents(), concurrency=concurrency):
+                if result.ok:
+                    updated += 1
+                else:
+                    failures.append(result)
+
+        console.print(
+            f"[green]Applied {valid} updates to {updated} tickets[/green]"
+            + (f", [red]{len(failures)} tickets failed[/red]" if failures else "")
+        )
+        for line_no, error in invalid[:20]:
+            console.print(f"[red]  line {line_no}: {error}[/red]")
+        for result in failures[:20]:
+            console.print(f"[red]  ticket {result.key}: {result.error}[/red]")
+    except APIError as e:
+        console.print(f"[red]API Error {e.error_id}: {e.description}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+    finally:
+        client.close()
+
+
 @tickets.command("search")
 @click.option("--query", "-q", help="Search query")
 @click.option("--email", "-e", help="Customer email")
-@click.option("--status", "-s", type=int, help="Status ID")
-@click.option("--category", "-c", type=int, help="Category ID")
+@click.option("--status", "-s", help="Status ID (with --local, the status name)")
+@click.option("--category", "-c", help="Category ID (with --local, the category name)")
 @click.option("--open-only", is_flag=True, help="Show only open tickets")
 @click.option("--limit", "-l", type=int, default=25, help="Number of results (default: 25)")
+@click.option("--local", is_flag=True, help="Search the local mirror (see 'helpspot sync') instead")
+@click.option(
+    "--db",
+    "db_path",
+    envvar="HELPSPOT_MIRROR",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help=MIRROR_HELP,
+)
 @click.pass_context
-def search_tickets(ctx, query, email, status, category, open_only, limit):
+def search_tickets(ctx, query, email, status, category, open_only, limit, local, db_path):
     """Search for tickets."""
+    if local:
+        db_path = mirror_path(ctx, db_path)
+        if not db_path.exists():
+            console.print(f"[red]No ticket mirror at {db_path}. Run 'helpspot sync' first.[/red]")
+            return
+    else:
+        for option, value in (("--status", status), ("--category", category)):
+            if value is not None and not value.isdigit():
+                raise click.BadParameter("expected an ID; names need --local", param_hint=option)
     client = get_client(
         ctx.obj["base_url"],
         ctx.obj["username"],
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+        mirror=db_path if local else None,
     )
 
     try:
-        with console.status("[bold green]Searching tickets..."):
-            results = client.requests.search(
-                query=query,
+        results: list[Any] | RequestBatch
+        if local:
+            # The mirror stores names, not IDs; match them without asking the server
+            assert client.mirror is not None
+            status_name = local_name(client.mirror, "status", status)
+            category_name = local_name(client.mirror, "category", category)
+            started = time.perf_counter()
+            results = client.requests.search_local(
+                query,
                 email=email,
-                status_id=status,
-                category_id=category,
-                is_open=open_only if open_only else None,
+                status=status_name,
+                category=category_name,
+                is_open=True if open_only else None,
                 length=limit,
             )
+            elapsed = (time.perf_counter() - started) * 1000
+        else:
+            with console.status("[bold green]Searching tickets..."):
+                results = client.requests.search(
+                    query=query,
+                    email=email,
+                    status_id=None if status is None else int(status),
+                    category_id=None if category is None else int(category),
+                    is_open=open_only if open_only else None,
+                    length=limit,
+                )
 
         if not results:
             console.print("[yellow]No tickets found.[/yellow]")
             return
 
-        table = Table(title=f"Search Results ({len(results)} tickets)", box=box.ROUNDED)
+        title = f"Search Results ({len(results)} tickets)"
+        if local:
+            title += f" - local mirror, {elapsed:.0f} ms"
+        table = Table(title=title, box=box.ROUNDED)
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Title", style="white")
         table.add_column("Customer", style="green")
@@ -281,6 +625,178 @@ def search_tickets(ctx, query, email, status, category, open_only, limit):
         client.close()
 
 
+@cli.command()
+@click.option(
+    "--db",
+    "db_path",
+    envvar="HELPSPOT_MIRROR",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help=MIRROR_HELP,
+)
+@click.option("--full", is_flag=True, help="Re-read every ticket instead of only changed ones")
+@click.option("--filter", "filter_id", help="Mirror the tickets of this filter")
+@click.option(
+    "--ticket",
+    "ticket_ids",
+    type=int,
+    multiple=True,
+    help="Re-fetch only this ticket (repeatable)",
+)
+@click.option("--page-size", type=click.IntRange(min=1), default=500, show_default=True)
+@click.pass_context
+def sync(ctx, db_path, full, filter_id, ticket_ids, page_size):
+    """Update the local SQLite mirror of tickets."""
+    client = get_client(
+        ctx.obj["base_url"],
+        ctx.obj["username"],
+        ctx.obj["password"],
+        ctx.obj["api_token"],
+        ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+    )
+    db_path = mirror_path(ctx, db_path)
+
+    try:
+        with TicketMirror(db_path) as mirror:
+            with console.status("[bold green]Syncing tickets..."):
+                if ticket_ids:
+                    result = mirror.refresh(client, ticket_ids)
+                else:
+                    result = mirror.sync(
+                        client, full=full, filter_id=filter_id, page_size=page_size
+                    )
+            total = len(mirror)
+
+        console.print(
+            f"[green]{'Full' if result.full else 'Incremental'} sync: "
+            f"{result.fetched} fetched, {result.created} new, {result.updated} updated "
+            f"in {result.seconds:.1f}s[/green]"
+        )
+        console.print(f"Mirror: {db_path} ({total} tickets)")
+        if result.high_water_id is not None:
+            console.print(f"High-water mark: request {result.high_water_id}")
+    except AuthenticationRequiredError:
+        console.print("[red]Authentication required for sync. Please provide credentials.[/red]")
+    except APIError as e:
+        console.print(f"[red]API Error {e.error_id}: {e.description}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+    finally:
+        client.close()
+
+
+@cli.command("export")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option("--filter", "filter_id", help="Export the tickets of this filter")
+@click.option("--query", "-q", help="Search query")
+@click.option("--email", "-e", help="Customer email")
+@click.option("--status", "-s", type=int, help="Status ID")
+@click.option("--category", "-c", type=int, help="Category ID")
+@click.option("--open-only", is_flag=True, help="Export only open tickets")
+@click.option(
+    "--opened-after", type=click.DateTime(), help="Only tickets opened after this time (UTC)"
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(EXPORT_FORMATS),
+    help="Output format (default: from the file name)",
+)
+@click.option(
+    "--compression",
+    help="gzip, bz2 or xz for JSONL/CSV (default: from the file name); "
+    "a codec such as zstd for Parquet (default: snappy)",
+)
+@click.option("--columns", help="Comma-separated fields to export (default: all)")
+@click.option("--page-size", type=click.IntRange(min=1), default=500, show_default=True)
+@click.option(
+    "--row-group-size",
+    type=click.IntRange(min=1),
+    default=ROW_GROUP_SIZE,
+    show_default=True,
+    help="Rows converted and written at a time (Parquet row group size)",
+)
+@click.pass_context
+def export_tickets(
+    ctx,
+    output,
+    filter_id,
+    query,
+    email,
+    status,
+    category,
+    open_only,
+    opened_after,
+    export_format,
+    compression,
+    columns,
+    page_size,
+    row_group_size,
+):
+    """Export a filter or search results to a JSONL, CSV or Parquet file.
+
+    Tickets are written as pages arrive, so memory stays flat however many
+    are exported. Without --filter or search options, every ticket is exported.
+    """
+    client = get_client(
+        ctx.obj["base_url"],
+        ctx.obj["username"],
+        ctx.obj["password"],
+        ctx.obj["api_token"],
+        ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+    )
+    options = {
+        "format": export_format,
+        "compression": compression,
+        "columns": [c.strip() for c in columns.split(",")] if columns else None,
+        "page_size": page_size,
+        "row_group_size": row_group_size,
+    }
+
+    try:
+        started = time.perf_counter()
+        with console.status("[bold green]Exporting tickets...") as status_line:
+            options["progress"] = lambda n: status_line.update(
+                f"[bold green]Exporting tickets... {n:,} written"
+            )
+            if filter_id:
+                result = client.filters.export(filter_id, output, **options)
+            else:
+                result = client.requests.export(
+                    output,
+                    query=query,
+                    email=email,
+                    status_id=status,
+                    category_id=category,
+                    is_open=True if open_only else None,
+                    opened_after=_timestamp(opened_after),
+                    **options,
+                )
+        console.print(
+            f"[green]Exported {result.rows:,} tickets to {result.path} "
+            f"({result.format}, {result.size / 1024 / 1024:.1f} MB) "
+            f"in {time.perf_counter() - started:.1f}s[/green]"
+        )
+    except AuthenticationRequiredError:
+        console.print("[red]Authentication required for export. Please provide credentials.[/red]")
+    except APIError as e:
+        console.print(f"[red]API Error {e.error_id}: {e.description}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+    finally:
+        client.close()
+
+
+def _timestamp(value: datetime | None) -> int | None:
+    """Return a naive datetime from the command line, taken as UTC, as a Unix timestamp."""
+    return None if value is None else int(value.replace(tzinfo=UTC).timestamp())
+
+
 @cli.group()
 def categories():
     """Manage categories."""
@@ -298,6 +814,9 @@ def list_categories(ctx, active_only):
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -344,6 +863,9 @@ def list_filters(ctx):
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -385,6 +907,9 @@ def get_filter(ctx, filter_id, limit):
         ctx.obj["password"],
         ctx.obj["api_token"],
         ctx.obj["verify_ssl"],
+        ctx.obj["cache_dir"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
     )
 
     try:
@@ -418,6 +943,114 @@ def get_filter(ctx, filter_id, limit):
         client.close()
 
 
+@cli.group()
+def cache():
+    """Manage the on-disk reference data cache."""
+    pass
+
+
+def _cache_client(ctx) -> HelpSpotClient:
+    """Create a client whose disk cache is enabled regardless of --cache."""
+    return get_client(
+        ctx.obj["base_url"],
+        ctx.obj["username"],
+        ctx.obj["password"],
+        ctx.obj["api_token"],
+        ctx.obj["verify_ssl"],
+        ctx.obj["cache_root"],
+        ctx.obj["retries"],
+        ctx.obj["rate_limiter"],
+    )
+
+
+def _disk_cache(client: HelpSpotClient) -> DiskCache | None:
+    """Return the client's disk cache, or print that it is disabled."""
+    if client.disk_cache is None:
+        console.print("[yellow]Disk cache disabled: no cache directory is set.[/yellow]")
+    return client.disk_cache
+
+
+@cache.command("show")
+@click.pass_context
+def show_cache(ctx):
+    """Show cached entries for the current server and credentials."""
+    client = _cache_client(ctx)
+
+    try:
+        disk_cache = _disk_cache(client)
+        if disk_cache is None:
+            return
+        entries = disk_cache.entries()
+        if not entries:
+            console.print(f"[yellow]Cache is empty ({disk_cache.directory}).[/yellow]")
+            return
+
+        table = Table(title=f"Cache: {disk_cache.directory}", box=box.ROUNDED)
+        table.add_column("Method", style="cyan")
+        table.add_column("Parameters", style="white")
+        table.add_column("Age", style="green")
+        table.add_column("State", style="yellow")
+
+        for entry in entries:
+            params = {k: v for k, v in entry["params"].items() if k not in ("method", "output")}
+            table.add_row(
+                entry["method"],
+                ", ".join(f"{k}={v}" for k, v in params.items()) or "-",
+                f"{entry['age']:.0f}s",
+                "expired" if entry["expired"] else "fresh",
+            )
+
+        console.print(table)
+    finally:
+        client.close()
+
+
+@cache.command("clear")
+@click.pass_context
+def clear_cache(ctx):
+    """Delete cached entries for the current server and credentials."""
+    client = _cache_client(ctx)
+
+    try:
+        disk_cache = _disk_cache(client)
+        if disk_cache is None:
+            return
+        removed = disk_cache.clear()
+        console.print(f"[green]Removed {removed} cache entries.[/green]")
+    finally:
+        client.close()
+
+
+@cache.command("refresh")
+@click.pass_context
+def refresh_cache(ctx):
+    """Clear the cache and fetch reference data again."""
+    client = _cache_client(ctx)
+
+    try:
+        disk_cache = _disk_cache(client)
+        if disk_cache is None:
+            return
+        disk_cache.clear()
+        with console.status("[bold green]Refreshing cache..."):
+            client.version()
+            client.categories.list()
+            client.custom_fields.list()
+            if client.auth:
+                client.filters.list()
+                client.status_types.list()
+                client.status_types.list(active_only=False)
+        console.print(
+            f"[green]Cached {len(disk_cache.entries())} entries in {disk_cache.directory}.[/green]"
+        )
+    except APIError as e:
+        console.print(f"[red]API Error {e.error_id}: {e.description}[/red]")
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+    finally:
+        client.close()
+
+
 @cli.command()
 @click.pass_context
 def config(ctx):
@@ -430,6 +1063,7 @@ def config(ctx):
     table.add_row("Username", ctx.obj["username"] or "Not set")
     table.add_row("API Token", "Set" if ctx.obj["api_token"] else "Not set")
     table.add_row("SSL Verification", "Enabled" if ctx.obj["verify_ssl"] else "Disabled")
+    table.add_row("Disk Cache", str(ctx.obj["cache_dir"]) if ctx.obj["cache_dir"] else "Disabled")
 
     console.print(table)
     console.print("\n[yellow]Tip:[/yellow] Set environment variables to avoid typing credentials:")
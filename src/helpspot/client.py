@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+from datetime import tzinfo
+from pathlib import Path
+from typing import Any
 
 import httpx
 
 from helpspot.api import (
+    AsyncCategoriesAPI,
+    AsyncCustomersAPI,
+    AsyncCustomFieldsAPI,
+    AsyncFiltersAPI,
+    AsyncRequestsAPI,
+    AsyncStatusTypesAPI,
     CategoriesAPI,
     CustomersAPI,
     CustomFieldsAPI,
@@ -15,12 +25,109 @@ from helpspot.api import (
     StatusTypesAPI,
 )
 from helpspot.auth import BearerAuth
+from helpspot.cache import DiskCache, ResponseCache, TTLCache, cache_namespace
+from helpspot.codec import OUTPUT_FORMATS, JSONDecoder, decode_xml, get_decoder
+from helpspot.dates import DateParser
+from helpspot.mirror import TicketMirror
 from helpspot.models import VersionInfo
+from helpspot.ratelimit import RateLimiter
+from helpspot.retry import RetryPolicy
+from helpspot.singleflight import AsyncSingleFlight, SingleFlight
+from helpspot.transport import AsyncSharedTransport, SharedTransport, build_limits
 from helpspot.utils import validate_base_url
 
 logger = logging.getLogger("helpspot")
 
 
+def _check_output_format(output_format: str) -> str:
+    """Validate the output_format argument."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output_format '{output_format}'. Use one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+    return output_format
+
+
+def _check_transport_options(
+    transport: object, verify_ssl: bool, http2: bool, limits: httpx.Limits
+) -> None:
+    """Reject connection options that a given transport would override."""
+    if transport is None:
+        return
+    ignored = [
+        name
+        for name, changed in (
+            ("verify_ssl", not verify_ssl),
+            ("http2", http2),
+            ("connection limits", limits != build_limits()),
+        )
+        if changed
+    ]
+    if ignored:
+        raise ValueError(
+            f"{', '.join(ignored)} cannot be combined with transport=; "
+            "configure the transport instead"
+        )
+
+
+def _build_date_parser(timezone: str | tzinfo | None, date_parser: DateParser | None) -> DateParser:
+    """Return the client's own DateParser."""
+    if date_parser is None:
+        return DateParser(tz=timezone or "UTC")
+    if timezone is not None:
+        raise ValueError("Pass either timezone or date_parser, not both")
+    return date_parser
+
+
+def _version_result(result: dict[str, Any], output_format: str) -> dict[str, Any]:
+    """Return the version fields, which XML replies wrap in a root element."""
+    if output_format == "xml" and len(result) == 1:
+        (fields,) = result.values()
+        if isinstance(fields, dict):
+            return fields
+    return result
+
+
+def _build_auth(
+    api_token: str | None, username: str | None, password: str | None
+) -> httpx.Auth | None:
+    """Select the authentication scheme from the supplied credentials.
+
+    Raises:
+        ValueError: If only one of username and password is provided.
+    """
+    if api_token:
+        logger.debug("Using Bearer token authentication")
+        return BearerAuth(api_token)
+    if username and password:
+        logger.debug("Using Basic authentication")
+        return httpx.BasicAuth(username, password)
+    if username or password:
+        raise ValueError("Both username and password must be provided for basic auth")
+    logger.debug("No authentication provided (public API only)")
+    return None
+
+
+def _build_disk_cache(
+    cache_dir: str | Path | None,
+    disk_cache_ttl: dict[str, float] | None,
+    base_url: str,
+    api_token: str | None,
+    username: str | None,
+) -> DiskCache | None:
+    """Create the on-disk cache for this server and auth identity, if enabled."""
+    if cache_dir is None:
+        return None
+    if api_token:
+        identity = f"token:{api_token}"
+    elif username:
+        identity = f"user:{username}"
+    else:
+        identity = "public"
+    directory = Path(cache_dir) / cache_namespace(base_url, identity)
+    return DiskCache(directory, disk_cache_ttl)
+
+
 class HelpSpotClient:
     """Main client for interacting with the HelpSpot API.
 
@@ -42,6 +149,22 @@ class HelpSpotClient:
         output_format: str = "json",
         timeout: float = 30.0,
         verify_ssl: bool = True,
+        reference_cache_ttl: float | dict[str, float] | None = None,
+        cache_dir: str | Path | None = None,
+        disk_cache_ttl: dict[str, float] | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        retry: RetryPolicy | None = None,
+        rate_limit: RateLimiter | None = None,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        transport: SharedTransport | httpx.BaseTransport | None = None,
+        json_decoder: str | JSONDecoder = "auto",
+        mirror: TicketMirror | str | Path | None = None,
+        timezone: str | tzinfo | None = None,
+        date_parser: DateParser | None = None,
     ) -> None:
         """Initialize the HelpSpot client.
 
@@ -51,13 +174,63 @@ class HelpSpotClient:
             api_token: API token from staff preferences (recommended).
             username: Username for basic auth (alternative to api_token).
             password: Password for basic auth (required if username provided).
-            output_format: API output format ("json", "xml", or "php"). Default: "json".
+            output_format: API output format, "json" or "xml". XML replies are
+                decoded (and streamed) into the same rows as JSON ones, with
+                values as strings. Default: "json".
             timeout: Request timeout in seconds. Default: 30.0.
             verify_ssl: Whether to verify SSL certificates. Set to False to bypass
                 certificate verification (not recommended for production). Default: True.
+            reference_cache_ttl: Seconds to cache categories, custom fields and
+                status types in memory, either one value for all or a dict keyed by
+                "categories", "custom_fields" and "status_types". Default: None
+                (no caching). Clear with ``client.reference_cache.invalidate()``.
+            cache_dir: Directory for a persistent cache of reference data
+                (categories, filters, status types, custom fields and version),
+                shared across processes. Entries are kept per base_url and auth
+                identity. Default: None (no disk cache).
+            disk_cache_ttl: Seconds to keep each API method on disk. Default:
+                helpspot.cache.DISK_CACHE_TTLS.
+            response_cache: In-memory LRU cache of read-only API responses
+                (tickets, searches, filters, reference data). Writes invalidate
+                affected entries. Do not share one cache between clients with
+                different credentials. Default: None (no caching).
+            coalesce_requests: Share one HTTP request between threads making
+                identical GET calls concurrently; each thread gets its own copy
+                of the parsed response. Default: False.
+            retry: Policy for retrying transient failures (connection errors,
+                timeouts, 429 and 5xx responses). Default: None (no retries).
+            rate_limit: Token-bucket limiter every API call waits on. Share one
+                limiter between clients (or processes, with a shared_path) that
+                use the same server. Default: None (no limit).
+            http2: Multiplex concurrent requests over HTTP/2 connections.
+                Requires the ``http2`` extra. Default: False.
+            max_connections: Maximum open connections in the pool. Default: 100.
+            max_keepalive_connections: Maximum idle connections kept open for
+                reuse. Default: 20.
+            keepalive_expiry: Seconds an idle connection is kept open. Default: 5.0.
+            transport: Transport to send requests through. Pass a
+                SharedTransport to let several clients (e.g. one per tenant)
+                share one connection pool; verify_ssl, http2 and the pool
+                limits are then taken from the transport and must be left
+                at their defaults here.
+            json_decoder: JSON backend for response bodies: "orjson", "msgspec",
+                "json" (stdlib), "auto" (fastest installed) or a callable
+                decoding bytes. Default: "auto".
+            mirror: Local ticket mirror (or the path of its SQLite file) for
+                requests.search_local(). Kept current with TicketMirror.sync()
+                or ``helpspot sync``. Default: None.
+            timezone: Time zone the server shows dates in (a tzinfo or an
+                IANA name such as "Europe/Berlin"), used to read formatted
+                dates, which HelpSpot sends without fRawValues. Default: UTC.
+            date_parser: DateParser for formatted dates, instead of one built
+                from timezone. The client's parser remembers the server's
+                date format, so give each server its own.
 
         Raises:
-            ValueError: If base_url is invalid or auth parameters are incomplete.
+            ValueError: If base_url or output_format is invalid, auth parameters
+                are incomplete, both timezone and date_parser are given, or
+                transport is combined with verify_ssl, http2 or pool limits.
+            zoneinfo.ZoneInfoNotFoundError: If the time zone name is unknown.
 
         Example:
             >>> # Using API token (recommended)
@@ -82,23 +255,41 @@ class HelpSpotClient:
         """
         # Validate and normalize base URL
         self.base_url = validate_base_url(base_url)
-        self.output_format = output_format
+        self.output_format = _check_output_format(output_format)
+        limits = build_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        _check_transport_options(transport, verify_ssl, http2, limits)
 
         # Set up authentication
-        self.auth: httpx.Auth | None = None
-        if api_token:
-            self.auth = BearerAuth(api_token)
-            logger.debug("Using Bearer token authentication")
-        elif username and password:
-            self.auth = httpx.BasicAuth(username, password)
-            logger.debug("Using Basic authentication")
-        elif username or password:
-            raise ValueError("Both username and password must be provided for basic auth")
-        else:
-            logger.debug("No authentication provided (public API only)")
+        self.auth = _build_auth(api_token, username, password)
+        self.reference_cache = TTLCache(reference_cache_ttl)
+        self.disk_cache = _build_disk_cache(
+            cache_dir, disk_cache_ttl, self.base_url, api_token, username
+        )
+        self.response_cache = response_cache
+        self.retry = retry
+        self.rate_limiter = rate_limit
+        self.json_decoder = get_decoder(json_decoder)
+        self.body_decoder = decode_xml if output_format == "xml" else self.json_decoder
+        self.mirror = (
+            mirror if mirror is None or isinstance(mirror, TicketMirror) else TicketMirror(mirror)
+        )
+        self._owns_mirror = self.mirror is not mirror
+        self.date_parser = _build_date_parser(timezone, date_parser)
+        self.single_flight: SingleFlight[dict[str, Any]] | None = (
+            SingleFlight(copy.deepcopy) if coalesce_requests else None
+        )
 
         # Create HTTP client
-        self._http_client = httpx.Client(auth=self.auth, timeout=timeout, verify=verify_ssl)
+        if isinstance(transport, SharedTransport):
+            transport = transport.lease()
+        self._http_client = httpx.Client(
+            auth=self.auth,
+            timeout=timeout,
+            verify=verify_ssl,
+            http2=http2,
+            limits=limits,
+            transport=transport,
+        )
 
         if not verify_ssl:
             logger.warning(
@@ -130,9 +321,13 @@ class HelpSpotClient:
         url = f"{self.base_url}/api/index.php"
         params = {"method": "version", "output": self.output_format}
 
-        response = self._http_client.get(url, params=params)
-        response.raise_for_status()
-        result = response.json()
+        result = self.disk_cache.get("version", params) if self.disk_cache else None
+        if result is None:
+            response = self._http_client.get(url, params=params)
+            response.raise_for_status()
+            result = _version_result(self.body_decoder(response.content), self.output_format)
+            if self.disk_cache:
+                self.disk_cache.set("version", params, result)
 
         return VersionInfo(**result)
 
@@ -150,6 +345,8 @@ class HelpSpotClient:
             ...     client.close()
         """
         self._http_client.close()
+        if self.mirror is not None and self._owns_mirror:
+            self.mirror.close()
 
     def __enter__(self) -> HelpSpotClient:
         """Context manager entry."""
@@ -158,3 +355,168 @@ class HelpSpotClient:
     def __exit__(self, *args: object) -> None:
         """Context manager exit."""
         self.close()
+
+
+class AsyncHelpSpotClient:
+    """Asyncio client for interacting with the HelpSpot API.
+
+    Takes the same arguments as HelpSpotClient but is backed by an
+    ``httpx.AsyncClient``, so every endpoint method is awaitable and many
+    calls can be in flight on a single event loop.
+
+    Example:
+        >>> async with AsyncHelpSpotClient(
+        ...     base_url="https://support.example.com",
+        ...     api_token="your_token_here"
+        ... ) as client:
+        ...     requests = await asyncio.gather(
+        ...         *(client.requests.get(request_id=i) for i in (123, 124, 125))
+        ...     )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        output_format: str = "json",
+        timeout: float = 30.0,
+        verify_ssl: bool = True,
+        reference_cache_ttl: float | dict[str, float] | None = None,
+        cache_dir: str | Path | None = None,
+        disk_cache_ttl: dict[str, float] | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        retry: RetryPolicy | None = None,
+        rate_limit: RateLimiter | None = None,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        transport: AsyncSharedTransport | httpx.AsyncBaseTransport | None = None,
+        json_decoder: str | JSONDecoder = "auto",
+        mirror: TicketMirror | str | Path | None = None,
+        timezone: str | tzinfo | None = None,
+        date_parser: DateParser | None = None,
+    ) -> None:
+        """Initialize the asyncio HelpSpot client.
+
+        Args:
+            base_url: Base URL of your HelpSpot installation.
+            api_token: API token from staff preferences (recommended).
+            username: Username for basic auth (alternative to api_token).
+            password: Password for basic auth (required if username provided).
+            output_format: API output format, "json" or "xml". XML replies are
+                decoded (and streamed) into the same rows as JSON ones, with
+                values as strings. Default: "json".
+            timeout: Request timeout in seconds. Default: 30.0.
+            verify_ssl: Whether to verify SSL certificates. Default: True.
+            reference_cache_ttl: Seconds to cache reference data. See HelpSpotClient.
+            cache_dir: Directory for a persistent reference cache. See HelpSpotClient.
+            disk_cache_ttl: Seconds to keep each API method on disk.
+            response_cache: In-memory cache of read-only API responses.
+            coalesce_requests: Share one HTTP request between tasks making
+                identical GET calls concurrently. Default: False.
+            retry: Policy for retrying transient failures. Default: None.
+            rate_limit: Token-bucket limiter every API call waits on. Default: None.
+            http2: Multiplex concurrent requests over HTTP/2. Default: False.
+            max_connections: Maximum open connections in the pool. Default: 100.
+            max_keepalive_connections: Maximum idle connections kept open. Default: 20.
+            keepalive_expiry: Seconds an idle connection is kept open. Default: 5.0.
+            transport: Transport to send requests through, e.g. an
+                AsyncSharedTransport shared with other clients. See
+                HelpSpotClient.
+            json_decoder: JSON backend for response bodies. Default: "auto".
+            mirror: Local ticket mirror (or its path) for requests.search_local().
+            timezone: Time zone the server shows dates in. See HelpSpotClient.
+            date_parser: DateParser for formatted dates. See HelpSpotClient.
+
+        Raises:
+            ValueError: If base_url or output_format is invalid, auth parameters
+                are incomplete, both timezone and date_parser are given, or
+                transport is combined with verify_ssl, http2 or pool limits.
+            zoneinfo.ZoneInfoNotFoundError: If the time zone name is unknown.
+        """
+        self.base_url = validate_base_url(base_url)
+        self.output_format = _check_output_format(output_format)
+        limits = build_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        _check_transport_options(transport, verify_ssl, http2, limits)
+        self.auth = _build_auth(api_token, username, password)
+        self.reference_cache = TTLCache(reference_cache_ttl)
+        self.disk_cache = _build_disk_cache(
+            cache_dir, disk_cache_ttl, self.base_url, api_token, username
+        )
+        self.response_cache = response_cache
+        self.retry = retry
+        self.rate_limiter = rate_limit
+        self.json_decoder = get_decoder(json_decoder)
+        self.body_decoder = decode_xml if output_format == "xml" else self.json_decoder
+        self.mirror = (
+            mirror if mirror is None or isinstance(mirror, TicketMirror) else TicketMirror(mirror)
+        )
+        self._owns_mirror = self.mirror is not mirror
+        self.date_parser = _build_date_parser(timezone, date_parser)
+        self.single_flight: AsyncSingleFlight[dict[str, Any]] | None = (
+            AsyncSingleFlight(copy.deepcopy) if coalesce_requests else None
+        )
+
+        if isinstance(transport, AsyncSharedTransport):
+            transport = transport.lease()
+        self._http_client = httpx.AsyncClient(
+            auth=self.auth,
+            timeout=timeout,
+            verify=verify_ssl,
+            http2=http2,
+            limits=limits,
+            transport=transport,
+        )
+
+        if not verify_ssl:
+            logger.warning(
+                "SSL certificate verification is disabled. "
+                "This is not recommended for production use."
+            )
+
+        # Initialize API endpoints
+        self.requests = AsyncRequestsAPI(self)
+        self.customers = AsyncCustomersAPI(self)
+        self.categories = AsyncCategoriesAPI(self)
+        self.custom_fields = AsyncCustomFieldsAPI(self)
+        self.filters = AsyncFiltersAPI(self)
+        self.status_types = AsyncStatusTypesAPI(self)
+
+        logger.info(f"Async HelpSpot client initialized for {self.base_url}")
+
+    async def version(self) -> VersionInfo:
+        """Get API version information.
+
+        Returns:
+            VersionInfo with version and min_version.
+        """
+        url = f"{self.base_url}/api/index.php"
+        params = {"method": "version", "output": self.output_format}
+
+        result = self.disk_cache.get("version", params) if self.disk_cache else None
+        if result is None:
+            response = await self._http_client.get(url, params=params)
+            response.raise_for_status()
+            result = _version_result(self.body_decoder(response.content), self.output_format)
+            if self.disk_cache:
+                self.disk_cache.set("version", params, result)
+
+        return VersionInfo(**result)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and clean up resources."""
+        await self._http_client.aclose()
+        if self.mirror is not None and self._owns_mirror:
+            self.mirror.close()
+
+    async def __aenter__(self) -> AsyncHelpSpotClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.aclose()
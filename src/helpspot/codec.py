@@ -0,0 +1,112 @@
+"""JSON decoding backends for API responses."""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from typing import Any
+
+#: A function decoding a JSON document from raw response bytes.
+JSONDecoder = Callable[[bytes], Any]
+
+#: Values accepted for the client's ``output_format``.
+OUTPUT_FORMATS: tuple[str, ...] = ("json", "xml")
+
+#: Backends tried, in order, by get_decoder("auto").
+AUTO_BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+
+def _orjson() -> JSONDecoder:
+    import orjson
+
+    return orjson.loads  # type: ignore[no-any-return]
+
+
+def _msgspec() -> JSONDecoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode  # type: ignore[no-any-return]
+
+
+def _stdlib() -> JSONDecoder:
+    return json.loads
+
+
+_BACKENDS: dict[str, Callable[[], JSONDecoder]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+def get_decoder(backend: str | JSONDecoder = "auto") -> JSONDecoder:
+    """Return a JSON decoder for response bodies.
+
+    Args:
+        backend: "orjson", "msgspec", "json" (stdlib), "auto" for the fastest
+            installed one, or a callable taking bytes.
+
+    Returns:
+        Function decoding a JSON document from bytes.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+
+    Example:
+        >>> loads = get_decoder("auto")
+        >>> loads(b'{"xRequest": 12345}')
+        {'xRequest': 12345}
+    """
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        for name in AUTO_BACKENDS:
+            try:
+                return _BACKENDS[name]()
+            except ImportError:
+                continue
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}'. Use one of: auto, {', '.join(_BACKENDS)}"
+        )
+    return _BACKENDS[backend]()
+
+
+def xml_value(element: ET.Element) -> Any:
+    """Convert an XML element to the value HelpSpot's JSON output has in its place.
+
+    An element without children becomes its text ("" if empty); one with
+    children becomes a dict keyed by tag, where a repeated tag becomes a
+    list. Attributes are ignored (HelpSpot's responses do not use them).
+    """
+    if len(element) == 0:
+        return element.text or ""
+    result: dict[str, Any] = {}
+    repeated: set[str] = set()
+    for child in element:
+        tag = child.tag
+        value = (child.text or "") if len(child) == 0 else xml_value(child)
+        if tag not in result:
+            result[tag] = value
+        elif tag in repeated:
+            result[tag].append(value)
+        else:
+            result[tag] = [result[tag], value]
+            repeated.add(tag)
+    return result
+
+
+def decode_xml(content: bytes) -> dict[str, Any]:
+    """Decode an XML response body into the shape of the JSON output.
+
+    The root element becomes the single top-level key, so
+    ``<filter><request>...</request></filter>`` decodes like
+    ``{"filter": {"request": {...}}}``. All leaf values are strings.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the body is not well-formed XML.
+    """
+    root = ET.fromstring(content)
+    return {root.tag: xml_value(root)}
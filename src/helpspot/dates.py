@@ -0,0 +1,337 @@
+"""Parsing HelpSpot's formatted date strings."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable, Sequence
+from datetime import UTC, date, datetime, tzinfo
+from typing import Any
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger("helpspot")
+
+#: Formats tried, in order, when detecting how a server formats dates. The
+#: first is HelpSpot's default date format; the others cover common
+#: alternatives set under Admin > Settings > Date/Time.
+DATE_FORMATS: tuple[str, ...] = (
+    "%b %d %Y, %I:%M %p",
+    "%B %d %Y, %I:%M %p",
+    "%b %d, %Y %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+    "%b %d %Y %I:%M %p",
+    "%a, %b %d %Y, %I:%M %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M",
+    "%d.%m.%Y %H:%M",
+    "%d %b %Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%a, %d %b %Y %H:%M:%S %z",
+)
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+
+_DIRECTIVES = {
+    "Y": r"(?P<Y>\d{4})",
+    "y": r"(?P<y>\d{2})",
+    "m": r"(?P<m>\d{1,2})",
+    "d": r"(?P<d>\d{1,2})",
+    "e": r"(?P<d>\d{1,2})",
+    "b": r"(?P<b>[A-Za-z]{3,4})\.?",
+    "B": r"(?P<b>[A-Za-z]{3,9})",
+    "a": r"[A-Za-z]{3}\.?",
+    "A": r"[A-Za-z]{6,9}",
+    "H": r"(?P<H>\d{1,2})",
+    "I": r"(?P<I>\d{1,2})",
+    "M": r"(?P<M>\d{2})",
+    "S": r"(?P<S>\d{2})",
+    "p": r"(?P<p>[AaPp]\.?[Mm]\.?)",
+    "z": r"(?P<z>Z|[+-]\d{2}:?\d{2})",
+}
+
+_EPOCH_DAYS = 719163  # date(1970, 1, 1).toordinal()
+
+
+def _compile(fmt: str) -> re.Pattern[str]:
+    """Translate a strptime format into a regular expression.
+
+    Runs of whitespace match any whitespace, so day numbers padded with a
+    space (as PHP's %e produces) are accepted.
+
+    Raises:
+        ValueError: If the format uses an unsupported directive.
+    """
+    parts = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char == "%":
+            directive = fmt[i + 1 : i + 2]
+            if directive not in _DIRECTIVES:
+                raise ValueError(f"Unsupported date directive '%{directive}' in '{fmt}'")
+            parts.append(_DIRECTIVES[directive])
+            i += 2
+        elif char.isspace():
+            parts.append(r"\s+")
+            while i < len(fmt) and fmt[i].isspace():
+                i += 1
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return re.compile(r"\s*" + "".join(parts) + r"\s*", re.IGNORECASE)
+
+
+def _offset(value: str) -> int:
+    """Return a UTC offset ("Z", "+0200", "-05:00") in seconds."""
+    if value.upper() == "Z":
+        return 0
+    sign = -1 if value[0] == "-" else 1
+    digits = value[1:].replace(":", "")
+    return sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+
+
+class DateParser:
+    """Convert formatted HelpSpot dates to Unix timestamps.
+
+    Without ``fRawValues`` HelpSpot sends dates such as
+    ``"Sep 24 2007, 01:38 PM"`` in the format configured on the server. The
+    parser detects that format from the first date it sees by trying
+    ``formats`` in order, then keeps using it, falling back to detection
+    again only when a value does not match. Formats are matched with
+    precompiled regular expressions rather than strptime.
+
+    Dates without a UTC offset are read in ``tz``, which should be the time
+    zone the server displays dates in. Each client has its own parser (see
+    the ``timezone`` and ``date_parser`` client options), so clients of
+    servers with different settings do not disturb each other.
+
+    Example:
+        >>> parser = DateParser(tz="America/New_York")
+        >>> parser.parse("Sep 24 2007, 01:38 PM")
+        1190655480
+        >>> parser.format
+        '%b %d %Y, %I:%M %p'
+    """
+
+    def __init__(self, formats: Sequence[str] = DATE_FORMATS, tz: tzinfo | str = UTC) -> None:
+        """Initialize the parser.
+
+        Args:
+            formats: strptime-style formats to detect, in order of preference.
+                Supported directives: %Y %y %m %d %e %b %B %a %A %H %I %M %S %p %z.
+            tz: Time zone of dates that carry no UTC offset, as a tzinfo or an
+                IANA name such as "Europe/Berlin".
+
+        Raises:
+            ValueError: If a format uses an unsupported directive.
+            zoneinfo.ZoneInfoNotFoundError: If the time zone name is unknown.
+        """
+        self.tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self._patterns = [(fmt, _compile(fmt)) for fmt in formats]
+        self._current: tuple[str, re.Pattern[str]] | None = None
+        self._days: dict[tuple[Any, ...], int] = {}
+        self._unparsed: set[str] = set()
+
+    @property
+    def format(self) -> str | None:
+        """The detected format, or None before the first date is parsed."""
+        return self._current[0] if self._current else None
+
+    def parse(self, value: str) -> int:
+        """Parse one formatted date.
+
+        Args:
+            value: Date as sent by HelpSpot. Digit strings are taken as
+                Unix timestamps.
+
+        Returns:
+            Unix timestamp in seconds.
+
+        Raises:
+            ValueError: If the value matches none of the formats.
+        """
+        current = self._current
+        if current is not None:
+            match = current[1].fullmatch(value)
+            if match is not None:
+                try:
+                    return self._timestamp(match)
+                except ValueError:
+                    pass  # e.g. day 31 of a 30-day month: try the other formats
+        if value.strip().isdigit():
+            return int(value)
+        for fmt, pattern in self._patterns:
+            match = pattern.fullmatch(value)
+            if match is not None:
+                try:
+                    timestamp = self._timestamp(match)
+                except ValueError:
+                    continue
+                self._current = (fmt, pattern)
+                return timestamp
+        raise ValueError(f"Unrecognized date '{value}'")
+
+    def parse_lenient(self, value: str) -> int | str:
+        """Parse one formatted date, returning it unchanged if it cannot be.
+
+        A value matching none of the formats is logged as a warning (once
+        per distinct value) rather than raised, so one odd date does not
+        fail a whole page.
+        """
+        try:
+            return self.parse(value)
+        except ValueError:
+            if value not in self._unparsed:
+                if len(self._unparsed) < 1000:
+                    self._unparsed.add(value)
+                logger.warning(f"Could not parse date {value!r}; keeping it as text")
+            return value
+
+    def parse_many(
+        self, values: Iterable[int | str | None], strict: bool = True
+    ) -> list[int | str | None]:
+        """Parse a column of dates, such as one field of a whole page.
+
+        Repeated strings are parsed once, and timestamps and missing values
+        pass through, so a page of dates costs little more than its distinct
+        values.
+
+        Args:
+            values: Dates as sent by HelpSpot (strings, timestamps or None).
+            strict: Raise for a value matching none of the formats. If False,
+                such values are kept as strings (see parse_lenient).
+
+        Returns:
+            Unix timestamps, with None for missing ("" or None) values.
+
+        Raises:
+            ValueError: If strict and a value matches none of the formats.
+        """
+        parse = self.parse if strict else self.parse_lenient
+        seen: dict[str, int | str] = {}
+        result: list[int | str | None] = []
+        append = result.append
+        for value in values:
+            if isinstance(value, str) and value:
+                timestamp = seen.get(value)
+                if timestamp is None:
+                    timestamp = seen[value] = parse(value)
+                append(timestamp)
+            else:
+                append(value if isinstance(value, int) else None)
+        return result
+
+    def _timestamp(self, match: re.Match[str]) -> int:
+        fields = match.groupdict()
+        day = (fields.get("Y") or fields.get("y"), fields.get("b") or fields.get("m"), fields["d"])
+        days = self._days.get(day)
+        if days is None:
+            days = _days_since_epoch(fields)
+            if len(self._days) < 100_000:
+                self._days[day] = days
+        if fields.get("I"):
+            hour = int(fields["I"])
+            if not 1 <= hour <= 12:
+                raise ValueError(f"Hour out of range: {hour}")
+            hour %= 12
+            if fields["p"][0] in "Pp":
+                hour += 12
+        else:
+            hour = int(fields.get("H") or 0)
+        minute = int(fields.get("M") or 0)
+        second = int(fields.get("S") or 0)
+        if hour > 23 or minute > 59 or second > 59:
+            raise ValueError("Time out of range")
+        if fields.get("z"):
+            offset = _offset(fields["z"])
+        elif self.tz is UTC:
+            offset = 0
+        else:
+            local = datetime.fromordinal(days + _EPOCH_DAYS).replace(
+                hour=hour, minute=minute, second=second, tzinfo=self.tz
+            )
+            return int(local.timestamp())
+        return days * 86400 + hour * 3600 + minute * 60 + second - offset
+
+
+def _days_since_epoch(fields: dict[str, Any]) -> int:
+    """Validate the date fields of a match and return its day number."""
+    if fields.get("Y"):
+        year = int(fields["Y"])
+    else:
+        # POSIX pivot: 69-99 are 1969-1999, 00-68 are 2000-2068
+        year = int(fields["y"])
+        year += 1900 if year >= 69 else 2000
+    month_name = fields.get("b")
+    month = _MONTHS.get(month_name.lower()) if month_name else int(fields["m"])
+    if month is None:
+        raise ValueError(f"Unknown month '{month_name}'")
+    return date(year, month, int(fields["d"])).toordinal() - _EPOCH_DAYS
+
+
+#: Parser for dates validated without a client, e.g. ``Request(**row)``.
+#: Clients use their own parser; see HelpSpotClient's ``timezone`` option.
+default_parser = DateParser()
+
+
+def parse_timestamp(value: int | str | None, parser: DateParser | None = None) -> int | None:
+    """Convert a HelpSpot date field to a Unix timestamp.
+
+    Args:
+        value: Timestamp, digit string, formatted date, or None/"" if unset.
+        parser: Parser to use. Defaults to ``default_parser``.
+
+    Returns:
+        Unix timestamp in seconds, or None if unset.
+
+    Raises:
+        ValueError: If a formatted date matches none of the parser's formats.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return value
+    return (parser or default_parser).parse(value)
+
+
+def coerce_timestamp(value: Any, parser: DateParser | None = None) -> int | str | None:
+    """Convert a HelpSpot date field to a Unix timestamp where possible.
+
+    Like parse_timestamp, but a formatted date in no known format is logged
+    and returned as the original string (see DateParser.parse_lenient).
+    Values that are neither strings nor timestamps are returned unchanged.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return (parser or default_parser).parse_lenient(value)
+    return value  # type: ignore[no-any-return]
+
+
+def to_datetime(timestamp: int | None) -> datetime | None:
+    """Return a timezone-aware UTC datetime for a Unix timestamp (None stays None)."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, UTC)
@@ -49,4 +49,14 @@ class ValidationError(HelpSpotError):
 class HTTPError(HelpSpotError):
     """Raised when an HTTP request fails."""
 
-    pass
+    def __init__(self, message: str, status_code: int | None = None, retries: int = 0) -> None:
+        """Initialize HTTP error.
+
+        Args:
+            message: Description of the failure.
+            status_code: HTTP status of the last response, if one was received.
+            retries: Number of times the request was retried before giving up.
+        """
+        self.status_code = status_code
+        self.retries = retries
+        super().__init__(message)
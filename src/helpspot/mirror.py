@@ -0,0 +1,605 @@
+"""Local SQLite mirror of tickets for reporting without hitting the server."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from helpspot.cache import cache_namespace, default_cache_dir
+from helpspot.models import Request, RequestHistory
+
+if TYPE_CHECKING:
+    from helpspot.client import HelpSpotClient
+
+logger = logging.getLogger("helpspot")
+
+#: Seconds subtracted from the last sync time when asking for updated
+#: tickets, to cover clock skew between this host and the server.
+SYNC_OVERLAP = 300.0
+
+_INTEGER_FIELDS = frozenset(
+    {"x_request", "opened_via_id", "opened_date", "closed_date", "trashed_date"}
+)
+_FLAG_FIELDS = frozenset({"is_open", "is_urgent", "is_trash"})
+
+#: Mirrored columns, in Request field order.
+COLUMNS: tuple[str, ...] = tuple(Request.model_fields)
+
+#: Columns holding names where the API also has IDs (see TicketMirror.names()).
+NAME_COLUMNS: tuple[str, ...] = ("status", "category", "person_assigned_to")
+
+_COLUMN_SQL = ", ".join(
+    f"{name} INTEGER PRIMARY KEY"
+    if name == "x_request"
+    else f"{name} INTEGER"
+    if name in _INTEGER_FIELDS or name in _FLAG_FIELDS
+    else f"{name} TEXT"
+    for name in COLUMNS
+)
+
+_UPSERT_SQL = (
+    f"INSERT INTO requests ({', '.join(COLUMNS)}, synced_at) "
+    f"VALUES ({', '.join('?' * (len(COLUMNS) + 1))}) "
+    f"ON CONFLICT(x_request) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in (*COLUMNS[1:], "synced_at"))
+)
+
+#: Columns in the full-text index, with their bm25() weights: a match in the
+#: title counts ten times one in the note body.
+TEXT_COLUMNS: dict[str, float] = {
+    "title": 10.0,
+    "note": 1.0,
+    "full_name": 5.0,
+    "first_name": 5.0,
+    "last_name": 5.0,
+    "email": 5.0,
+    "user_id": 5.0,
+    "phone": 5.0,
+}
+
+_TEXT = ", ".join(TEXT_COLUMNS)
+_NEW_TEXT = ", ".join(f"new.{name}" for name in TEXT_COLUMNS)
+_OLD_TEXT = ", ".join(f"old.{name}" for name in TEXT_COLUMNS)
+_BM25 = f"bm25(requests_fts, {', '.join(map(str, TEXT_COLUMNS.values()))})"
+
+# An external-content FTS5 table over ``requests``: the index stores no
+# copy of the text, and triggers keep it current as tickets are upserted.
+_FTS_SQL = (
+    f"CREATE VIRTUAL TABLE requests_fts USING fts5({_TEXT}, content='requests', "
+    f"content_rowid='x_request', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS requests_fts_insert AFTER INSERT ON requests BEGIN "
+    f"INSERT INTO requests_fts(rowid, {_TEXT}) VALUES (new.x_request, {_NEW_TEXT}); END",
+    f"CREATE TRIGGER IF NOT EXISTS requests_fts_delete AFTER DELETE ON requests BEGIN "
+    f"INSERT INTO requests_fts(requests_fts, rowid, {_TEXT}) "
+    f"VALUES ('delete', old.x_request, {_OLD_TEXT}); END",
+    f"CREATE TRIGGER IF NOT EXISTS requests_fts_update AFTER UPDATE ON requests BEGIN "
+    f"INSERT INTO requests_fts(requests_fts, rowid, {_TEXT}) "
+    f"VALUES ('delete', old.x_request, {_OLD_TEXT}); "
+    f"INSERT INTO requests_fts(rowid, {_TEXT}) VALUES (new.x_request, {_NEW_TEXT}); END",
+)
+
+
+def fts_query(text: str) -> str:
+    """Turn search box text into an FTS5 query matching every word.
+
+    Words are quoted, so punctuation (apostrophes, e-mail addresses, "-")
+    is matched literally instead of being read as query syntax. A trailing
+    ``*`` makes a word a prefix.
+
+    Example:
+        >>> fts_query("printer jam* jo@example.com")
+        '"printer" "jam"* "jo@example.com"'
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*") if prefix else word
+        quoted = '"' + word.replace('"', '""') + '"'
+        terms.append(quoted + "*" if prefix else quoted)
+    return " ".join(terms)
+
+
+def default_mirror_path(base_url: str, identity: str = "", cache_dir: Path | None = None) -> Path:
+    """Return the default mirror file for a server and auth identity.
+
+    Args:
+        base_url: HelpSpot base URL.
+        identity: API token or username; hashed into the file name.
+        cache_dir: Cache directory. Defaults to default_cache_dir().
+    """
+    root = cache_dir or default_cache_dir()
+    return root / "mirror" / f"{cache_namespace(base_url, identity)}.sqlite3"
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """Outcome of one TicketMirror.sync() or refresh() run."""
+
+    fetched: int
+    created: int
+    updated: int
+    full: bool
+    seconds: float
+    high_water_id: int | None
+    high_water_opened: int | None
+
+
+class TicketMirror:
+    """A local SQLite copy of tickets, kept current with incremental syncs.
+
+    The first sync() walks every ticket through private.request.search
+    (or a filter). Later ones search only for tickets opened after the
+    newest one stored (``afterDate``), and re-fetch the tickets that
+    private.request.getChanged reports as changed since the last run
+    (less SYNC_OVERLAP seconds).
+    Reads (get(), search(), query()) never touch the server, and the file
+    uses WAL journaling so reporting jobs can read while a sync writes.
+    Titles, notes and customer fields are indexed with SQLite FTS5 for
+    search(text=...); triggers update the index as tickets are stored.
+
+    The mirror records its high-water marks: the newest ``xRequest`` and
+    ``dtGMTOpened`` seen, and the time the last complete sync started.
+    Incremental syncs start from them.
+
+    Example:
+        >>> mirror = TicketMirror("tickets.sqlite3")
+        >>> mirror.sync(client)
+        SyncResult(fetched=12840, created=12840, updated=0, full=True, ...)
+        >>> mirror.search(status="Active", is_urgent=True)
+        [Request(x_request=12746, ...), ...]
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        overlap: float = SYNC_OVERLAP,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open (or create) a mirror file.
+
+        Args:
+            path: SQLite file. Parent directories are created.
+            overlap: Seconds of overlap between incremental syncs.
+            clock: Source of the current Unix time.
+        """
+        self.path = Path(path)
+        self.overlap = overlap
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS requests ({_COLUMN_SQL}, synced_at REAL)")
+        for column in ("opened_date", "status", "category", "email"):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS requests_{column} ON requests ({column})"
+            )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value REAL)"
+        )
+        # History items as the API returned them, for requests.history()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS request_history (x_request_history INTEGER PRIMARY KEY, "
+            "x_request INTEGER NOT NULL, item TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS request_history_request ON request_history (x_request)"
+        )
+        self.has_fts = self._create_fts()
+
+    def _create_fts(self) -> bool:
+        """Create the full-text index if SQLite has FTS5, indexing existing rows."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'requests_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for sql in _FTS_SQL:
+                self._conn.execute(sql)
+            self._conn.execute("INSERT INTO requests_fts(requests_fts) VALUES ('rebuild')")
+            self._conn.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            self._conn.execute("ROLLBACK")
+            logger.warning(f"SQLite FTS5 unavailable ({e}); text search will scan the mirror")
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> TicketMirror:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of mirrored tickets."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM requests").fetchone()[0])
+
+    @property
+    def last_sync(self) -> float | None:
+        """Unix time the last complete sync started, or None if never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM sync_state WHERE key = 'last_sync'"
+            ).fetchone()
+        return None if row is None else float(row[0])
+
+    def high_water(self) -> tuple[int | None, int | None]:
+        """Return the newest mirrored (xRequest, dtGMTOpened)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(x_request), MAX(opened_date) FROM requests"
+            ).fetchone()
+        return row[0], row[1]
+
+    def sync(
+        self,
+        client: HelpSpotClient,
+        full: bool = False,
+        filter_id: str | None = None,
+        page_size: int = 500,
+    ) -> SyncResult:
+        """Bring the mirror up to date.
+
+        Args:
+            client: Authenticated client to read from.
+            full: Walk every ticket even if the mirror has synced before.
+            filter_id: Mirror the tickets of a filter instead of searching.
+                A filter cannot be narrowed by date, so it is read in full
+                on every run; keep it small (e.g. "updated this week").
+            page_size: Tickets requested per page.
+
+        Returns:
+            What was fetched and stored.
+
+        Raises:
+            AuthenticationRequiredError: If the client is not authenticated.
+            APIError: If the API returns an error. Tickets stored before the
+                failure are kept, and the next run starts from the previous
+                high-water mark.
+        """
+        started = self._clock()
+        last_sync = self.last_sync
+        incremental = not full and filter_id is None and last_sync is not None
+
+        changed: list[int] = []
+        if filter_id is not None:
+            rows = client.filters.get_all(filter_id, page_size=page_size)
+        elif incremental:
+            assert last_sync is not None
+            # Ask for changes first, so none made during the run is missed
+            changed = client.requests.changed(int(last_sync - self.overlap))
+            rows = client.requests.iter_search(
+                opened_after=self.high_water()[1],
+                order_by="dtGMTOpened",
+                order_dir="asc",
+                page_size=page_size,
+            )
+        else:
+            rows = client.requests.iter_search(
+                order_by="dtGMTOpened", order_dir="asc", page_size=page_size
+            )
+        mode = "incremental" if incremental else "full"
+        logger.info(f"Syncing ticket mirror {self.path} ({mode})")
+
+        fetched = created = 0
+        seen: set[int] = set()
+        page: list[Request] = []
+        for request in rows:
+            page.append(request)
+            seen.add(request.x_request)
+            if len(page) == page_size:
+                created += self.upsert(page)
+                fetched += len(page)
+                page = []
+        created += self.upsert(page)
+        fetched += len(page)
+
+        # Changed tickets the search for new ones did not return
+        refreshed = self._get_many(client, (i for i in dict.fromkeys(changed) if i not in seen))
+        created += self.upsert(refreshed)
+        fetched += len(refreshed)
+
+        self._set_state("last_sync", started)
+        return self._result(fetched, created, not incremental, started)
+
+    def refresh(
+        self, client: HelpSpotClient, request_ids: Iterable[int], concurrency: int = 8
+    ) -> SyncResult:
+        """Re-fetch specific tickets with private.request.get and store them.
+
+        Lookups that fail (e.g. deleted tickets) are logged and skipped.
+
+        Args:
+            client: Authenticated client to read from.
+            request_ids: Tickets to fetch.
+            concurrency: Maximum lookups in flight.
+        """
+        started = self._clock()
+        fetched = self._get_many(client, request_ids, concurrency)
+        created = self.upsert(fetched)
+        return self._result(len(fetched), created, False, started)
+
+    @staticmethod
+    def _get_many(
+        client: HelpSpotClient, request_ids: Iterable[int], concurrency: int = 8
+    ) -> list[Request]:
+        """Fetch tickets by ID, logging and skipping failed lookups."""
+        fetched = []
+        for result in client.requests.get_many(request_ids, concurrency=concurrency):
+            if result.error is not None:
+                logger.warning(f"Could not refresh request {result.key}: {result.error}")
+            elif result.value is not None:
+                fetched.append(result.value)
+        return fetched
+
+    def upsert(self, requests: Iterable[Request]) -> int:
+        """Insert or replace tickets in one transaction.
+
+        Returns:
+            Number of tickets that were not mirrored before.
+        """
+        now = self._clock()
+        rows = [_to_row(request) + (now,) for request in requests]
+        if not rows:
+            return 0
+        ids = [row[0] for row in rows]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                known = 0
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start : start + 500]
+                    known += self._conn.execute(
+                        f"SELECT COUNT(*) FROM requests WHERE x_request IN "
+                        f"({', '.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchone()[0]
+                self._conn.executemany(_UPSERT_SQL, rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(set(ids)) - known
+
+    def get(self, request_id: int) -> Request | None:
+        """Return a mirrored ticket, or None if it is not in the mirror."""
+        found = self.query("x_request = ?", (request_id,))
+        return found[0] if found else None
+
+    def history(self, request_id: int) -> list[RequestHistory]:
+        """Return the stored history of a ticket, oldest first.
+
+        History is stored by ``client.requests.history()`` and
+        ``history_many()`` when the client has this mirror.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM request_history WHERE x_request = ? ORDER BY x_request_history",
+                (request_id,),
+            ).fetchall()
+        return [RequestHistory.model_validate(json.loads(row[0])) for row in rows]
+
+    def last_history_id(self, request_id: int) -> int | None:
+        """Return the newest stored xRequestHistory of a ticket, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(x_request_history) FROM request_history WHERE x_request = ?",
+                (request_id,),
+            ).fetchone()
+        return None if row[0] is None else int(row[0])
+
+    def store_history(self, request_id: int, items: Iterable[dict[str, Any]]) -> None:
+        """Store a ticket's history items (API rows), replacing known ones."""
+        rows = [
+            (int(item["xRequestHistory"]), request_id, json.dumps(item, ensure_ascii=False))
+            for item in items
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO request_history "
+                    "(x_request_history, x_request, item) VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def search(
+        self,
+        text: str | None = None,
+        email: str | None = None,
+        status: str | None = None,
+        category: str | None = None,
+        assigned_to: str | None = None,
+        is_open: bool | None = None,
+        is_urgent: bool | None = None,
+        opened_after: int | None = None,
+        opened_before: int | None = None,
+        limit: int | None = None,
+    ) -> list[Request]:
+        """Find mirrored tickets.
+
+        With ``text``, tickets containing every word in their title, note
+        or customer name, email, user ID or phone are returned best match
+        first (title matches rank highest); otherwise newest first. Status,
+        category and assignee are matched by name, as the mirror stores them.
+
+        Args:
+            text: Words to search for. See fts_query().
+            email: Customer email.
+            status: Status name, such as "Active".
+            category: Category name.
+            assigned_to: Assigned staff name.
+            is_open: Open (True) or closed (False) tickets only.
+            is_urgent: Urgent (True) or non-urgent (False) tickets only.
+            opened_after: Opened at or after this Unix timestamp.
+            opened_before: Opened before this Unix timestamp.
+            limit: Maximum number of tickets.
+
+        Example:
+            >>> mirror.search("printer on fire", is_open=True, limit=10)
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("email", email),
+            ("status", status),
+            ("category", category),
+            ("person_assigned_to", assigned_to),
+            ("is_open", is_open),
+            ("is_urgent", is_urgent),
+        ):
+            if value is not None:
+                conditions.append(f"requests.{column} = ?")
+                params.append(int(value) if isinstance(value, bool) else value)
+        if opened_after is not None:
+            conditions.append("requests.opened_date >= ?")
+            params.append(opened_after)
+        if opened_before is not None:
+            conditions.append("requests.opened_date < ?")
+            params.append(opened_before)
+
+        order_by = "opened_date DESC, x_request DESC"
+        join = ""
+        join_params: list[Any] = []
+        words = (text or "").split()
+        if words and self.has_fts:
+            join = (
+                f"JOIN (SELECT rowid AS hit_id, {_BM25} AS hit_rank FROM requests_fts "
+                f"WHERE requests_fts MATCH ?) ON hit_id = requests.x_request"
+            )
+            join_params.append(fts_query(" ".join(words)))
+            order_by = "hit_rank, opened_date DESC, x_request DESC"
+        elif words:
+            # No FTS5 in this SQLite build: every word must appear somewhere
+            like = " OR ".join(f"requests.{name} LIKE ? ESCAPE '\\'" for name in TEXT_COLUMNS)
+            for word in words:
+                conditions.append(f"({like})")
+                params.extend([_like_pattern(word.rstrip("*"))] * len(TEXT_COLUMNS))
+        return self._select(" AND ".join(conditions), join_params + params, order_by, limit, join)
+
+    def names(self, column: str) -> list[str]:
+        """Return the distinct names stored in a column, sorted.
+
+        Args:
+            column: "status", "category" or "person_assigned_to".
+
+        Raises:
+            ValueError: If the column is not one of these.
+
+        Example:
+            >>> mirror.names("status")
+            ['Active', 'Problem Solved']
+        """
+        if column not in NAME_COLUMNS:
+            raise ValueError(
+                f"Unknown name column '{column}'. Use one of: {', '.join(NAME_COLUMNS)}"
+            )
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {column} FROM requests WHERE {column} IS NOT NULL "
+                f"ORDER BY {column}"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        where: str = "",
+        params: Sequence[Any] = (),
+        order_by: str = "opened_date DESC, x_request DESC",
+        limit: int | None = None,
+    ) -> list[Request]:
+        """Run a SQL query against the mirror.
+
+        Columns are named after Request attributes (``x_request``,
+        ``status``, ``opened_date``, ...); flags are stored as 0/1 and dates
+        as Unix timestamps.
+
+        Args:
+            where: SQL condition, with ``?`` placeholders.
+            params: Values for the placeholders.
+            order_by: SQL ORDER BY clause.
+            limit: Maximum number of tickets.
+
+        Returns:
+            Matching tickets as Request objects.
+
+        Example:
+            >>> mirror.query("closed_date - opened_date > ?", [7 * 86400], limit=10)
+        """
+        return self._select(where, params, order_by, limit)
+
+    def _select(
+        self,
+        where: str,
+        params: Sequence[Any],
+        order_by: str,
+        limit: int | None,
+        join: str = "",
+    ) -> list[Request]:
+        sql = f"SELECT {', '.join(f'requests.{name}' for name in COLUMNS)} FROM requests {join}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        return [Request.model_validate(dict(row)) for row in rows]
+
+    def _set_state(self, key: str, value: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def _result(self, fetched: int, created: int, full: bool, started: float) -> SyncResult:
+        high_id, high_opened = self.high_water()
+        return SyncResult(
+            fetched=fetched,
+            created=created,
+            updated=fetched - created,
+            full=full,
+            seconds=self._clock() - started,
+            high_water_id=high_id,
+            high_water_opened=high_opened,
+        )
+
+
+def _like_pattern(word: str) -> str:
+    """Return a LIKE pattern matching ``word`` anywhere, with wildcards escaped."""
+    escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _to_row(request: Request) -> tuple[Any, ...]:
+    """Return a request's column values, with flags as 0/1."""
+    values = []
+    for name in COLUMNS:
+        value = getattr(request, name)
+        if name in _FLAG_FIELDS and value is not None:
+            value = int(value)
+        values.append(value)
+    return tuple(values)
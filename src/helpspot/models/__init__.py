@@ -7,7 +7,7 @@ from .common import FileAttachment, HelpSpotBaseModel
 from .custom_field import CustomField
 from .customer import Customer
 from .filter import Filter
-from .request import Request, RequestCreate, RequestHistory, RequestUpdate
+from .request import LazyRequest, Request, RequestCreate, RequestHistory, RequestUpdate
 from .status_type import StatusType
 from .version import VersionInfo
 
@@ -15,6 +15,7 @@ __all__ = [
     "HelpSpotBaseModel",
     "FileAttachment",
     "Request",
+    "LazyRequest",
     "RequestHistory",
     "RequestCreate",
     "RequestUpdate",
@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import Any, TypeVar
+
 from pydantic import BaseModel, ConfigDict
 
+M = TypeVar("M", bound="HelpSpotBaseModel")
+
+
+@cache
+def _alias_table(model: type[BaseModel]) -> tuple[dict[str, str], dict[str, Any]]:
+    """Map API field names (aliases) to attribute names, and attributes to defaults."""
+    aliases: dict[str, str] = {}
+    defaults: dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        aliases[field.alias or name] = name
+        aliases[name] = name
+        if field.is_required():
+            defaults[name] = None
+        else:
+            defaults[name] = field.get_default(call_default_factory=True)
+    return aliases, defaults
+
 
 class HelpSpotBaseModel(BaseModel):
     """Base model for all HelpSpot data models.
@@ -13,6 +33,36 @@ class HelpSpotBaseModel(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    @classmethod
+    def construct_trusted(cls: type[M], data: dict[str, Any]) -> M:
+        """Build a model from trusted API data without validation.
+
+        Like ``model_construct`` but keyed by API field names, and faster
+        because aliases are resolved from a per-class table. Values are
+        stored as given (no type coercion: flags stay 0/1, dates stay raw)
+        and unknown keys are dropped.
+
+        Args:
+            data: One record as returned by the API.
+
+        Returns:
+            The model instance.
+        """
+        aliases, defaults = _alias_table(cls)
+        values = dict(defaults)
+        fields_set = set()
+        for key, value in data.items():
+            name = aliases.get(key)
+            if name is not None:
+                values[name] = value
+                fields_set.add(name)
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
 
 class FileAttachment(HelpSpotBaseModel):
     """Represents a file attachment."""
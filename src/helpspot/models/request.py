@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
-from pydantic import Field, field_validator
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Any
+
+from pydantic import Field, TypeAdapter, ValidationInfo, field_validator
+
+from helpspot.dates import DateParser, coerce_timestamp, to_datetime
 
 from .common import HelpSpotBaseModel
 
+#: Request fields holding dates, parsed into Unix timestamps.
+DATE_FIELDS: tuple[str, ...] = ("opened_date", "closed_date", "trashed_date")
+
+
+def _date_parser(info: ValidationInfo) -> DateParser | None:
+    """Return the DateParser passed in the validation context, if any."""
+    return (info.context or {}).get("date_parser")
+
+
+def _as_datetime(value: int | str | None) -> datetime | None:
+    """Convert a parsed date field; None if unset or kept as an unparseable string."""
+    return to_datetime(value) if isinstance(value, int) else None
+
 
 class Request(HelpSpotBaseModel):
     """Represents a HelpSpot request/ticket."""
@@ -35,19 +55,38 @@ class Request(HelpSpotBaseModel):
     note: str | None = Field(default=None, alias="tNote")
     access_key: str | None = Field(default=None, alias="accesskey")
 
-    @field_validator("opened_date", "closed_date", "trashed_date", mode="before")
+    @field_validator("opened_via_id", "is_open", "is_urgent", "is_trash", mode="before")
+    @classmethod
+    def empty_to_none(cls, v: Any) -> Any:
+        """Treat an empty value (an empty element in XML output) as missing."""
+        return None if v == "" else v
+
+    @field_validator(*DATE_FIELDS, mode="before")
     @classmethod
-    def parse_date_field(cls, v: int | str | None) -> int | None:
-        """Parse date fields - accept both timestamps and formatted strings."""
-        if v is None or v == "":
-            return None
-        if isinstance(v, int):
-            return v
-        if isinstance(v, str):
-            # If it's a formatted date string, return None (we can't parse it without knowing format)
-            # In production, you might want to parse these properly
-            return None
-        return None
+    def parse_date_field(cls, v: int | str | None, info: ValidationInfo) -> int | str | None:
+        """Parse date fields - accept both timestamps and formatted strings.
+
+        Formatted dates (sent without fRawValues) are parsed into Unix
+        timestamps by the client's DateParser, passed as the "date_parser"
+        validation context, or else helpspot.dates.default_parser. A date in
+        no known format is logged and kept as the raw string.
+        """
+        return coerce_timestamp(v, _date_parser(info))
+
+    @property
+    def opened_at(self) -> datetime | None:
+        """When the request was opened, as an aware UTC datetime (None if unparseable)."""
+        return _as_datetime(coerce_timestamp(self.opened_date))
+
+    @property
+    def closed_at(self) -> datetime | None:
+        """When the request was closed, as an aware UTC datetime (None if unparseable)."""
+        return _as_datetime(coerce_timestamp(self.closed_date))
+
+    @property
+    def trashed_at(self) -> datetime | None:
+        """When the request was trashed, as an aware UTC datetime (None if unparseable)."""
+        return _as_datetime(coerce_timestamp(self.trashed_date))
 
 
 class RequestHistory(HelpSpotBaseModel):
@@ -56,7 +95,7 @@ class RequestHistory(HelpSpotBaseModel):
     x_request_history: int = Field(alias="xRequestHistory")
     x_request: int = Field(alias="xRequest")
     x_person: str | None = Field(default=None, alias="xPerson")
-    change_date: str | None = Field(default=None, alias="dtGMTChange")
+    change_date: int | str | None = Field(default=None, alias="dtGMTChange")
     is_public: bool = Field(alias="fPublic")
     is_initial: bool = Field(alias="fInitial")
     log: str | None = Field(default=None, alias="tLog")
@@ -65,6 +104,17 @@ class RequestHistory(HelpSpotBaseModel):
     is_html: bool = Field(alias="fNoteIsHTML")
     is_merged: bool = Field(alias="fMergedFromRequest")
 
+    @field_validator("change_date", mode="before")
+    @classmethod
+    def parse_date_field(cls, v: int | str | None, info: ValidationInfo) -> int | str | None:
+        """Parse the change date into a Unix timestamp. See Request.parse_date_field."""
+        return coerce_timestamp(v, _date_parser(info))
+
+    @property
+    def changed_at(self) -> datetime | None:
+        """When the change was made, as an aware UTC datetime (None if unparseable)."""
+        return _as_datetime(coerce_timestamp(self.change_date))
+
 
 class RequestCreate(HelpSpotBaseModel):
     """Parameters for creating a request."""
@@ -76,7 +126,9 @@ class RequestCreate(HelpSpotBaseModel):
     user_id: str | None = None
     email: str | None = None
     phone: str | None = None
+    title: str | None = None
     is_urgent: bool = False
+    portal_id: int | None = None
     custom_fields: dict[int, str] | None = None
 
 
@@ -91,3 +143,146 @@ class RequestUpdate(HelpSpotBaseModel):
     status_id: int | None = None
     is_open: bool | None = None
     is_urgent: bool | None = None
+    title: str | None = None
+    custom_fields: dict[int, str] | None = None
+
+
+@lru_cache(maxsize=32)
+def request_converters(
+    date_parser: DateParser | None = None,
+) -> dict[str, tuple[str, bool, Callable[[Any], Any]]]:
+    """Map Request attribute names to (API field name, required, converter).
+
+    Each converter applies the field's "before" validators and then validates
+    the value against the field's type, as Request itself would.
+
+    Args:
+        date_parser: Parser for formatted dates, as passed to Request in the
+            "date_parser" validation context.
+    """
+    before: dict[str, list[Callable[[Any], Any]]] = {
+        name: [partial(coerce_timestamp, parser=date_parser)] for name in DATE_FIELDS
+    }
+    for decorator in Request.__pydantic_decorators__.field_validators.values():
+        if decorator.info.mode == "before":
+            for name in decorator.info.fields:
+                if name not in DATE_FIELDS:
+                    before.setdefault(name, []).append(decorator.func)
+
+    def converter(
+        validate: Callable[[Any], Any], validators: list[Callable[[Any], Any]]
+    ) -> Callable[[Any], Any]:
+        def convert(value: Any) -> Any:
+            for validator in validators:
+                value = validator(value)
+            return validate(value)
+
+        return convert
+
+    return {
+        name: (
+            field.alias or name,
+            field.is_required(),
+            converter(TypeAdapter(field.annotation).validate_python, before.get(name, [])),
+        )
+        for name, field in Request.model_fields.items()
+    }
+
+
+class _LazyField:
+    """Descriptor converting one LazyRequest field on first access."""
+
+    __slots__ = ("name", "alias", "required")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.alias, self.required, _ = request_converters()[name]
+
+    def __get__(self, view: LazyRequest | None, owner: type | None = None) -> Any:
+        if view is None:
+            return self
+        values = view._values
+        try:
+            return values[self.name]
+        except KeyError:
+            pass
+        data = view._data
+        if self.alias in data:
+            value = view._converters[self.name][2](data[self.alias])
+        elif self.name in data:
+            value = view._converters[self.name][2](data[self.name])
+        elif self.required:
+            # Raise the same error eager validation would
+            view.to_request()
+        else:
+            value = Request.model_fields[self.name].get_default(call_default_factory=True)
+        values[self.name] = value
+        return value
+
+
+class LazyRequest:
+    """Read-only view of a raw request row that converts fields on first access.
+
+    Attributes have the same names, types and validation as on Request, but
+    each field is only validated when it is first read and then cached, so
+    code touching a few fields of many rows does not pay for the rest (such
+    as long note bodies).
+
+    Example:
+        >>> view = LazyRequest({"xRequest": "12345", "fOpen": "1", "tNote": "..."})
+        >>> view.x_request, view.is_open
+        (12345, True)
+        >>> request = view.to_request()  # full validation
+    """
+
+    __slots__ = ("_data", "_values", "_date_parser", "_converters")
+
+    def __init__(self, data: dict[str, Any], date_parser: DateParser | None = None) -> None:
+        """Wrap a request row.
+
+        Args:
+            data: One request as returned by the API, keyed by HelpSpot field names.
+            date_parser: Parser for formatted dates. Defaults to
+                helpspot.dates.default_parser.
+        """
+        self._data = data
+        self._values: dict[str, Any] = {}
+        self._date_parser = date_parser
+        self._converters = request_converters(date_parser)
+
+    def __getattr__(self, name: str) -> Any:
+        """Fields are descriptors; anything else reaching here does not exist."""
+        raise AttributeError(f"'LazyRequest' object has no attribute '{name}'")
+
+    def __repr__(self) -> str:
+        """Show the request ID without converting anything else."""
+        return f"LazyRequest(xRequest={self._data.get('xRequest')!r})"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The wrapped response row."""
+        return self._data
+
+    def to_request(self) -> Request:
+        """Validate every field and return a full Request."""
+        return Request.model_validate(self._data, context={"date_parser": self._date_parser})
+
+    @property
+    def opened_at(self) -> datetime | None:
+        """When the request was opened. See Request.opened_at."""
+        return _as_datetime(self.opened_date)
+
+    @property
+    def closed_at(self) -> datetime | None:
+        """When the request was closed. See Request.closed_at."""
+        return _as_datetime(self.closed_date)
+
+    @property
+    def trashed_at(self) -> datetime | None:
+        """When the request was trashed. See Request.trashed_at."""
+        return _as_datetime(self.trashed_date)
+
+
+for _name in Request.model_fields:
+    setattr(LazyRequest, _name, _LazyField(_name))
+del _name
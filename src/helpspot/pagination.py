@@ -0,0 +1,234 @@
+"""Helpers for walking paginated (start/length) API results."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger("helpspot")
+
+T = TypeVar("T")
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], list[T]],
+    start: int = 0,
+    page_size: int = 100,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Yield items from consecutive pages until a short page is returned.
+
+    While the caller consumes one page, the next page is fetched (and parsed)
+    on a background thread, so at most two pages are held in memory.
+
+    Args:
+        fetch_page: Callable taking (start, length) and returning one page.
+        start: Offset of the first item.
+        page_size: Number of items requested per page.
+        prefetch: Fetch the next page in the background. Default: True.
+
+    Yields:
+        Items in page order.
+
+    Raises:
+        ValueError: If page_size is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    if not prefetch:
+        offset = start
+        while True:
+            page = fetch_page(offset, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="helpspot-prefetch")
+    pending: Future[list[T]] | None = executor.submit(fetch_page, start, page_size)
+    offset = start
+    try:
+        while pending is not None:
+            page = pending.result()
+            pending = None
+            if len(page) >= page_size:
+                offset += page_size
+                logger.debug(f"Prefetching page at offset {offset}")
+                pending = executor.submit(fetch_page, offset, page_size)
+            yield from page
+    finally:
+        # Don't wait on a prefetch the caller no longer needs
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int, int], Awaitable[list[T]]],
+    start: int = 0,
+    page_size: int = 100,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """Asyncio version of iter_pages.
+
+    The next page is fetched in a task while the caller consumes the current
+    one.
+
+    Args:
+        fetch_page: Coroutine function taking (start, length) and returning one page.
+        start: Offset of the first item.
+        page_size: Number of items requested per page.
+        prefetch: Fetch the next page concurrently. Default: True.
+
+    Yields:
+        Items in page order.
+
+    Raises:
+        ValueError: If page_size is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    offset = start
+    pending: asyncio.Future[list[T]] | None = asyncio.ensure_future(fetch_page(offset, page_size))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            more = len(page) >= page_size
+            if more:
+                offset += page_size
+            if more and prefetch:
+                pending = asyncio.ensure_future(fetch_page(offset, page_size))
+            for item in page:
+                yield item
+            if more and not prefetch:
+                pending = asyncio.ensure_future(fetch_page(offset, page_size))
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def iter_pages_concurrent(
+    fetch_page: Callable[[int, int], list[T]],
+    total: int,
+    start: int = 0,
+    page_size: int = 100,
+    concurrency: int = 4,
+) -> Iterator[T]:
+    """Yield items from pages fetched concurrently when the total is known.
+
+    Offsets covering ``total`` items are fetched by up to ``concurrency``
+    worker threads, and pages are yielded in offset order. At most
+    ``concurrency`` pages are buffered. If the last expected page is full
+    (the total was stale), the remaining pages are walked with iter_pages.
+
+    Args:
+        fetch_page: Callable taking (start, length) and returning one page.
+        total: Expected number of items from ``start`` onwards.
+        start: Offset of the first item.
+        page_size: Number of items requested per page.
+        concurrency: Maximum number of pages in flight.
+
+    Yields:
+        Items in page order.
+
+    Raises:
+        ValueError: If page_size or concurrency is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    if total <= 0:
+        yield from iter_pages(fetch_page, start, page_size)
+        return
+
+    offsets = iter(range(start, start + total, page_size))
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="helpspot-page")
+    window: deque[Future[list[T]]] = deque()
+    last_full = False
+    next_offset = start
+    try:
+        for offset in offsets:
+            window.append(executor.submit(fetch_page, offset, page_size))
+            if len(window) >= concurrency:
+                break
+
+        while window:
+            page = window.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                window.append(executor.submit(fetch_page, offset, page_size))
+            last_full = len(page) >= page_size
+            next_offset += page_size
+            yield from page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if last_full:
+        logger.debug(f"Expected total exceeded, continuing from offset {next_offset}")
+        yield from iter_pages(fetch_page, next_offset, page_size)
+
+
+async def aiter_pages_concurrent(
+    fetch_page: Callable[[int, int], Awaitable[list[T]]],
+    total: int,
+    start: int = 0,
+    page_size: int = 100,
+    concurrency: int = 4,
+) -> AsyncIterator[T]:
+    """Asyncio version of iter_pages_concurrent.
+
+    Args:
+        fetch_page: Coroutine function taking (start, length) and returning one page.
+        total: Expected number of items from ``start`` onwards.
+        start: Offset of the first item.
+        page_size: Number of items requested per page.
+        concurrency: Maximum number of pages in flight.
+
+    Yields:
+        Items in page order.
+
+    Raises:
+        ValueError: If page_size or concurrency is not positive.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    if total <= 0:
+        async for item in aiter_pages(fetch_page, start, page_size):
+            yield item
+        return
+
+    offsets = iter(range(start, start + total, page_size))
+    window: deque[asyncio.Future[list[T]]] = deque()
+    last_full = False
+    next_offset = start
+    try:
+        for offset in offsets:
+            window.append(asyncio.ensure_future(fetch_page(offset, page_size)))
+            if len(window) >= concurrency:
+                break
+
+        while window:
+            page = await window.popleft()
+            offset = next(offsets, None)
+            if offset is not None:
+                window.append(asyncio.ensure_future(fetch_page(offset, page_size)))
+            last_full = len(page) >= page_size
+            next_offset += page_size
+            for item in page:
+                yield item
+    finally:
+        for pending in window:
+            pending.cancel()
+
+    if last_full:
+        logger.debug(f"Expected total exceeded, continuing from offset {next_offset}")
+        async for item in aiter_pages(fetch_page, next_offset, page_size):
+            yield item
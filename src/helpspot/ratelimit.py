@@ -0,0 +1,246 @@
+"""Client-side rate limiting with token buckets."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger("helpspot")
+
+
+def _refill(level: float, elapsed: float, rate: float, burst: float) -> float:
+    return min(burst, level + max(0.0, elapsed) * rate)
+
+
+class Bucket(Protocol):
+    """A token bucket that hands out reservations."""
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        ...
+
+
+class TokenBucket:
+    """Thread-safe in-process token bucket.
+
+    Tokens accrue at ``rate`` per second up to ``burst``. A reservation
+    always succeeds and may drive the balance negative; the caller then
+    waits until the balance would have recovered, so waiters are served in
+    the order they asked.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity. Defaults to max(1, rate).
+            clock: Monotonic time source (for tests).
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+        self._clock = clock
+        self._level = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._level = _refill(self._level, now - self._updated, self.rate, self.burst)
+            self._updated = now
+            self._level -= tokens
+            level = self._level
+        return max(0.0, -level / self.rate)
+
+
+class SQLiteTokenBucket:
+    """Token bucket stored in an SQLite database shared by several processes.
+
+    Every reservation runs in an exclusive transaction, so all processes on
+    a host using the same file and name draw from one budget. Uses wall-clock
+    time, which must therefore be consistent across the processes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        name: str,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open (and create if needed) the bucket.
+
+        Args:
+            path: SQLite database file.
+            name: Bucket name; processes using the same name share the budget.
+            rate: Tokens added per second.
+            burst: Bucket capacity. Defaults to max(1, rate).
+            clock: Wall-clock time source (for tests).
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.path = Path(path)
+        self.name = name
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        if self.burst <= 0:
+            raise ValueError("burst must be positive")
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = self._clock()
+                level = (
+                    self.burst
+                    if row is None
+                    else _refill(row[0], now - row[1], self.rate, self.burst)
+                )
+                level -= tokens
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self.name, level, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return max(0.0, -level / self.rate)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class RateLimiter:
+    """Limit API calls to a rate plus burst, overall and per API method.
+
+    One limiter can be shared by any number of threads, tasks and clients.
+    With ``shared_path`` the budgets live in an SQLite file so that several
+    worker processes on one host share them too.
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     rate=10,
+        ...     burst=20,
+        ...     per_method={"private.request.search": (1, 2)},
+        ...     shared_path="/var/tmp/helpspot-ratelimit.sqlite3",
+        ... )
+        >>> client = HelpSpotClient(base_url="...", api_token="...", rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        per_method: dict[str, float | tuple[float, float]] | None = None,
+        shared_path: str | Path | None = None,
+        name: str = "helpspot",
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Overall requests per second. None for no overall limit.
+            burst: Overall burst size. Defaults to max(1, rate).
+            per_method: Extra limits per HelpSpot API method, as a rate or a
+                (rate, burst) tuple.
+            shared_path: SQLite file for budgets shared across processes.
+            name: Prefix for bucket names in the shared file; use a distinct
+                name per server or API token.
+        """
+        self.shared_path = shared_path
+        self.name = name
+        self._buckets: dict[str | None, Bucket] = {}
+        if rate is not None:
+            self._buckets[None] = self._bucket("*", rate, burst)
+        for api_method, limit in (per_method or {}).items():
+            method_rate, method_burst = limit if isinstance(limit, tuple) else (limit, None)
+            self._buckets[api_method] = self._bucket(api_method, method_rate, method_burst)
+
+    def _bucket(self, key: str, rate: float, burst: float | None) -> Bucket:
+        if self.shared_path is None:
+            return TokenBucket(rate, burst)
+        return SQLiteTokenBucket(self.shared_path, f"{self.name}:{key}", rate, burst)
+
+    def reserve(self, api_method: str) -> float:
+        """Take a token for one call and return the seconds to wait."""
+        delay = 0.0
+        for key in (None, api_method):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                delay = max(delay, bucket.reserve())
+        return delay
+
+    def acquire(self, api_method: str) -> None:
+        """Block until a call to the API method is allowed."""
+        delay = self.reserve(api_method)
+        if delay > 0:
+            logger.debug(f"Rate limited {api_method}, waiting {delay:.3f}s")
+            time.sleep(delay)
+
+    async def areserve(self, api_method: str) -> float:
+        """Asyncio version of reserve.
+
+        Shared buckets are reserved in a worker thread: their SQLite
+        transaction can wait on other processes, which must not stall the
+        event loop. In-process buckets are reserved inline.
+        """
+        delay = 0.0
+        for key in (None, api_method):
+            bucket = self._buckets.get(key)
+            if isinstance(bucket, SQLiteTokenBucket):
+                delay = max(delay, await asyncio.to_thread(bucket.reserve))
+            elif bucket is not None:
+                delay = max(delay, bucket.reserve())
+        return delay
+
+    async def aacquire(self, api_method: str) -> None:
+        """Wait without blocking the event loop until a call is allowed."""
+        delay = await self.areserve(api_method)
+        if delay > 0:
+            logger.debug(f"Rate limited {api_method}, waiting {delay:.3f}s")
+            await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """Release shared budget files."""
+        for bucket in self._buckets.values():
+            if isinstance(bucket, SQLiteTokenBucket):
+                bucket.close()
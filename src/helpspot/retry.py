@@ -0,0 +1,115 @@
+"""Retrying failed HTTP requests with exponential backoff."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+#: Statuses that usually mean "try again later" rather than a bad request.
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+#: Transport failures worth another attempt: the connection could not be made,
+#: timed out, or was dropped by the server. Pool timeouts, proxy errors,
+#: unsupported protocols and the like are not retried.
+RETRY_ERRORS: tuple[type[httpx.TransportError], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+        now: Current Unix time (for tests).
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Transport errors in RETRY_ERRORS (connection failures, timeouts, dropped
+    connections) and responses with a status in ``statuses`` are retried
+    with capped exponential backoff and full jitter: attempt ``n`` waits a
+    random time between 0 and ``min(backoff_max, backoff_base * 2**n)``
+    seconds. A ``Retry-After``
+    header, when present, is used instead (capped at ``max_retry_after``).
+
+    GET requests are always safe to repeat. POST requests are only retried
+    for the API methods listed in ``retry_post_methods``, since repeating a
+    create or an update that reached the server adds a second ticket or note.
+
+    Example:
+        >>> client = HelpSpotClient(
+        ...     base_url="https://support.example.com",
+        ...     api_token="...",
+        ...     retry=RetryPolicy(max_retries=5, backoff_max=60),
+        ... )
+        >>> # Also retry creates (may duplicate tickets on a lost response)
+        >>> RetryPolicy(retry_post_methods=frozenset({"private.request.create"}))
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 120.0
+    statuses: frozenset[int] = RETRY_STATUSES
+    retry_post_methods: frozenset[str] = field(default_factory=frozenset)
+
+    def is_retryable(self, method: str, api_method: str, error: httpx.HTTPError) -> bool:
+        """Whether a failed request may be sent again."""
+        if method.upper() != "GET" and api_method not in self.retry_post_methods:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.statuses
+        return isinstance(error, RETRY_ERRORS)
+
+    def backoff(self, retry: int, error: httpx.HTTPError | None = None) -> float:
+        """Return the seconds to wait before the given retry (0-based).
+
+        Args:
+            retry: Number of retries already made.
+            error: The failure being retried; its Retry-After header is honoured.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**retry))
+
+    def next_delay(
+        self, retry: int, method: str, api_method: str, error: httpx.HTTPError
+    ) -> float | None:
+        """Return the delay before retrying, or None to give up.
+
+        Args:
+            retry: Number of retries already made.
+            method: HTTP method of the failed request.
+            api_method: HelpSpot API method of the failed request.
+            error: The failure.
+        """
+        if retry >= self.max_retries or not self.is_retryable(method, api_method, error):
+            return None
+        return self.backoff(retry, error)
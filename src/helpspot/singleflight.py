@@ -0,0 +1,123 @@
+"""Single-flight de-duplication of concurrent identical calls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+logger = logging.getLogger("helpspot")
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call between threads asking for the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait for it and receive its result (passed through
+    ``copy_result``) or exception. Once the call completes the key is
+    forgotten, so later callers start a new call.
+
+    Example:
+        >>> flight = SingleFlight(copy_result=copy.deepcopy)
+        >>> flight.do(("private.request.get", 123), lambda: fetch(123))
+    """
+
+    def __init__(self, copy_result: Callable[[T], T] | None = None) -> None:
+        """Initialize with no calls in flight.
+
+        Args:
+            copy_result: Applied to the result handed to each caller that
+                joined an in-flight call, so that callers do not share one
+                mutable object. None hands every caller the same object.
+        """
+        self.copy_result = copy_result
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run ``func`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call.
+            func: Function producing the result.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            logger.debug(f"Joining in-flight call for {key!r}")
+            return self._copy(future.result())
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def _copy(self, result: T) -> T:
+        return result if self.copy_result is None else self.copy_result(result)
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls)
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Asyncio version of SingleFlight.
+
+    The shared call runs in its own task, so cancelling one waiter does not
+    cancel the call for the others.
+    """
+
+    def __init__(self, copy_result: Callable[[T], T] | None = None) -> None:
+        """Initialize with no calls in flight. See SingleFlight."""
+        self.copy_result = copy_result
+        self._tasks: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func()`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call.
+            func: Coroutine function producing the result.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+            return await asyncio.shield(task)
+        logger.debug(f"Joining in-flight call for {key!r}")
+        result = await asyncio.shield(task)
+        return result if self.copy_result is None else self.copy_result(result)
+
+    def _done(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            task.exception()
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._tasks)
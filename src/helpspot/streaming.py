@@ -0,0 +1,402 @@
+"""Incremental parsing of request lists from a streamed JSON or XML response."""
+
+from __future__ import annotations
+
+import json
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Sequence
+from typing import Any
+
+from helpspot.codec import JSONDecoder, xml_value
+
+_WS = re.compile(rb"[ \t\r\n]*+")
+_STRING = re.compile(rb'"(?:[^"\\]++|\\.)*+"', re.S)
+_STRING_BODY = re.compile(rb'(?:[^"\\]++|\\.)*+', re.S)
+_SCALAR = re.compile(rb"[^,}\]\s]++")
+# Everything up to the next bracket, or to an unterminated string
+_SKIP = re.compile(rb'(?:[^"{}\[\]]++|"(?:[^"\\]++|\\.)*+")*+', re.S)
+
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_OPEN = frozenset(b"{[")
+_OPEN_BRACE = ord("{")
+_COMMA = ord(",")
+_CLOSE_BRACKET = ord("]")
+_FLAT_ATTEMPTS = 3
+
+
+class JSONItemScanner:
+    """Pull the elements of one array out of a JSON document fed in chunks.
+
+    ``path`` names the keys leading to the array, such as
+    ``("filter", "request")``. Each element is decoded as soon as its last
+    byte arrives and the bytes before it are dropped, so memory is bounded
+    by the largest element plus one chunk rather than by the document. A
+    single object at ``path`` (HelpSpot's form for one result) is returned
+    as the only element.
+
+    Values outside the path are skipped without being decoded. Brackets
+    inside strings are recognized with regular expressions, so long note
+    bodies are scanned in C rather than byte by byte.
+
+    Example:
+        >>> scanner = JSONItemScanner(("filter", "request"))
+        >>> scanner.feed(b'{"filter": {"request": [{"xRequest": 1}, {"xReq')
+        [{'xRequest': 1}]
+        >>> scanner.feed(b'uest": 2}]}}')
+        [{'xRequest': 2}]
+        >>> scanner.close()  # None: the array was found
+    """
+
+    def __init__(self, path: Sequence[str], loads: JSONDecoder = json.loads) -> None:
+        """Initialize the scanner.
+
+        Args:
+            path: Keys from the document root to the array.
+            loads: JSON decoder applied to each element's bytes.
+        """
+        self.path = tuple(path)
+        self._loads = loads
+        self._buf = bytearray()
+        self._pos = 0
+        # "key", "colon", "value", "comma" while walking down the path;
+        # then "items" inside the array, "single" for a lone object, "done"
+        self._state = "value"
+        self._depth = 0  # path keys matched so far
+        self._key: str | None = None
+        self._found = False
+        # Value being skipped or collected
+        self._skipping = False
+        self._start: int | None = None
+        self._nesting = 0
+        self._in_string = False
+
+    @property
+    def found(self) -> bool:
+        """Whether the value at ``path`` has been reached."""
+        return self._found
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add the next chunk and return the elements it completed.
+
+        Raises:
+            ValueError: If the document is not valid JSON where it is parsed.
+        """
+        buf = self._buf
+        if self._found:
+            # Before the array everything is kept for close(); after, only
+            # the element in progress
+            keep = self._pos if self._start is None else self._start
+            del buf[:keep]
+            self._pos -= keep
+            if self._start is not None:
+                self._start -= keep
+        buf += chunk
+        items: list[Any] = []
+        while self._state != "done" and self._step(items):
+            pass
+        return items
+
+    def close(self) -> bytes | None:
+        """Finish the document.
+
+        Returns:
+            None if the value at ``path`` was found. Otherwise the whole
+            document, for the caller to decode (it may be an error reply).
+
+        Raises:
+            ValueError: If the document ended inside the array.
+        """
+        if not self._found:
+            return bytes(self._buf)
+        if self._state != "done":
+            raise ValueError("JSON document ended before the end of the request list")
+        return None
+
+    def _step(self, items: list[Any]) -> bool:
+        """Advance by one token. Returns False when more data is needed."""
+        buf = self._buf
+        if self._skipping:
+            if not self._skip():
+                return False
+            self._skipping = False
+            if self._start is not None:
+                items.append(self._loads(bytes(buf[self._start : self._pos])))
+                self._start = None
+                if self._state == "single":
+                    self._state = "done"
+            return True
+
+        pos = _WS.match(buf, self._pos).end()  # type: ignore[union-attr]
+        if pos == len(buf):
+            self._pos = pos
+            return False
+        char = buf[pos]
+        state = self._state
+
+        if state == "items":
+            return self._items(pos, items)
+
+        if state == "key":
+            if char == ord("}"):
+                # The object on the path closed without the next key
+                self._state = "done"
+                return True
+            match = _STRING.match(buf, pos)
+            if match is None:
+                if char != _QUOTE:
+                    raise ValueError(f"Expected an object key at byte {pos}")
+                return False
+            self._key = json.loads(match.group())
+            self._pos = match.end()
+            self._state = "colon"
+            return True
+
+        if state == "colon":
+            if char != ord(":"):
+                raise ValueError(f"Expected ':' at byte {pos}")
+            self._pos = pos + 1
+            self._state = "value"
+            return True
+
+        if state == "comma":
+            if char == ord(","):
+                self._state = "key"
+            elif char == ord("}"):
+                self._state = "done"
+            else:
+                raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+            self._pos = pos + 1
+            return True
+
+        # state == "value": the value of self._key in an object on the path
+        on_path = self._depth == 0 or self._key == self.path[self._depth - 1]
+        if not on_path:
+            if not self._begin_value(pos, collect=False, items=items):
+                return False
+            self._state = "comma"
+            return True
+        if self._depth < len(self.path):
+            if char != ord("{"):
+                # The path does not exist in this document
+                self._state = "done"
+                return True
+            self._depth += 1
+            self._state = "key"
+            self._pos = pos + 1
+            return True
+        self._found = True
+        if char == ord("["):
+            self._state = "items"
+            self._pos = pos + 1
+            return True
+        if char == ord("{"):
+            self._state = "single"
+            return self._begin_value(pos, collect=True, items=items)
+        self._state = "done"  # null or another scalar: no elements
+        return True
+
+    def _items(self, pos: int, items: list[Any]) -> bool:
+        """Collect array elements from pos until more data is needed.
+
+        Request rows are flat objects, so the first "}" after a row's "{"
+        usually closes it. That guess is handed straight to the decoder; a
+        "}" inside a string or a nested object gives bytes that do not
+        decode, and the next "}" is tried. After a few misses, or if no
+        "}" has arrived yet, the element is scanned with _skip instead.
+        """
+        buf = self._buf
+        loads = self._loads
+        size = len(buf)
+        while True:
+            pos = _WS.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos == size:
+                self._pos = pos
+                return False
+            char = buf[pos]
+            if char == _COMMA:
+                pos += 1
+                continue
+            if char == _CLOSE_BRACKET:
+                self._state = "done"
+                self._pos = pos + 1
+                return True
+            if char == _OPEN_BRACE:
+                end = buf.find(b"}", pos)
+                for _ in range(_FLAT_ATTEMPTS):
+                    if end == -1:
+                        break
+                    try:
+                        item = loads(buf[pos : end + 1])
+                    except Exception:
+                        end = buf.find(b"}", end + 1)
+                        continue
+                    items.append(item)
+                    pos = end + 1
+                    break
+                else:
+                    end = -1
+                if end != -1:
+                    continue
+            self._pos = pos
+            return self._begin_value(pos, collect=True, items=items)
+
+    def _begin_value(self, pos: int, collect: bool, items: list[Any]) -> bool:
+        """Start skipping (or collecting) the value at pos."""
+        buf = self._buf
+        char = buf[pos]
+        if char == _QUOTE or char in _OPEN:
+            self._start = pos if collect else None
+            self._skipping = True
+            self._nesting = 0
+            self._in_string = False
+            self._pos = pos
+            return True
+        match = _SCALAR.match(buf, pos)
+        if match is None:
+            raise ValueError(f"Unexpected byte {chr(char)!r} at {pos}")
+        if match.end() == len(buf):
+            # The scalar may continue in the next chunk
+            self._pos = pos
+            return False
+        if collect:
+            items.append(self._loads(bytes(match.group())))
+        self._pos = match.end()
+        return True
+
+    def _skip(self) -> bool:
+        """Advance past the string or container being skipped.
+
+        Returns:
+            True once the value is complete, False if more data is needed.
+        """
+        buf = self._buf
+        end = len(buf)
+        pos = self._pos
+        while True:
+            if self._in_string:
+                pos = _STRING_BODY.match(buf, pos).end()  # type: ignore[union-attr]
+                if pos == end or buf[pos] == _BACKSLASH:
+                    # Unterminated, or an escape split across chunks
+                    self._pos = pos
+                    return False
+                pos += 1
+                self._in_string = False
+                if self._nesting == 0:
+                    self._pos = pos
+                    return True
+                continue
+            if self._nesting == 0 and buf[pos] == _QUOTE:
+                self._in_string = True
+                pos += 1
+                continue
+            pos = _SKIP.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos == end:
+                self._pos = pos
+                return False
+            char = buf[pos]
+            pos += 1
+            if char == _QUOTE:
+                self._in_string = True
+            elif char in _OPEN:
+                self._nesting += 1
+            else:
+                self._nesting -= 1
+                if self._nesting == 0:
+                    self._pos = pos
+                    return True
+
+
+class XMLItemScanner:
+    """Pull the elements at one path out of an XML document fed in chunks.
+
+    The XML counterpart of JSONItemScanner, built on ElementTree's
+    XMLPullParser (iterparse for data that arrives in chunks). ``path``
+    names the tags from the root to the repeated element, such as
+    ``("filter", "request")``; each element is converted with
+    helpspot.codec.xml_value on its end tag and then detached from the
+    tree, so memory is bounded by one element rather than the document.
+
+    Example:
+        >>> scanner = XMLItemScanner(("filter", "request"))
+        >>> scanner.feed(b"<filter><request><xRequest>1</xRequest></request><req")
+        [{'xRequest': '1'}]
+        >>> scanner.feed(b"uest><xRequest>2</xRequest></request></filter>")
+        [{'xRequest': '2'}]
+        >>> scanner.close()  # None: the path was found
+    """
+
+    def __init__(self, path: Sequence[str]) -> None:
+        """Initialize the scanner.
+
+        Args:
+            path: Tags from the root element to the repeated element.
+        """
+        self.path = tuple(path)
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+        self._matched = 0  # leading elements of the stack that follow the path
+        self._head: list[bytes] | None = []  # kept for close() until the path is found
+
+    @property
+    def found(self) -> bool:
+        """Whether the element containing the items has been reached."""
+        return self._head is None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add the next chunk and return the elements it completed.
+
+        Raises:
+            ValueError: If the document is not well-formed XML.
+        """
+        if self._head is not None:
+            self._head.append(chunk)
+        try:
+            self._parser.feed(chunk)
+        except ET.ParseError as e:
+            raise ValueError(str(e)) from e
+        return self._read()
+
+    def close(self) -> bytes | None:
+        """Finish the document.
+
+        Returns:
+            None if the path was found. Otherwise the whole document, for the
+            caller to decode (it may be an error reply).
+
+        Raises:
+            ValueError: If the document is truncated or not well-formed.
+        """
+        try:
+            self._parser.close()
+        except ET.ParseError as e:
+            raise ValueError(str(e)) from e
+        if self._head is not None:
+            return b"".join(self._head)
+        return None
+
+    def _read(self) -> list[Any]:
+        """Convert the parser's pending events into completed items."""
+        items: list[Any] = []
+        path = self.path
+        stack = self._stack
+        for event, element in self._parser.read_events():
+            if event == "start":
+                stack.append(element)
+                depth = len(stack)
+                if self._matched == depth - 1 and depth <= len(path):
+                    if element.tag == path[depth - 1]:
+                        self._matched = depth
+                        if depth == len(path) - 1:
+                            self._head = None
+                continue
+            depth = len(stack)
+            if self._matched == depth:
+                self._matched -= 1
+                if depth == len(path):
+                    items.append(xml_value(element))
+                    if depth > 1:
+                        stack[-2].remove(element)
+            stack.pop()
+        return items
@@ -0,0 +1,154 @@
+"""HTTP transports and connection pool settings."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import httpx
+
+logger = logging.getLogger("helpspot")
+
+
+def build_limits(
+    max_connections: int | None = 100,
+    max_keepalive_connections: int | None = 20,
+    keepalive_expiry: float | None = 5.0,
+) -> httpx.Limits:
+    """Return connection pool limits.
+
+    Args:
+        max_connections: Maximum open connections. None for no limit.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class _Lease(httpx.BaseTransport):
+    """One client's handle on a SharedTransport; closing it releases the handle."""
+
+    def __init__(self, shared: SharedTransport) -> None:
+        self._shared = shared
+        self._closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._shared.transport.handle_request(request)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._shared.release()
+
+
+class _AsyncLease(httpx.AsyncBaseTransport):
+    """One client's handle on an AsyncSharedTransport."""
+
+    def __init__(self, shared: AsyncSharedTransport) -> None:
+        self._shared = shared
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._shared.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self._shared.release()
+
+
+class SharedTransport:
+    """Connection pool shared by several HelpSpotClient instances.
+
+    Clients created with the same SharedTransport reuse each other's
+    connections (and TLS sessions) to the host. The pool is closed when the
+    last client using it is closed.
+
+    Example:
+        >>> transport = SharedTransport(max_connections=50, http2=True)
+        >>> tenant_a = HelpSpotClient(base_url=url, api_token=token_a, transport=transport)
+        >>> tenant_b = HelpSpotClient(base_url=url, api_token=token_b, transport=transport)
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        """Create the pool.
+
+        Args:
+            verify_ssl: Whether to verify SSL certificates.
+            http2: Multiplex requests over HTTP/2 (requires ``httpx[http2]``).
+            max_connections: Maximum open connections. None for no limit.
+            max_keepalive_connections: Maximum idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            transport: Transport to share instead of building one from the
+                options above.
+        """
+        self.transport = transport or httpx.HTTPTransport(
+            verify=verify_ssl,
+            http2=http2,
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        )
+        self._users = 0
+        self._lock = threading.Lock()
+
+    def lease(self) -> httpx.BaseTransport:
+        """Return a transport for one client; closing it releases this pool."""
+        with self._lock:
+            self._users += 1
+        return _Lease(self)
+
+    def release(self) -> None:
+        """Release one lease and close the pool after the last one."""
+        with self._lock:
+            self._users -= 1
+            last = self._users == 0
+        if last:
+            logger.debug("Closing shared transport")
+            self.transport.close()
+
+
+class AsyncSharedTransport:
+    """Connection pool shared by several AsyncHelpSpotClient instances.
+
+    See SharedTransport.
+    """
+
+    def __init__(
+        self,
+        verify_ssl: bool = True,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Create the pool. Takes the same arguments as SharedTransport."""
+        self.transport = transport or httpx.AsyncHTTPTransport(
+            verify=verify_ssl,
+            http2=http2,
+            limits=build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        )
+        self._users = 0
+
+    def lease(self) -> httpx.AsyncBaseTransport:
+        """Return a transport for one client; closing it releases this pool."""
+        self._users += 1
+        return _AsyncLease(self)
+
+    async def release(self) -> None:
+        """Release one lease and close the pool after the last one."""
+        self._users -= 1
+        if self._users == 0:
+            logger.debug("Closing shared transport")
+            await self.transport.aclose()
@@ -0,0 +1,251 @@
+"""Streaming file attachments into request.create/request.update form bodies."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import mimetypes
+import mmap
+import os
+from collections.abc import AsyncIterator, Generator, Iterator
+from contextlib import closing
+from pathlib import Path
+from typing import IO, Any
+
+from helpspot.exceptions import ValidationError
+
+#: One entry of the ``files`` argument of requests.create/update: a path, a
+#: binary file object, or a dict with "filename", "mime_type" and one of
+#: "content" (bytes), "path" or "file".
+FileSpec = dict[str, Any] | str | os.PathLike[str] | IO[bytes]
+
+#: Raw bytes base64-encoded per chunk. A multiple of 3, so chunks encode
+#: without padding and concatenate into one base64 string.
+CHUNK_SIZE = 3 * 256 * 1024
+
+
+class FileUpload:
+    """A file attachment read and base64-encoded chunk by chunk while sending.
+
+    The source is a path or a binary file object. Files on disk are
+    memory-mapped; other file objects (BytesIO, archive members) are read
+    with ``read()``. Only one
+    chunk (768 KiB, 1 MiB encoded) is held at a time, so memory does not
+    grow with the file. File objects are read from their position when the
+    upload is created, and rewound to it if the request is retried.
+
+    Example:
+        >>> upload = FileUpload("logs.zip")
+        >>> upload.filename, upload.mime_type, upload.size
+        ('logs.zip', 'application/zip', 52428800)
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike[str] | IO[bytes],
+        filename: str | None = None,
+        mime_type: str | None = None,
+    ) -> None:
+        """Initialize the upload.
+
+        Args:
+            source: Path of the file, or a binary file object. File objects
+                must be seekable so the size can be sent up front.
+            filename: Attachment name. Defaults to the file's base name.
+            mime_type: MIME type. Defaults to a guess from the filename, or
+                "application/octet-stream".
+
+        Raises:
+            ValidationError: If the file object is not seekable or has no name
+                to default the filename to.
+        """
+        self.source = source
+        name: str | None
+        if isinstance(source, str | os.PathLike):
+            self._start = 0
+            self.size = os.stat(source).st_size
+            name = os.fspath(source)
+        else:
+            if not source.seekable():
+                raise ValidationError("File objects must be seekable to be uploaded")
+            self._start = source.tell()
+            self.size = source.seek(0, io.SEEK_END) - self._start
+            source.seek(self._start)
+            name = getattr(source, "name", None)
+        if filename is None:
+            if not isinstance(name, str):
+                raise ValidationError("filename is required for file objects without a name")
+            filename = Path(name).name
+        self.filename = filename
+        self.mime_type = (
+            mime_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+
+    @property
+    def encoded_size(self) -> int:
+        """Length of the base64 encoding of the file."""
+        return (self.size + 2) // 3 * 4
+
+    def __repr__(self) -> str:
+        """Show the filename and size."""
+        return f"FileUpload(filename={self.filename!r}, size={self.size})"
+
+    def iter_base64(self) -> Generator[bytes, None, None]:
+        """Yield the file's base64 encoding in chunks.
+
+        Raises:
+            ValidationError: If the file is shorter than when the upload was
+                created (a longer file is cut at the original size).
+        """
+        if isinstance(self.source, str | os.PathLike):
+            with open(self.source, "rb") as file:
+                yield from self._encode(file, 0)
+        else:
+            yield from self._encode(self.source, self._start)
+
+    def _encode(self, file: IO[bytes], start: int) -> Iterator[bytes]:
+        end = start + self.size
+        mapped = _map(file) if self.size else None
+        if mapped is not None:
+            with mapped:
+                if len(mapped) < end:
+                    raise ValidationError(f"{self.filename} changed size during upload")
+                for pos in range(start, end, CHUNK_SIZE):
+                    yield base64.b64encode(mapped[pos : min(pos + CHUNK_SIZE, end)])
+            return
+        file.seek(start)
+        remaining = self.size
+        while remaining:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise ValidationError(f"{self.filename} changed size during upload")
+            # read() may return less than asked; keep chunks a multiple of 3
+            while len(chunk) % 3 and len(chunk) < remaining:
+                more = file.read(3 - len(chunk) % 3)
+                if not more:
+                    raise ValidationError(f"{self.filename} changed size during upload")
+                chunk += more
+            remaining -= len(chunk)
+            yield base64.b64encode(chunk)
+
+
+def _map(file: IO[bytes]) -> mmap.mmap | None:
+    """Memory-map the file behind a file object, or return None if it cannot be.
+
+    Only plain files qualify: wrappers such as gzip.GzipFile or tar members
+    report the fileno() of a file whose bytes are not theirs.
+    """
+    if type(file) not in (io.BufferedReader, io.BufferedRandom, io.FileIO):
+        return None
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return None
+
+
+def file_upload(file_info: FileSpec) -> FileUpload | None:
+    """Return a FileUpload for a ``files`` entry that names a path or file object.
+
+    Returns None for in-memory "content" entries.
+
+    Raises:
+        ValidationError: If the entry has no content, path or file.
+    """
+    if isinstance(file_info, dict):
+        if "content" in file_info:
+            return None
+        source = file_info.get("path", file_info.get("file"))
+        if source is None:
+            raise ValidationError("File entries need 'content', 'path' or 'file'")
+        return FileUpload(source, file_info.get("filename"), file_info.get("mime_type"))
+    return FileUpload(file_info)
+
+
+class MultipartForm:
+    """A multipart/form-data body for form data that contains FileUploads.
+
+    Attachments are sent as base64 text fields (File#_bFileBody), exactly
+    as in a urlencoded form, but without percent-encoding and with a
+    Content-Length known before any file is read. Iterating the form (or
+    async-iterating it) streams the body; each iteration starts over, so a
+    retried request sends the same bytes again.
+    """
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Initialize the form.
+
+        Args:
+            data: Form fields; values are strings or FileUploads.
+        """
+        self.boundary = os.urandom(16).hex()
+        self._parts: list[tuple[bytes, FileUpload | bytes]] = []
+        for name, value in data.items():
+            header = (
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            ).encode()
+            if not isinstance(value, FileUpload):
+                value = str(value).encode()
+            self._parts.append((header, value))
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Content-Type and Content-Length headers for the body."""
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(len(self)),
+        }
+
+    def __len__(self) -> int:
+        """Size of the body in bytes."""
+        size = len(self._closing)
+        for header, value in self._parts:
+            body = value.encoded_size if isinstance(value, FileUpload) else len(value)
+            size += len(header) + body + 2
+        return size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the body in chunks."""
+        for header, value in self._parts:
+            if isinstance(value, FileUpload):
+                yield header
+                yield from value.iter_base64()
+                yield b"\r\n"
+            else:
+                yield header + value + b"\r\n"
+        yield self._closing
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks, for httpx.AsyncClient.
+
+        Files are read and base64-encoded in a worker thread, one chunk at a
+        time, so a large attachment does not block the event loop.
+        """
+        for header, value in self._parts:
+            if isinstance(value, FileUpload):
+                yield header
+                with closing(value.iter_base64()) as chunks:
+                    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                        yield chunk
+                yield b"\r\n"
+            else:
+                yield header + value + b"\r\n"
+        yield self._closing
+
+
+def form_content(data: dict[str, Any] | None, asynchronous: bool = False) -> dict[str, Any]:
+    """Return httpx post() keyword arguments for sending form data.
+
+    Plain data is sent urlencoded; data holding FileUploads as a streamed
+    MultipartForm. Call once per attempt: the returned body is consumed by
+    sending it.
+
+    Args:
+        data: Form fields.
+        asynchronous: Return an async body, for httpx.AsyncClient.
+    """
+    if data is None or not any(isinstance(v, FileUpload) for v in data.values()):
+        return {"data": data}
+    form = MultipartForm(data)
+    return {"content": form.aiter() if asynchronous else iter(form), "headers": form.headers}
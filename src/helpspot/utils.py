@@ -4,6 +4,8 @@ import base64
 import logging
 from typing import Any
 
+from helpspot.uploads import FileSpec, file_upload
+
 logger = logging.getLogger("helpspot")
 
 
@@ -36,26 +38,38 @@ def prepare_custom_fields(custom_fields: dict[int, str] | None) -> dict[str, str
     return {f"Custom{field_id}": value for field_id, value in custom_fields.items()}
 
 
-def prepare_file_uploads(files: list[dict[str, Any]] | None) -> dict[str, str]:
+def prepare_file_uploads(files: list[FileSpec] | None) -> dict[str, Any]:
     """Prepare file uploads for API request.
 
     Args:
-        files: List of file dictionaries with keys:
-            - filename: str
-            - mime_type: str
-            - content: bytes
+        files: List of files, each one of:
+            - a path or binary file object, streamed from disk while the
+              request is sent (see helpspot.uploads.FileUpload)
+            - a dict with keys filename, mime_type and one of content
+              (bytes), path or file (streamed like the above)
 
     Returns:
-        Dictionary with File#_* keys ready for API submission.
+        Dictionary with File#_* keys ready for API submission. Streamed
+        bodies are FileUpload values, which make the request multipart.
+
+    Raises:
+        ValidationError: If a file entry has no content, path or file.
     """
     if not files:
         return {}
 
-    result: dict[str, str] = {}
+    result: dict[str, Any] = {}
     for idx, file_info in enumerate(files, start=1):
-        result[f"File{idx}_sFilename"] = file_info["filename"]
-        result[f"File{idx}_sFileMimeType"] = file_info["mime_type"]
-        result[f"File{idx}_bFileBody"] = encode_file_content(file_info["content"])
+        upload = file_upload(file_info)
+        if upload is not None:
+            result[f"File{idx}_sFilename"] = upload.filename
+            result[f"File{idx}_sFileMimeType"] = upload.mime_type
+            result[f"File{idx}_bFileBody"] = upload
+        elif isinstance(file_info, dict):
+            # Only "content" entries have no upload
+            result[f"File{idx}_sFilename"] = file_info["filename"]
+            result[f"File{idx}_sFileMimeType"] = file_info["mime_type"]
+            result[f"File{idx}_bFileBody"] = encode_file_content(file_info["content"])
 
     return result
 
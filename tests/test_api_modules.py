@@ -262,6 +262,86 @@ class TestFiltersAPI:
         assert len(requests) == 1
 
 
+def _filter_page(template: dict, request_ids: list[int]) -> dict:
+    """Build a private.filter.get payload containing the given IDs."""
+    row = template["filter"]["request"][0]
+    return {"filter": {"request": [{**row, "xRequest": i} for i in request_ids]}}
+
+
+class TestFiltersAPIGetAll:
+    """Tests for FiltersAPI.get_all()."""
+
+    def _mock_pages(self, httpx_mock, base_url, template, pages, length=2):
+        for start, ids in pages.items():
+            httpx_mock.add_response(
+                method="GET",
+                url=f"{base_url}/api/index.php?method=private.filter.get&xFilter=42&start={start}&length={length}&output=json",
+                json=_filter_page(template, ids),
+            )
+
+    def test_get_all_fetches_every_page_in_order(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        filter_get_data: dict,
+    ):
+        """Test concurrent fan-out keeps filter order and drops duplicates."""
+        # Row 2 shifted onto the second page between requests
+        pages = {0: [1, 2], 2: [2, 3], 4: [4]}
+        self._mock_pages(httpx_mock, base_url, filter_get_data, pages)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = list(client.filters.get_all("42", count=5, page_size=2, concurrency=3))
+
+        assert [r.x_request for r in requests] == [1, 2, 3, 4]
+
+    def test_get_all_uses_filter_count(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        filter_get_data: dict,
+    ):
+        """Test that the count is looked up from the filter list."""
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{base_url}/api/index.php?method=private.user.getFilters&output=json",
+            json={"filters": {"filter": {"xFilter": "42", "sFilterName": "Bugs", "count": 3}}},
+        )
+        self._mock_pages(httpx_mock, base_url, filter_get_data, {0: [1, 2], 2: [3]})
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = client.filters.get_all("42", page_size=2)
+        assert httpx_mock.get_requests() == []  # the count is looked up on iteration
+
+        assert [r.x_request for r in requests] == [1, 2, 3]
+
+    def test_get_all_validates_eagerly(self, base_url: str, api_token: str):
+        """Test that bad page options fail at call time, not on iteration."""
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        with pytest.raises(ValueError, match="page_size"):
+            client.filters.get_all("42", count=5, page_size=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            client.filters.get_all("42", count=5, concurrency=0)
+
+    def test_get_all_continues_past_stale_count(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        filter_get_data: dict,
+    ):
+        """Test that a full final page triggers serial pagination."""
+        pages = {0: [1, 2], 2: [3, 4], 4: [5]}
+        self._mock_pages(httpx_mock, base_url, filter_get_data, pages)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = list(client.filters.get_all("42", count=4, page_size=2))
+
+        assert [r.x_request for r in requests] == [1, 2, 3, 4, 5]
+
+
 class TestStatusTypesAPI:
     """Tests for StatusTypesAPI."""
 
@@ -0,0 +1,188 @@
+"""Tests for AsyncHelpSpotClient."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from helpspot import AsyncHelpSpotClient
+from helpspot.exceptions import APIError, AuthenticationRequiredError, ValidationError
+
+
+def test_async_client_initialization(base_url, api_token):
+    """Test async client initialization."""
+    client = AsyncHelpSpotClient(base_url=base_url, api_token=api_token)
+
+    assert client.base_url == base_url
+    assert client.requests is not None
+    assert client.filters is not None
+    assert client.status_types is not None
+
+    asyncio.run(client.aclose())
+
+
+def test_async_version(base_url, mock_version_response):
+    """Test the async version() method."""
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url) as client:
+            return await client.version()
+
+    version = asyncio.run(run())
+
+    assert version.version == "5.0"
+
+
+def test_async_get_request(base_url, api_token, mock_request_get_response):
+    """Test fetching a request with the async client."""
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return await client.requests.get(request_id=12745)
+
+    request = asyncio.run(run())
+
+    assert request.x_request == 12745
+    assert request.email == "john.doe@example.com"
+
+
+def test_async_concurrent_gets(base_url, api_token, httpx_mock, load_fixture):
+    """Test many concurrent calls on one event loop."""
+    for request_id in range(1, 21):
+        data = load_fixture("request_get.json")
+        data["request"]["xRequest"] = request_id
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.get&xRequest={request_id}&output=json",
+            json=data,
+        )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return await asyncio.gather(*(client.requests.get(request_id=i) for i in range(1, 21)))
+
+    requests = asyncio.run(run())
+
+    assert [r.x_request for r in requests] == list(range(1, 21))
+
+
+def test_async_search(base_url, api_token, httpx_mock, load_fixture):
+    """Test async search shares parsing with the sync client."""
+    httpx_mock.add_response(
+        url=f"{base_url}/api/index.php?method=private.request.search&start=0&length=50&orderByDir=desc&output=json",
+        json=load_fixture("request_search.json"),
+    )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return await client.requests.search()
+
+    requests = asyncio.run(run())
+
+    assert [r.x_request for r in requests] == [12745, 12746]
+
+
+def test_async_api_error_mapping(base_url, api_token, httpx_mock):
+    """Test that API error payloads raise APIError from the async client."""
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{base_url}/api/index.php?method=private.request.create&output=json",
+        json={"errors": {"error": {"id": 101, "description": "Required field missing"}}},
+    )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            await client.requests.create(note="Test note", category_id=1)
+
+    with pytest.raises(APIError) as exc_info:
+        asyncio.run(run())
+
+    assert exc_info.value.error_id == 101
+
+
+def test_async_requires_auth(base_url):
+    """Test that private methods require auth on the async client."""
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url) as client:
+            await client.filters.list()
+
+    with pytest.raises(AuthenticationRequiredError):
+        asyncio.run(run())
+
+
+def test_async_get_validation(base_url, api_token):
+    """Test argument validation on the async client."""
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            await client.requests.get()
+
+    with pytest.raises(ValidationError):
+        asyncio.run(run())
+
+
+def test_async_iter_search(base_url, api_token, httpx_mock, load_fixture):
+    """Test async iteration across pages."""
+    template = load_fixture("request_search.json")["requests"]["request"][0]
+    pages = {0: [1, 2], 2: [3]}
+    for start, ids in pages.items():
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.search&start={start}&length=2&orderByDir=desc&output=json",
+            json={"requests": {"request": [{**template, "xRequest": i} for i in ids]}},
+        )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return [r.x_request async for r in client.requests.iter_search(page_size=2)]
+
+    assert asyncio.run(run()) == [1, 2, 3]
+
+
+def test_async_filter_get_all(base_url, api_token, httpx_mock, load_fixture):
+    """Test async concurrent filter fan-out."""
+    row = load_fixture("filter_get.json")["filter"]["request"][0]
+    pages = {0: [1, 2], 2: [3, 4], 4: [5]}
+    for start, ids in pages.items():
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.filter.get&xFilter=inbox&start={start}&length=2&output=json",
+            json={"filter": {"request": [{**row, "xRequest": i} for i in ids]}},
+        )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return [
+                r.x_request async for r in client.filters.get_all("inbox", count=5, page_size=2)
+            ]
+
+    assert asyncio.run(run()) == [1, 2, 3, 4, 5]
+
+
+def test_async_filter_get_all_validates_eagerly(base_url, api_token):
+    """Test that bad page options fail when get_all() is called."""
+    client = AsyncHelpSpotClient(base_url=base_url, api_token=api_token)
+    with pytest.raises(ValueError, match="concurrency"):
+        client.filters.get_all("inbox", count=5, concurrency=0)
+
+
+def test_async_get_many(base_url, api_token, httpx_mock, load_fixture):
+    """Test async bulk retrieval with a per-ID failure."""
+    row = load_fixture("request_get.json")["request"]
+    for request_id in (1, 3):
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.get&xRequest={request_id}&output=json",
+            json={"request": {**row, "xRequest": request_id}},
+        )
+    httpx_mock.add_response(
+        url=f"{base_url}/api/index.php?method=private.request.get&xRequest=2&output=json",
+        status_code=500,
+    )
+
+    async def run():
+        async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            return [r async for r in client.requests.get_many([1, 2, 3], concurrency=2)]
+
+    results = asyncio.run(run())
+
+    assert [r.key for r in results] == [1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True]
@@ -0,0 +1,207 @@
+"""Tests for the columnar RequestBatch."""
+
+from __future__ import annotations
+
+import pydantic
+import pytest
+
+from helpspot import HelpSpotClient
+from helpspot.api.requests import parse_request_list
+from helpspot.batch import COLUMNS, RequestBatch
+from helpspot.models import Request
+
+ROWS = [
+    {
+        "xRequest": 1,
+        "xOpenedViaId": 3,
+        "xPersonAssignedTo": "Support Agent",
+        "fOpen": 1,
+        "xStatus": "Active",
+        "fUrgent": "0",
+        "xCategory": "Bugs",
+        "dtGMTOpened": 1700000000,
+        "sTitle": "First",
+    },
+    {
+        "xRequest": "2",
+        "fOpen": 0,
+        "xStatus": "Problem Solved",
+        "xCategory": "Bugs",
+        "dtGMTOpened": 1700000600,
+        "dtGMTClosed": 1700003600,
+        "sTitle": "Second",
+    },
+    {"xRequest": 3, "xStatus": "Active", "dtGMTOpened": ""},
+]
+
+
+class TestRequestBatch:
+    """Tests for building and reading a RequestBatch."""
+
+    def test_columns_match_models(self):
+        """Test that every column holds what Request would hold."""
+        batch = RequestBatch.from_rows(ROWS)
+        models = [Request(**row) for row in ROWS]
+
+        assert len(batch) == 3
+        for name in COLUMNS:
+            assert batch.column(name) == [getattr(m, name) for m in models], name
+
+    def test_dictionary_encoding(self):
+        """Test that repeated strings share one dictionary entry."""
+        batch = RequestBatch.from_rows(ROWS)
+
+        assert batch.dictionary("status") == ["Active", "Problem Solved"]
+        assert batch.dictionary("category") == ["Bugs"]
+        assert batch.column("category") == ["Bugs", "Bugs", None]
+
+    def test_iterates_requests(self):
+        """Test that iterating yields Request objects."""
+        batch = RequestBatch.from_rows(ROWS)
+
+        assert [r.x_request for r in batch] == [1, 2, 3]
+        assert list(batch)[1] == Request(**ROWS[1])
+
+    def test_invalid_row_raises(self):
+        """Test that rows Request would reject are rejected."""
+        with pytest.raises(pydantic.ValidationError):
+            RequestBatch.from_rows([{"sTitle": "no id"}])
+        with pytest.raises(pydantic.ValidationError):
+            RequestBatch.from_rows([{"xRequest": 1, "fOpen": "maybe"}])
+
+    def test_extend(self):
+        """Test that extend appends rows and keeps codes stable."""
+        batch = RequestBatch.from_rows(ROWS[:1])
+        batch.extend(ROWS[1:])
+
+        assert batch.column("x_request") == [1, 2, 3]
+        assert batch.column("status") == ["Active", "Problem Solved", "Active"]
+
+    def test_unparseable_dates(self, caplog):
+        """Test that a date in no known format does not fail a page."""
+        rows = [
+            {"xRequest": 1, "dtGMTOpened": "Sep 24 2007, 01:38 PM"},
+            {"xRequest": 2, "dtGMTOpened": "someday", "dtGMTClosed": "Sep 24 2007, 01:38 PM"},
+        ]
+        data = {"filter": {"request": rows}}
+
+        requests = parse_request_list(data, "filter")
+        batch = parse_request_list(data, "filter", "batch")
+        views = parse_request_list(data, "filter", "lazy")
+
+        assert [r.opened_date for r in requests] == [1190641080, "someday"]
+        assert requests[1].closed_date == 1190641080
+        assert [v.opened_date for v in views] == [1190641080, "someday"]
+        assert batch.column("opened_date") == [1190641080, None]
+        assert batch.column("closed_date") == [None, 1190641080]
+        assert rows[1]["dtGMTOpened"] == "someday"  # the response is not modified
+        assert caplog.text.count("'someday'") == 1
+
+    def test_client_timezone(self, base_url, api_token, httpx_mock):
+        """Test that formatted dates are read in the client's time zone."""
+        row = {"xRequest": 1, "dtGMTOpened": "Sep 24 2007, 01:38 PM"}
+        httpx_mock.add_response(json={"filter": {"request": [row]}}, is_reusable=True)
+
+        berlin = HelpSpotClient(base_url=base_url, api_token=api_token, timezone="Europe/Berlin")
+        utc = HelpSpotClient(base_url=base_url, api_token=api_token)
+        expected = 1190641080 - 7200
+
+        assert berlin.filters.get("42")[0].opened_date == expected
+        assert berlin.filters.get("42", result_format="lazy")[0].opened_date == expected
+        assert berlin.filters.get("42", result_format="batch").column("opened_date") == [expected]
+        assert utc.filters.get("42")[0].opened_date == 1190641080
+        assert berlin.date_parser is not utc.date_parser
+
+    def test_result_format_batch(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that list endpoints return a batch for result_format="batch"."""
+        data = load_fixture("filter_get.json")
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.filter.get&output=json&xFilter=42&start=0&length=50",
+            json=data,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        batch = client.filters.get("42", result_format="batch")
+
+        assert isinstance(batch, RequestBatch)
+        assert batch.column("x_request") == [
+            r.x_request for r in parse_request_list(data, "filter")
+        ]
+
+    def test_iterators_reject_batch(self, base_url, api_token):
+        """Test that iterators point to RequestBatch.from_rows instead."""
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+
+        with pytest.raises(ValueError, match="from_rows"):
+            client.requests.iter_search(result_format="batch")
+        with pytest.raises(ValueError, match="from_rows"):
+            client.filters.get_all("42", count=10, result_format="batch")
+
+
+class TestExports:
+    """Tests for the NumPy, Arrow and pandas conversions."""
+
+    def test_to_numpy(self):
+        """Test that numeric columns are typed views of the batch."""
+        np = pytest.importorskip("numpy")
+        arrays = RequestBatch.from_rows(ROWS).to_numpy()
+
+        assert arrays["x_request"].dtype == np.int64
+        assert arrays["x_request"].tolist() == [1, 2, 3]
+        assert str(arrays["opened_date"][0]) == "2023-11-14T22:13:20"
+        assert np.isnat(arrays["closed_date"]).tolist() == [True, False, True]
+        assert arrays["is_open"].tolist() == [1, 0, None]
+        assert arrays["opened_via_id"].tolist() == [3, None, None]
+        assert arrays["status"].tolist() == ["Active", "Problem Solved", "Active"]
+
+    def test_to_numpy_shares_memory(self):
+        """Test that ID and date arrays are not copies."""
+        pytest.importorskip("numpy")
+        batch = RequestBatch.from_rows(ROWS)
+        arrays = batch.to_numpy()
+
+        batch._ints["x_request"][0] = 99
+        assert arrays["x_request"][0] == 99
+
+    def test_extend_while_exported(self):
+        """Test that extend() refuses, unchanged, while an exported view is alive."""
+        pytest.importorskip("numpy")
+        batch = RequestBatch.from_rows(ROWS)
+        is_open = batch.to_numpy()["is_open"]  # only a flag column is kept
+
+        with pytest.raises(BufferError, match="copy or delete"):
+            batch.extend(ROWS[:1])
+        assert len(batch) == 3
+        assert {len(batch.column(name)) for name in COLUMNS} == {3}
+
+        kept = is_open.copy()
+        del is_open
+        batch.extend(ROWS[:1])
+        assert len(batch) == 4
+        assert kept.tolist() == [True, False, None]
+
+    def test_to_arrow(self):
+        """Test the Arrow schema and values."""
+        pa = pytest.importorskip("pyarrow")
+        table = RequestBatch.from_rows(ROWS).to_arrow()
+
+        assert table.schema.field("x_request").type == pa.int64()
+        assert table.schema.field("opened_date").type == pa.timestamp("s", tz="UTC")
+        assert table.schema.field("status").type == pa.dictionary(pa.int32(), pa.string())
+        assert table.column("is_open").to_pylist() == [True, False, None]
+        assert table.column("category").to_pylist() == ["Bugs", "Bugs", None]
+        assert table.column("closed_date").null_count == 2
+        assert table.column("title").to_pylist() == ["First", "Second", None]
+
+    def test_to_pandas(self):
+        """Test the DataFrame dtypes and values."""
+        pd = pytest.importorskip("pandas")
+        df = RequestBatch.from_rows(ROWS).to_pandas()
+
+        assert list(df.columns) == list(COLUMNS)
+        assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+        assert str(df["opened_date"].dtype) == "datetime64[s, UTC]"
+        assert df["is_urgent"].isna().tolist() == [False, True, True]
+        assert not df.loc[0, "is_urgent"]
+        assert df["opened_via_id"].isna().tolist() == [False, True, True]
+        assert df.loc[1, "closed_date"] == pd.Timestamp(1700003600, unit="s", tz="UTC")
@@ -0,0 +1,226 @@
+"""Tests for bulk operations."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from helpspot import HelpSpotClient
+from helpspot.bulk import ImportJournal, coalesce_updates, import_requests, map_concurrent
+from helpspot.exceptions import ValidationError
+from helpspot.models import RequestUpdate
+
+
+def _create_callback(request: httpx.Request) -> httpx.Response:
+    """Return an xRequest derived from the submitted note ("ticket N")."""
+    form = parse_qs(request.content.decode())
+    number = int(form["tNote"][0].split()[-1])
+    return httpx.Response(200, json={"xRequest": str(1000 + number)})
+
+
+def _write_jsonl(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestMapConcurrent:
+    """Tests for map_concurrent()."""
+
+    def test_ordered_results(self):
+        """Test that ordered results follow the input order."""
+        results = list(map_concurrent(lambda x: x * 2, range(10), concurrency=3))
+
+        assert [r.key for r in results] == list(range(10))
+        assert [r.value for r in results] == [x * 2 for x in range(10)]
+
+    def test_errors_are_captured(self):
+        """Test that exceptions are reported per key."""
+
+        def func(x):
+            if x == 2:
+                raise ValueError("boom")
+            return x
+
+        results = list(map_concurrent(func, [1, 2, 3]))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert str(results[1].error) == "boom"
+
+    def test_invalid_concurrency(self):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency must be positive"):
+            list(map_concurrent(str, [1], concurrency=0))
+
+
+class TestImportRequests:
+    """Tests for import_requests()."""
+
+    def test_import_creates_every_line(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test importing a JSONL file and journaling the results."""
+        for _ in range(3):
+            httpx_mock.add_callback(
+                _create_callback,
+                method="POST",
+                url=f"{base_url}/api/index.php?method=private.request.create&output=json",
+            )
+        source = _write_jsonl(
+            tmp_path / "tickets.jsonl",
+            [json.dumps({"note": f"ticket {i}", "email": "a@example.com"}) for i in range(3)],
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(import_requests(client, source, concurrency=2))
+
+        assert sorted((r.key, r.value.x_request) for r in results) == [
+            (1, 1000),
+            (2, 1001),
+            (3, 1002),
+        ]
+        assert ImportJournal(f"{source}.journal").completed == {1: 1000, 2: 1001, 3: 1002}
+
+    def test_import_resumes_from_journal(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that journaled lines are not created again."""
+        httpx_mock.add_callback(
+            _create_callback,
+            method="POST",
+            url=f"{base_url}/api/index.php?method=private.request.create&output=json",
+        )
+        source = _write_jsonl(
+            tmp_path / "tickets.jsonl",
+            [json.dumps({"note": f"ticket {i}", "email": "a@example.com"}) for i in range(2)],
+        )
+        journal = tmp_path / "progress.journal"
+        journal.write_text(json.dumps({"line": 1, "xRequest": 1000}) + "\n")
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(import_requests(client, source, journal=journal))
+
+        assert [(r.key, r.value.x_request) for r in results] == [(2, 1001)]
+        assert ImportJournal(journal).completed == {1: 1000, 2: 1001}
+
+    def test_import_reports_bad_lines(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that malformed lines fail individually."""
+        httpx_mock.add_callback(
+            _create_callback,
+            method="POST",
+            url=f"{base_url}/api/index.php?method=private.request.create&output=json",
+        )
+        source = _write_jsonl(
+            tmp_path / "tickets.jsonl",
+            [
+                "not json",
+                json.dumps({"email": "missing-note@example.com"}),
+                "",
+                json.dumps({"note": "ticket 4", "email": "a@example.com"}),
+            ],
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = {r.key: r for r in import_requests(client, source)}
+
+        assert isinstance(results[1].error, ValidationError)
+        assert isinstance(results[2].error, ValidationError)
+        assert results[4].value.x_request == 1004
+        assert ImportJournal(f"{source}.journal").completed == {4: 1004}
+
+
+class TestCoalesceUpdates:
+    """Tests for coalesce_updates()."""
+
+    def test_field_changes_are_merged(self):
+        """Test that a status change and reassignment become one update."""
+        plan = coalesce_updates(
+            [
+                RequestUpdate(request_id=1, status_id=2),
+                RequestUpdate(request_id=2, is_open=False),
+                RequestUpdate(request_id=1, assigned_to=7, note="Reassigned"),
+                RequestUpdate(request_id=1, status_id=3, custom_fields={1: "a"}),
+                RequestUpdate(request_id=1, custom_fields={2: "b"}),
+            ]
+        )
+
+        assert list(plan) == [1, 2]
+        assert len(plan[1]) == 1
+        merged = plan[1][0]
+        assert merged.status_id == 3
+        assert merged.assigned_to == 7
+        assert merged.note == "Reassigned"
+        assert merged.custom_fields == {1: "a", 2: "b"}
+
+    def test_distinct_notes_are_kept_in_order(self):
+        """Test that two different notes are not folded together."""
+        plan = coalesce_updates(
+            [
+                RequestUpdate(request_id=1, note="first"),
+                RequestUpdate(request_id=1, status_id=2),
+                RequestUpdate(request_id=1, note="second"),
+            ]
+        )
+
+        assert [u.note for u in plan[1]] == ["first", "second"]
+        assert plan[1][0].status_id == 2
+
+    def test_identical_notes_are_kept(self):
+        """Test that the same note posted twice is sent twice."""
+        plan = coalesce_updates(
+            [
+                RequestUpdate(request_id=1, note="Thanks, we are on it"),
+                RequestUpdate(request_id=1, note="Thanks, we are on it", status_id=2),
+            ]
+        )
+
+        assert [(u.note, u.status_id) for u in plan[1]] == [
+            ("Thanks, we are on it", None),
+            ("Thanks, we are on it", 2),
+        ]
+
+    def test_missing_key_raises(self):
+        """Test that intents must identify a request."""
+        with pytest.raises(ValidationError):
+            coalesce_updates([RequestUpdate(status_id=2)])
+
+
+class TestUpdateMany:
+    """Tests for RequestsAPI.update_many()."""
+
+    def test_update_many_sends_one_call_per_ticket(
+        self, base_url, api_token, httpx_mock, load_fixture
+    ):
+        """Test that coalesced intents produce one update call per ticket."""
+        sent = []
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            form = {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+            sent.append(form)
+            data = load_fixture("request_get.json")
+            data["request"]["xRequest"] = int(form["xRequest"])
+            return httpx.Response(200, json=data)
+
+        for _ in range(2):
+            httpx_mock.add_callback(
+                callback,
+                method="POST",
+                url=f"{base_url}/api/index.php?method=private.request.update&output=json",
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(
+            client.requests.update_many(
+                [
+                    {"request_id": 1, "status_id": 2},
+                    {"request_id": 2, "is_open": False},
+                    {"request_id": 1, "assigned_to": 7},
+                ]
+            )
+        )
+
+        assert sorted(r.key for r in results) == [1, 2]
+        assert all(r.ok for r in results)
+        ticket_1 = next(form for form in sent if form["xRequest"] == "1")
+        assert ticket_1["xStatus"] == "2"
+        assert ticket_1["xPersonAssignedTo"] == "7"
+        assert "tNote" not in ticket_1  # no intent had a note
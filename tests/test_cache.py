@@ -0,0 +1,346 @@
+"""Tests for caching."""
+
+from __future__ import annotations
+
+from helpspot import HelpSpotClient
+from helpspot.cache import DiskCache, ResponseCache, TTLCache, cache_control
+
+STATUS_TYPES = {"results": {"status": [{"xStatus": 1, "sStatus": "Active"}]}}
+CUSTOM_FIELDS = {
+    "customfields": {
+        "field": [{"xCustomField": 1, "fieldName": "Department", "fieldType": "select"}]
+    }
+}
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_entries_expire(self):
+        """Test that entries expire after their namespace TTL."""
+        clock = FakeClock()
+        cache = TTLCache({"categories": 10}, clock=clock)
+
+        cache.set("categories", (), [1, 2])
+        clock.now = 9
+        assert cache.get("categories") == [1, 2]
+        clock.now = 10
+        assert cache.get("categories") is None
+
+    def test_uncached_namespace(self):
+        """Test that namespaces without a TTL are not stored."""
+        cache = TTLCache({"categories": 10})
+
+        cache.set("status_types", (True,), [1])
+
+        assert cache.get("status_types", (True,)) is None
+        assert TTLCache().ttl_for("categories") is None
+
+    def test_invalidate(self):
+        """Test invalidating a key, a namespace and everything."""
+        cache = TTLCache(60)
+        cache.set("custom_fields", (None,), "all")
+        cache.set("custom_fields", (1,), "one")
+        cache.set("categories", (), "cats")
+
+        cache.invalidate("custom_fields", (1,))
+        assert cache.get("custom_fields", (1,)) is None
+        assert cache.get("custom_fields", (None,)) == "all"
+
+        cache.invalidate("custom_fields")
+        assert cache.get("custom_fields", (None,)) is None
+        assert cache.get("categories") == "cats"
+
+        cache.invalidate()
+        assert len(cache) == 0
+
+
+class TestReferenceCache:
+    """Tests for the client's reference data cache."""
+
+    def test_status_types_served_from_cache(self, base_url, api_token, httpx_mock):
+        """Test that a second list() call does not hit the server."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=1",
+            json=STATUS_TYPES,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, reference_cache_ttl=60)
+        first = client.status_types.list()
+        second = client.status_types.list()
+
+        assert [s.name for s in first] == [s.name for s in second] == ["Active"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cached_models_are_copies(self, base_url, api_token, httpx_mock):
+        """Test that changing a returned model does not change later hits."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=1",
+            json=STATUS_TYPES,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, reference_cache_ttl=60)
+        client.status_types.list()[0].name = "Changed"
+        first = client.status_types.list()
+        first[0].name = "Changed again"
+
+        assert [s.name for s in client.status_types.list()] == ["Active"]
+
+    def test_cache_key_includes_parameters(self, base_url, api_token, httpx_mock):
+        """Test that different parameters are cached separately."""
+        for suffix in ("", "&xCategory=3"):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.getCustomFields&output=json{suffix}",
+                json=CUSTOM_FIELDS,
+            )
+
+        client = HelpSpotClient(
+            base_url=base_url, api_token=api_token, reference_cache_ttl={"custom_fields": 60}
+        )
+        client.custom_fields.list()
+        client.custom_fields.list(category_id=3)
+        client.custom_fields.list()
+        client.custom_fields.list(category_id=3)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_invalidate_forces_refetch(self, base_url, api_token, httpx_mock):
+        """Test that invalidate() makes the next call hit the server."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=0",
+                json=STATUS_TYPES,
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, reference_cache_ttl=60)
+        client.status_types.list(active_only=False)
+        client.reference_cache.invalidate("status_types")
+        client.status_types.list(active_only=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_caching_disabled_by_default(self, base_url, api_token, httpx_mock):
+        """Test that every call hits the server without a TTL."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=1",
+                json=STATUS_TYPES,
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        client.status_types.list()
+        client.status_types.list()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestDiskCache:
+    """Tests for the persistent on-disk cache."""
+
+    def test_entries_expire(self, tmp_path):
+        """Test that entries expire after their method TTL."""
+        clock = FakeClock()
+        cache = DiskCache(tmp_path, {"request.getCategories": 10}, clock=clock)
+        params = {"method": "request.getCategories", "output": "json"}
+
+        cache.set("request.getCategories", params, {"category": []})
+        clock.now = 9
+        assert cache.get("request.getCategories", params) == {"category": []}
+        assert cache.entries()[0]["expired"] is False
+        clock.now = 10
+        assert cache.get("request.getCategories", params) is None
+        assert cache.entries()[0]["expired"] is True
+
+    def test_uncacheable_method(self, tmp_path):
+        """Test that methods without a TTL are not stored."""
+        cache = DiskCache(tmp_path)
+
+        cache.set("private.request.get", {"xRequest": 1}, {"xRequest": 1})
+
+        assert cache.entries() == []
+
+    def test_clear(self, tmp_path):
+        """Test that clear() removes every entry."""
+        cache = DiskCache(tmp_path)
+        cache.set("version", {}, {"version": "5"})
+        cache.set("private.user.getFilters", {}, {"filter": []})
+
+        assert cache.clear() == 2
+        assert cache.get("version", {}) is None
+
+    def test_second_client_reads_disk(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that a new client reuses entries written by an earlier one."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=1",
+            json=STATUS_TYPES,
+        )
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=version&output=json",
+            json={"version": "5.0.0", "min_version": "4.0.0"},
+        )
+
+        for _ in range(2):
+            with HelpSpotClient(base_url=base_url, api_token=api_token, cache_dir=tmp_path) as c:
+                assert [s.name for s in c.status_types.list()] == ["Active"]
+                assert c.version().version == "5.0.0"
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_entries_are_kept_per_credentials(self, base_url, httpx_mock, tmp_path):
+        """Test that different tokens do not share cached responses."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.getStatusTypes&output=json&fActiveOnly=1",
+                json=STATUS_TYPES,
+            )
+
+        for token in ("token-a", "token-b"):
+            client = HelpSpotClient(base_url=base_url, api_token=token, cache_dir=tmp_path)
+            client.status_types.list()
+            assert "token" not in str(client.disk_cache.directory)
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert len(list(tmp_path.iterdir())) == 2
+
+
+REQUEST_URL = "{base_url}/api/index.php?method=private.request.get&output=json&xRequest={id}"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        """Test that least recently used entries are evicted first."""
+        cache = ResponseCache(max_entries=2, max_bytes=100)
+        cache.set("private.request.get", {"xRequest": 1}, "one")
+        cache.set("private.request.get", {"xRequest": 2}, "two")
+        cache.get("private.request.get", {"xRequest": 1})
+        cache.set("private.request.get", {"xRequest": 3}, "three")
+
+        assert cache.get("private.request.get", {"xRequest": 2}) is None
+        assert cache.get("private.request.get", {"xRequest": 1}) == "one"
+        assert cache.nbytes == len('"one""three"')
+
+        cache.set("private.request.get", {"xRequest": 4}, "x" * 96)  # 98 bytes encoded
+        assert len(cache) == 1
+        assert cache.nbytes == 98
+
+        cache.set("private.request.get", {"xRequest": 5}, "x" * 99)
+        assert cache.get("private.request.get", {"xRequest": 5}) is None
+
+    def test_ttl_and_max_age(self):
+        """Test per-method TTLs and the max_age override."""
+        clock = FakeClock()
+        cache = ResponseCache({"private.request.get": 30}, clock=clock)
+        cache.set("private.request.get", {"xRequest": 1}, "one")
+        cache.set("private.request.update", {"xRequest": 1}, "write")
+
+        clock.now = 20
+        assert cache.get("private.request.get", {"xRequest": 1}, max_age=10) is None
+        assert cache.get("private.request.get", {"xRequest": 1}) == "one"
+        assert cache.get("private.request.update", {"xRequest": 1}) is None
+        clock.now = 30
+        assert cache.get("private.request.get", {"xRequest": 1}) is None
+
+    def test_invalidate_request(self):
+        """Test that a write drops entries for the ticket and all listings."""
+        cache = ResponseCache()
+        cache.set("private.request.get", {"xRequest": "1"}, "one")
+        cache.set("private.request.get", {"xRequest": "2"}, "two")
+        cache.set("private.filter.get", {"xFilter": "inbox"}, "inbox")
+        cache.set("private.request.getCategories", {}, "cats")
+
+        cache.invalidate_request({"xRequest": "1", "tNote": "..."})
+
+        assert cache.get("private.request.get", {"xRequest": "1"}) is None
+        assert cache.get("private.filter.get", {"xFilter": "inbox"}) is None
+        assert cache.get("private.request.get", {"xRequest": "2"}) == "two"
+        assert cache.get("private.request.getCategories", {}) == "cats"
+
+
+class TestClientResponseCache:
+    """Tests for the response cache in BaseAPI._request."""
+
+    def test_repeated_get_is_cached(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that re-reading a ticket does not hit the server."""
+        httpx_mock.add_response(
+            url=REQUEST_URL.format(base_url=base_url, id=12345),
+            json=load_fixture("request_get.json"),
+        )
+
+        client = HelpSpotClient(
+            base_url=base_url, api_token=api_token, response_cache=ResponseCache()
+        )
+        first = client.requests.get(12345)
+        second = client.requests.get(12345)
+
+        assert first.x_request == second.x_request
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cached_rows_are_copies(self, base_url, api_token, httpx_mock):
+        """Test that modifying a returned row does not change later cache hits."""
+        row = {"xRequest": "1", "sTitle": "Printer", "fOpen": "1"}
+        httpx_mock.add_response(json={"requests": {"request": [row]}})
+
+        client = HelpSpotClient(
+            base_url=base_url, api_token=api_token, response_cache=ResponseCache()
+        )
+        first = client.requests.search(query="printer", result_format="dict")
+        first[0]["sTitle"] = "Changed"
+        first.append({"xRequest": "2"})
+        lazy = client.requests.search(query="printer", result_format="lazy")
+        lazy[0].raw["sTitle"] = "Changed again"
+        again = client.requests.search(query="printer", result_format="dict")
+
+        assert again == [row]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_update_invalidates_ticket(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that updating a ticket makes the next read hit the server."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=REQUEST_URL.format(base_url=base_url, id=12345),
+                json=load_fixture("request_get.json"),
+            )
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{base_url}/api/index.php?method=private.request.update&output=json",
+            json=load_fixture("request_get.json"),
+        )
+
+        client = HelpSpotClient(
+            base_url=base_url, api_token=api_token, response_cache=ResponseCache()
+        )
+        client.requests.get(12345)
+        client.requests.update(note="Done", request_id=12345, is_open=False)
+        client.requests.get(12345)
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_cache_control_no_cache(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that cache_control(no_cache=True) bypasses cached entries."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=REQUEST_URL.format(base_url=base_url, id=12345),
+                json=load_fixture("request_get.json"),
+            )
+
+        client = HelpSpotClient(
+            base_url=base_url, api_token=api_token, response_cache=ResponseCache()
+        )
+        client.requests.get(12345)
+        with cache_control(no_cache=True):
+            client.requests.get(12345)
+        client.requests.get(12345)
+
+        assert len(httpx_mock.get_requests()) == 2
@@ -0,0 +1,69 @@
+"""Tests for JSON decoding backends."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from helpspot import HelpSpotClient
+from helpspot.codec import get_decoder
+from helpspot.exceptions import HTTPError
+
+
+class TestGetDecoder:
+    """Tests for get_decoder()."""
+
+    def test_backends_decode_bytes(self):
+        """Test that every installed backend decodes the same document."""
+        body = json.dumps({"request": [{"xRequest": 1, "sTitle": "Café"}]}).encode()
+        for name in ("auto", "json", "orjson", "msgspec"):
+            try:
+                loads = get_decoder(name)
+            except ImportError:
+                continue
+            assert loads(body) == {"request": [{"xRequest": 1, "sTitle": "Café"}]}
+
+    def test_orjson_is_preferred(self):
+        """Test that auto picks orjson when it is installed."""
+        orjson = pytest.importorskip("orjson")
+
+        assert get_decoder("auto") is orjson.loads
+
+    def test_callable_and_unknown_backends(self):
+        """Test custom callables and unknown names."""
+        assert get_decoder(json.loads) is json.loads
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_decoder("yaml")
+
+
+class TestClientDecoder:
+    """Tests for the client's json_decoder option."""
+
+    def test_custom_decoder_receives_bytes(self, base_url, api_token, httpx_mock):
+        """Test that responses are decoded from the raw body bytes."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.user.getFilters&output=json",
+            json={"filter": []},
+        )
+        seen = []
+
+        def loads(body: bytes):
+            seen.append(type(body))
+            return json.loads(body)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, json_decoder=loads)
+        client.filters.list()
+
+        assert seen == [bytes]
+
+    def test_invalid_json_raises_http_error(self, base_url, api_token, httpx_mock):
+        """Test that a malformed body is reported as HTTPError with any backend."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.user.getFilters&output=json",
+            content=b"<html>maintenance</html>",
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        with pytest.raises(HTTPError, match="Invalid JSON response"):
+            client.filters.list()
@@ -0,0 +1,136 @@
+"""Tests for date parsing."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from helpspot.dates import DateParser, parse_timestamp, to_datetime
+
+SEP_24_1338 = int(datetime(2007, 9, 24, 13, 38, tzinfo=UTC).timestamp())
+
+
+class TestDateParser:
+    """Tests for DateParser."""
+
+    @pytest.mark.parametrize(
+        ("value", "fmt"),
+        [
+            ("Sep 24 2007, 01:38 PM", "%b %d %Y, %I:%M %p"),
+            ("September 24, 2007 1:38 pm", "%B %d, %Y %I:%M %p"),
+            ("09/24/2007 01:38 PM", "%m/%d/%Y %I:%M %p"),
+            ("24.09.2007 13:38", "%d.%m.%Y %H:%M"),
+            ("2007-09-24 13:38:00", "%Y-%m-%d %H:%M:%S"),
+            ("2007-09-24T15:38:00+02:00", "%Y-%m-%dT%H:%M:%S%z"),
+            ("Mon, 24 Sep 2007 13:38:00 +0000", "%a, %d %b %Y %H:%M:%S %z"),
+        ],
+    )
+    def test_detects_format(self, value, fmt):
+        """Test that common HelpSpot date formats are detected."""
+        parser = DateParser()
+
+        assert parser.parse(value) == SEP_24_1338
+        assert parser.format == fmt
+
+    def test_matches_strptime(self):
+        """Test that results agree with datetime.strptime."""
+        parser = DateParser()
+        fmt = "%b %d %Y, %I:%M %p"
+        for hour in range(24):
+            moment = datetime(2024, 2, 29, hour, 5, tzinfo=UTC)
+            value = moment.strftime(fmt)
+            assert parser.parse(value) == int(moment.timestamp()), value
+
+    def test_space_padded_day(self):
+        """Test that PHP-style space-padded days are accepted."""
+        assert DateParser().parse("Sep  4 2007, 12:05 AM") == int(
+            datetime(2007, 9, 4, 0, 5, tzinfo=UTC).timestamp()
+        )
+
+    def test_time_zone(self):
+        """Test that dates without an offset are read in the parser's zone."""
+        parser = DateParser(tz=ZoneInfo("America/New_York"))
+
+        assert parser.parse("Sep 24 2007, 01:38 PM") == SEP_24_1338 + 4 * 3600
+        assert parser.parse("Jan 24 2007, 01:38 PM") == int(
+            datetime(2007, 1, 24, 18, 38, tzinfo=UTC).timestamp()
+        )
+
+    def test_format_is_cached(self):
+        """Test that the detected format is kept and replaced on a mismatch."""
+        parser = DateParser()
+        parser.parse("Sep 24 2007, 01:38 PM")
+        parser.parse("Oct 01 2007, 09:00 AM")
+        assert parser.format == "%b %d %Y, %I:%M %p"
+
+        parser.parse("2007-10-01 09:00:00")
+        assert parser.format == "%Y-%m-%d %H:%M:%S"
+
+    def test_impossible_date_in_cached_format(self, caplog):
+        """Test that a match of the cached format that is no date tries the other formats."""
+        parser = DateParser(formats=["%m/%d/%Y %H:%M", "%d/%m/%Y %H:%M"])
+        parser.parse("12/01/2007 10:00")
+
+        assert parser.parse("31/12/2007 10:00") == parser.parse("12/31/2007 10:00")
+        assert parser.format == "%m/%d/%Y %H:%M"
+        assert parser.parse_lenient("02/30/2007 10:00") == "02/30/2007 10:00"
+        assert "'02/30/2007 10:00'" in caplog.text
+
+    @pytest.mark.parametrize("value", ["yesterday", "Feb 30 2007, 01:00 PM", "13/45/2007 10:00"])
+    def test_rejects_invalid(self, value):
+        """Test that unknown formats and impossible dates raise ValueError."""
+        with pytest.raises(ValueError):
+            DateParser().parse(value)
+
+    def test_custom_formats(self):
+        """Test parsing with a server-specific format."""
+        parser = DateParser(formats=["%d/%m/%y %H:%M"])
+
+        assert parser.parse("24/09/07 13:38") == SEP_24_1338
+        with pytest.raises(ValueError, match="Unsupported date directive"):
+            DateParser(formats=["%j"])
+
+    def test_parse_many(self):
+        """Test the column path with repeats, timestamps and missing values."""
+        values = ["Sep 24 2007, 01:38 PM", None, "", 1190598300, "Sep 24 2007, 01:38 PM"]
+
+        assert DateParser().parse_many(values) == [
+            SEP_24_1338,
+            None,
+            None,
+            1190598300,
+            SEP_24_1338,
+        ]
+
+    def test_parse_many_lenient(self, caplog):
+        """Test that strict=False keeps unknown dates as text and warns once."""
+        values = ["Sep 24 2007, 01:38 PM", "soon", "soon"]
+
+        assert DateParser().parse_many(values, strict=False) == [SEP_24_1338, "soon", "soon"]
+        assert caplog.text.count("'soon'") == 1
+        with pytest.raises(ValueError, match="soon"):
+            DateParser().parse_many(values)
+
+    def test_time_zone_name(self):
+        """Test that a time zone may be given by name."""
+        assert DateParser(tz="America/New_York").tz == ZoneInfo("America/New_York")
+
+
+class TestHelpers:
+    """Tests for parse_timestamp() and to_datetime()."""
+
+    def test_parse_timestamp(self):
+        """Test timestamps, digit strings, empty values and formatted dates."""
+        assert parse_timestamp(1190598300) == 1190598300
+        assert parse_timestamp("1190598300") == 1190598300
+        assert parse_timestamp("") is None
+        assert parse_timestamp(None) is None
+        assert parse_timestamp("Sep 24 2007, 01:38 PM") == SEP_24_1338
+
+    def test_to_datetime(self):
+        """Test that timestamps become aware UTC datetimes."""
+        assert to_datetime(SEP_24_1338) == datetime(2007, 9, 24, 13, 38, tzinfo=UTC)
+        assert to_datetime(SEP_24_1338).tzinfo is UTC
+        assert to_datetime(None) is None
@@ -0,0 +1,175 @@
+"""Tests for streaming exports."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import tracemalloc
+
+import httpx
+import pytest
+
+from helpspot import HelpSpotClient
+from helpspot.export import export_format, export_requests
+
+
+@pytest.fixture
+def pq():
+    """pyarrow.parquet, for the Parquet tests."""
+    return pytest.importorskip("pyarrow.parquet")
+
+
+def _rows(count: int, start: int = 1):
+    for i in range(start, start + count):
+        yield {
+            "xRequest": str(i),
+            "fOpen": i % 2,
+            "fUrgent": "",
+            "xStatus": "Active" if i % 2 else "Closed",
+            "dtGMTOpened": "Sep 24 2007, 01:38 PM",
+            "sTitle": f"Ticket {i}",
+            "tNote": 'Ça marche, "quoted"\nsecond line',
+        }
+
+
+def _serve(httpx_mock, rows: list[dict], key: tuple[str, str]) -> None:
+    """Answer paged search/filter calls from a list of rows."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.params["method"] == "private.user.getFilters":
+            filters = [{"xFilter": "inbox", "sFilterName": "Inbox", "count": len(rows)}]
+            return httpx.Response(200, json={"filters": {"filter": filters}})
+        start = int(request.url.params["start"])
+        length = int(request.url.params["length"])
+        return httpx.Response(200, json={key[0]: {key[1]: rows[start : start + length]}})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+
+class TestExportRequests:
+    """Tests for export_requests()."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("a.jsonl", ("jsonl", None)),
+            ("a.ndjson.gz", ("jsonl", "gzip")),
+            ("a.CSV.xz", ("csv", "xz")),
+            ("a.parquet", ("parquet", None)),
+            ("a.txt", (None, None)),
+        ],
+    )
+    def test_export_format(self, name, expected):
+        """Test format and compression detection from file names."""
+        assert export_format(name) == expected
+
+    def test_jsonl(self, tmp_path):
+        """Test that JSONL rows hold converted values under attribute names."""
+        path = tmp_path / "tickets.jsonl.gz"
+        result = export_requests(_rows(5), path, columns=["x_request", "is_open", "opened_date"])
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        assert (result.format, result.compression, result.rows) == ("jsonl", "gzip", 5)
+        assert result.size == path.stat().st_size
+        assert json.loads(lines[0]) == {"x_request": 1, "is_open": True, "opened_date": 1190641080}
+        assert len(lines) == 5
+
+    def test_csv(self, tmp_path):
+        """Test CSV headers, flags as 1/0, empty missing values and quoting."""
+        path = tmp_path / "tickets.csv"
+        export_requests(_rows(3), path, row_group_size=2)
+
+        with open(path, newline="", encoding="utf-8") as file:
+            records = list(csv.DictReader(file))
+        assert [r["x_request"] for r in records] == ["1", "2", "3"]
+        assert [r["is_open"] for r in records] == ["1", "0", "1"]
+        assert records[0]["is_urgent"] == records[0]["closed_date"] == ""
+        assert records[0]["note"] == 'Ça marche, "quoted"\nsecond line'
+
+    def test_parquet_row_groups(self, tmp_path, pq):
+        """Test that each batch becomes a typed Parquet row group."""
+        path = tmp_path / "tickets.parquet"
+        progress = []
+        result = export_requests(
+            _rows(25), path, compression="zstd", row_group_size=10, progress=progress.append
+        )
+
+        file = pq.ParquetFile(path)
+        table = file.read()
+        assert result.rows == table.num_rows == 25
+        assert progress == [10, 20, 25]
+        assert file.metadata.num_row_groups == 3
+        assert file.metadata.row_group(0).column(0).compression == "ZSTD"
+        assert str(table.schema.field("is_open").type) == "bool"
+        assert str(table.schema.field("opened_date").type).startswith("timestamp")
+        assert table.column("x_request").to_pylist() == list(range(1, 26))
+        assert table.column("status").to_pylist()[:2] == ["Active", "Closed"]
+
+    def test_empty(self, tmp_path, pq):
+        """Test that an empty export still writes a readable file."""
+        result = export_requests(iter([]), tmp_path / "none.parquet")
+
+        assert result.rows == 0
+        assert result.compression == "snappy"
+        assert pq.read_table(result.path).num_rows == 0
+
+    def test_exact_multiple_of_group_size(self, tmp_path, pq):
+        """Test that no empty row group is added after the last full one."""
+        path = tmp_path / "tickets.parquet"
+        export_requests(_rows(20), path, row_group_size=10)
+
+        assert pq.ParquetFile(path).metadata.num_row_groups == 2
+        assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "SNAPPY"
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test unknown formats, compressions and columns."""
+        with pytest.raises(ValueError, match="format"):
+            export_requests(_rows(1), tmp_path / "tickets.txt")
+        with pytest.raises(ValueError, match="compression"):
+            export_requests(_rows(1), tmp_path / "tickets.csv", compression="zip")
+        with pytest.raises(ValueError, match="columns: subject"):
+            export_requests(_rows(1), tmp_path / "tickets.csv", columns=["title", "subject"])
+
+    def test_memory_does_not_grow_with_rows(self, tmp_path):
+        """Test that memory depends on the row group size, not the row count."""
+
+        def peak(count: int) -> int:
+            tracemalloc.start()
+            export_requests(_rows(count), tmp_path / "tickets.jsonl", row_group_size=500)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        assert peak(10_000) < 1.5 * peak(1_000)
+
+
+class TestAPIExport:
+    """Tests for filters.export() and requests.export()."""
+
+    def test_filter_export(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test exporting every page of a filter."""
+        rows = list(_rows(7))
+        _serve(httpx_mock, rows, ("filter", "request"))
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            result = client.filters.export("inbox", tmp_path / "inbox.csv", page_size=3)
+
+        with open(result.path, newline="", encoding="utf-8") as file:
+            records = list(csv.DictReader(file))
+        assert result.rows == 7
+        assert [r["title"] for r in records] == [f"Ticket {i}" for i in range(1, 8)]
+
+    def test_search_export(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that search criteria are passed to private.request.search."""
+        _serve(httpx_mock, list(_rows(4)), ("requests", "request"))
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            result = client.requests.export(
+                tmp_path / "recent.jsonl", page_size=3, opened_after=1700000000, is_open=True
+            )
+
+        params = httpx_mock.get_requests()[0].url.params
+        assert (params["afterDate"], params["fOpen"]) == ("1700000000", "1")
+        assert result.rows == 4
@@ -0,0 +1,201 @@
+"""Tests for request history retrieval."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient, TicketMirror
+from helpspot.exceptions import HTTPError
+from helpspot.models import RequestHistory
+
+
+def _item(history_id: int, request_id: int = 12745, **fields) -> dict:
+    return {
+        "xRequestHistory": history_id,
+        "xRequest": request_id,
+        "xPerson": "Ian Landsman",
+        "dtGMTChange": 1190598240 + history_id,
+        "fPublic": 1,
+        "fInitial": int(history_id == 1),
+        "tLog": "",
+        "tNote": f"Note {history_id}",
+        "tEmailHeaders": "",
+        "fNoteIsHTML": 0,
+        "fMergedFromRequest": 0,
+        **fields,
+    }
+
+
+def _body(items: list[dict], request_id: int = 12745) -> bytes:
+    request = {"xRequest": request_id, "sTitle": "Printer", "request_history": {"item": items}}
+    return json.dumps({"request": request}).encode()
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with TicketMirror(tmp_path / "tickets.sqlite3") as mirror:
+        yield mirror
+
+
+class TestHistory:
+    """Tests for RequestsAPI.history()."""
+
+    def test_history(self, base_url, api_token, httpx_mock):
+        """Test that history items are streamed from private.request.get."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.get&xRequest=12745&output=json",
+            content=_body([_item(1), _item(2, dtGMTChange="Sep 24 2007, 01:38 PM")]),
+        )
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            history = client.requests.history(12745)
+            assert httpx_mock.get_requests() == []  # lazy
+            items = list(history)
+
+        assert all(isinstance(item, RequestHistory) for item in items)
+        assert [item.x_request_history for item in items] == [1, 2]
+        assert (items[0].is_initial, items[1].is_initial) == (True, False)
+        assert items[1].change_date == 1190641080
+        assert items[1].changed_at.year == 2007
+
+    def test_single_item(self, base_url, api_token, httpx_mock):
+        """Test a history of one item, which HelpSpot sends as an object."""
+        request = {"xRequest": 12745, "request_history": {"item": _item(1)}}
+        httpx_mock.add_response(json={"request": request})
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            assert [i.x_request_history for i in client.requests.history(12745)] == [1]
+
+    def test_unwrapped(self, base_url, api_token, httpx_mock):
+        """Test a response without the "request" wrapper."""
+        request = {"xRequest": 12745, "request_history": {"item": [_item(1), _item(2)]}}
+        httpx_mock.add_response(json=request)
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            assert [i.x_request_history for i in client.requests.history(12745)] == [1, 2]
+
+    def test_xml(self, base_url, api_token, httpx_mock):
+        """Test history from XML output."""
+        items = "".join(
+            f"<item><xRequestHistory>{i}</xRequestHistory><xRequest>12745</xRequest>"
+            f"<dtGMTChange></dtGMTChange><fPublic>1</fPublic><fInitial>0</fInitial>"
+            f"<fNoteIsHTML>0</fNoteIsHTML><fMergedFromRequest>0</fMergedFromRequest></item>"
+            for i in (1, 2)
+        )
+        httpx_mock.add_response(
+            content=f"<request><xRequest>12745</xRequest><request_history>{items}"
+            f"</request_history></request>".encode()
+        )
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml") as client:
+            items = list(client.requests.history(12745))
+
+        assert [i.x_request_history for i in items] == [1, 2]
+        assert items[0].change_date is None
+
+    def test_new_only_needs_mirror(self, base_url, api_token):
+        """Test that new_only needs a client mirror."""
+        with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+            with pytest.raises(ValueError, match="mirror"):
+                next(client.requests.history(12745, new_only=True))
+
+
+class TestHistoryCache:
+    """Tests for history stored in the client's mirror."""
+
+    def test_new_only_oldest_first(self, base_url, api_token, httpx_mock, mirror):
+        """Test that only items newer than the last stored one are yielded."""
+        httpx_mock.add_response(content=_body([_item(1), _item(2)]))
+        httpx_mock.add_response(content=_body([_item(1), _item(2), _item(3), _item(4)]))
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=mirror) as client:
+            first = list(client.requests.history(12745, new_only=True))
+            second = list(client.requests.history(12745, new_only=True))
+
+        assert [i.x_request_history for i in first] == [1, 2]
+        assert [i.x_request_history for i in second] == [3, 4]
+        assert [i.x_request_history for i in mirror.history(12745)] == [1, 2, 3, 4]
+        assert mirror.last_history_id(12745) == 4
+
+    def test_new_only_newest_first_stops_reading(self, base_url, api_token, httpx_mock, mirror):
+        """Test that a newest-first history is read only up to the first known item."""
+        mirror.store_history(12745, [_item(1), _item(2)])
+        # Cut off after the known items: reading on would fail to parse
+        body = _body([_item(4), _item(3), _item(2), _item(1)])
+        httpx_mock.add_response(content=body[: body.index(b'"xRequestHistory": 1')])
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=mirror) as client:
+            new = list(client.requests.history(12745, new_only=True))
+
+        assert [i.x_request_history for i in new] == [4, 3]
+        assert mirror.last_history_id(12745) == 4
+
+    def test_abandoned_read_is_not_stored(self, base_url, api_token, httpx_mock, mirror):
+        """Test that a partly read history does not advance the last seen item."""
+        httpx_mock.add_response(content=_body([_item(1), _item(2)]))
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=mirror) as client:
+            history = client.requests.history(12745)
+            next(history)
+            history.close()
+
+        assert mirror.last_history_id(12745) is None
+
+    def test_failed_read_is_not_stored(self, base_url, api_token, httpx_mock, mirror):
+        """Test that a broken response stores nothing."""
+        body = _body([_item(1), _item(2)])
+        httpx_mock.add_response(content=body[:-20])
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=mirror) as client:
+            with pytest.raises(HTTPError):
+                list(client.requests.history(12745))
+
+        assert mirror.history(12745) == []
+
+
+class TestHistoryMany:
+    """Tests for history_many()."""
+
+    def test_history_many(self, base_url, api_token, httpx_mock, mirror):
+        """Test concurrent histories with a failure reported per ID."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            request_id = int(request.url.params["xRequest"])
+            if request_id == 3:
+                return httpx.Response(500)
+            items = [_item(request_id * 10 + i, request_id) for i in range(request_id)]
+            return httpx.Response(200, content=_body(items, request_id))
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=mirror) as client:
+            results = list(client.requests.history_many([1, 2, 3], concurrency=3))
+            again = list(client.requests.history_many([1, 2], new_only=True))
+
+        assert [r.key for r in results] == [1, 2, 3]
+        assert [len(r.value) for r in results[:2]] == [1, 2]
+        assert not results[2].ok
+        assert [r.value for r in again] == [[], []]
+        assert [i.x_request_history for i in mirror.history(2)] == [20, 21]
+
+    def test_async_history(self, base_url, api_token, httpx_mock, mirror):
+        """Test history and history_many through AsyncHelpSpotClient."""
+        httpx_mock.add_response(content=_body([_item(1), _item(2)]))
+        httpx_mock.add_response(content=_body([_item(1), _item(2), _item(3)]))
+
+        async def run():
+            async with AsyncHelpSpotClient(
+                base_url=base_url, api_token=api_token, mirror=mirror
+            ) as client:
+                first = [i async for i in client.requests.history(12745, new_only=True)]
+                results = [r async for r in client.requests.history_many([12745], new_only=True)]
+                return first, results
+
+        first, results = asyncio.run(run())
+
+        assert [i.x_request_history for i in first] == [1, 2]
+        assert [i.x_request_history for i in results[0].value] == [3]
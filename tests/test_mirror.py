@@ -0,0 +1,309 @@
+"""Tests for the local SQLite ticket mirror."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient, TicketMirror
+from helpspot.mirror import default_mirror_path
+from helpspot.models import Request
+
+ROW = {
+    "xRequest": 12745,
+    "fOpenedVia": "Web Service",
+    "xPersonAssignedTo": "Ian Landsman",
+    "fOpen": 1,
+    "xStatus": "Active",
+    "fUrgent": 0,
+    "xCategory": "Bugs",
+    "dtGMTOpened": 1190598240,
+    "dtGMTClosed": None,
+    "sTitle": "Question",
+    "sEmail": "john.doe@example.com",
+    "fTrash": 0,
+}
+
+
+def _row(request_id: int, **fields) -> dict:
+    return {**ROW, "xRequest": request_id, "dtGMTOpened": 1190598240 + request_id, **fields}
+
+
+class FakeClock:
+    """A settable clock for sync timestamps."""
+
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def mirror(tmp_path, clock):
+    with TicketMirror(tmp_path / "mirror" / "tickets.sqlite3", clock=clock) as mirror:
+        yield mirror
+
+
+@pytest.fixture
+def client(base_url, api_token):
+    with HelpSpotClient(base_url=base_url, api_token=api_token) as client:
+        yield client
+
+
+def _serve_search(httpx_mock, rows: list[dict]) -> None:
+    """Answer private.request.search pages from a list of rows."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start"])
+        length = int(request.url.params["length"])
+        return httpx.Response(200, json={"requests": {"request": rows[start : start + length]}})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+
+class TestTicketMirrorSync:
+    """Tests for TicketMirror.sync()."""
+
+    def test_full_then_incremental(self, mirror, client, clock, httpx_mock):
+        """Test that the first sync reads everything and the next only updates."""
+        _serve_search(httpx_mock, [_row(i) for i in (1, 2, 3)])
+        first = mirror.sync(client, page_size=2)
+
+        assert (first.fetched, first.created, first.updated, first.full) == (3, 3, 0, True)
+        assert (first.high_water_id, first.high_water_opened) == (3, 1190598243)
+        assert mirror.last_sync == clock.now
+        assert "afterDate" not in httpx_mock.get_requests()[0].url.params
+
+        httpx_mock.reset()
+        synced = clock.now
+        clock.now += 3600
+        new_rows = [_row(4)]
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            params = request.url.params
+            if params["method"] == "private.request.getChanged":
+                return httpx.Response(200, json={"xRequest": ["2", "4", "2"]})
+            if params["method"] == "private.request.get":
+                assert params["xRequest"] == "2"
+                return httpx.Response(200, json=_row(2, xStatus="Closed", fOpen=0))
+            assert params["afterDate"] == "1190598243"  # the newest stored ticket
+            return httpx.Response(200, json={"requests": {"request": new_rows}})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        second = mirror.sync(client, page_size=2)
+
+        requests = httpx_mock.get_requests()
+        assert [r.url.params["method"] for r in requests] == [
+            "private.request.getChanged",
+            "private.request.search",
+            "private.request.get",
+        ]
+        assert requests[0].url.params["dtGMTChange"] == str(int(synced - mirror.overlap))
+        params = requests[1].url.params
+        assert (params["orderBy"], params["orderByDir"]) == ("dtGMTOpened", "asc")
+        assert (second.fetched, second.created, second.updated, second.full) == (2, 1, 1, False)
+        assert second.high_water_id == 4
+        assert len(mirror) == 4
+        assert mirror.get(2).status == "Closed"
+        assert mirror.get(2).is_open is False
+
+    def test_changed(self, client, httpx_mock):
+        """Test the changed IDs in each shape HelpSpot sends them."""
+        for body in ({"xRequest": ["5", "6"]}, {"requests": {"xRequest": "5"}}, {"requests": ""}):
+            httpx_mock.add_response(json=body)
+
+        assert client.requests.changed(1700000000) == [5, 6]
+        assert client.requests.changed(1700000000) == [5]
+        assert client.requests.changed(1700000000) == []
+        assert httpx_mock.get_requests()[0].url.params["dtGMTChange"] == "1700000000"
+
+    def test_filter_sync(self, mirror, client, httpx_mock):
+        """Test mirroring the tickets of a filter."""
+        rows = [_row(7), _row(8)]
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.params["method"] != "private.filter.get":
+                filters = [{"xFilter": "42", "sFilterName": "Updated today", "count": 2}]
+                return httpx.Response(200, json={"filters": {"filter": filters}})
+            start = int(request.url.params["start"])
+            length = int(request.url.params["length"])
+            return httpx.Response(200, json={"filter": {"request": rows[start : start + length]}})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        result = mirror.sync(client, filter_id="42")
+
+        assert httpx_mock.get_requests()[-1].url.params["xFilter"] == "42"
+        assert (result.fetched, result.full) == (2, True)
+        assert [r.x_request for r in mirror.query()] == [8, 7]
+
+    def test_failed_sync_keeps_state(self, mirror, client, httpx_mock):
+        """Test that a failed run does not move the last sync time."""
+        httpx_mock.add_response(method="GET", status_code=500)
+
+        with pytest.raises(Exception):
+            mirror.sync(client)
+        assert mirror.last_sync is None
+
+    def test_refresh(self, mirror, client, httpx_mock):
+        """Test re-fetching single tickets with private.request.get."""
+        httpx_mock.add_response(method="GET", json=_row(12745, sTitle="Updated"))
+
+        result = mirror.refresh(client, [12745])
+
+        assert (result.fetched, result.created) == (1, 1)
+        assert mirror.get(12745).title == "Updated"
+        assert mirror.last_sync is None
+
+
+class TestTicketMirrorQuery:
+    """Tests for reading the mirror."""
+
+    def test_round_trip(self, mirror):
+        """Test that stored tickets come back as equal Request objects."""
+        request = Request(**_row(5, tNote="A note", fUrgent=1))
+
+        assert mirror.upsert([request]) == 1
+        assert mirror.upsert([request]) == 0
+        assert mirror.get(5) == request
+        assert mirror.get(6) is None
+
+    def test_search(self, mirror):
+        """Test the search() filters."""
+        mirror.upsert(
+            [
+                Request(**_row(1)),
+                Request(**_row(2, fUrgent=1)),
+                Request(**_row(3, fOpen=0, xStatus="Closed", sEmail="a@example.com")),
+            ]
+        )
+
+        assert [r.x_request for r in mirror.search()] == [3, 2, 1]
+        assert [r.x_request for r in mirror.search(is_urgent=True)] == [2]
+        assert [r.x_request for r in mirror.search(status="Closed")] == [3]
+        assert [r.x_request for r in mirror.search(email="a@example.com")] == [3]
+        assert [r.x_request for r in mirror.search(opened_after=1190598242)] == [3, 2]
+        assert [r.x_request for r in mirror.search(is_open=True, limit=1)] == [2]
+
+    def test_names(self, mirror):
+        """Test the distinct names stored in a column."""
+        mirror.upsert([Request(**_row(1)), Request(**_row(2, xStatus="Closed", xCategory=None))])
+
+        assert mirror.names("status") == ["Active", "Closed"]
+        assert mirror.names("category") == ["Bugs"]
+        with pytest.raises(ValueError, match="name column"):
+            mirror.names("title")
+
+    def test_query(self, mirror):
+        """Test raw SQL conditions."""
+        mirror.upsert([Request(**_row(i)) for i in range(1, 6)])
+
+        found = mirror.query("x_request % ? = 0", [2], order_by="x_request")
+
+        assert all(isinstance(r, Request) for r in found)
+        assert [r.x_request for r in found] == [2, 4]
+
+    def test_default_path(self, tmp_path):
+        """Test that mirrors are kept per server and identity."""
+        a = default_mirror_path("https://a.example.com", "token", tmp_path)
+        b = default_mirror_path("https://b.example.com", "token", tmp_path)
+
+        assert a.parent == tmp_path / "mirror"
+        assert a != b
+
+
+class TestTicketMirrorTextSearch:
+    """Tests for full-text search of the mirror."""
+
+    @pytest.fixture
+    def tickets(self, mirror):
+        mirror.upsert(
+            [
+                Request(**_row(1, sTitle="VPN drops hourly", tNote="Printer is fine")),
+                Request(**_row(2, sTitle="Printer on fire", tNote="Smoke everywhere")),
+                Request(**_row(3, sTitle="Invoice", sEmail="o'brien@example.com", fOpen=0)),
+                Request(**_row(4, sTitle="Café menu", tNote="printers, printing")),
+            ]
+        )
+        return mirror
+
+    def test_ranking_and_filters(self, tickets):
+        """Test that every word must match and title matches rank first."""
+        assert tickets.has_fts
+        assert [r.x_request for r in tickets.search("printer")] == [2, 1]
+        assert [r.x_request for r in tickets.search("printer fire")] == [2]
+        assert [r.x_request for r in tickets.search("print*")] == [2, 4, 1]
+        assert [r.x_request for r in tickets.search("cafe")] == [4]
+        assert [r.x_request for r in tickets.search("printer", is_open=True, limit=1)] == [2]
+        assert tickets.search("printer", status="Closed") == []
+
+    def test_punctuation_is_literal(self, tickets):
+        """Test that quotes, e-mail addresses and operators are not query syntax."""
+        assert [r.x_request for r in tickets.search("o'brien@example.com")] == [3]
+        assert tickets.search('"NOT" AND -') == []
+
+    def test_index_follows_updates(self, tickets):
+        """Test that re-synced tickets are re-indexed."""
+        tickets.upsert([Request(**_row(2, sTitle="Toner low", tNote=""))])
+
+        assert [r.x_request for r in tickets.search("printer")] == [1]
+        assert [r.x_request for r in tickets.search("toner")] == [2]
+
+    def test_existing_mirror_is_indexed(self, tickets, clock):
+        """Test that a mirror created without the index gets one on open."""
+        tickets._conn.execute("DROP TABLE requests_fts")
+        for name in ("insert", "delete", "update"):
+            tickets._conn.execute(f"DROP TRIGGER requests_fts_{name}")
+        tickets.close()
+
+        with TicketMirror(tickets.path, clock=clock) as reopened:
+            assert [r.x_request for r in reopened.search("printer")] == [2, 1]
+
+    def test_without_fts5(self, tickets):
+        """Test the scan used when SQLite is built without FTS5."""
+        tickets.has_fts = False
+
+        assert [r.x_request for r in tickets.search("printer fire")] == [2]
+        assert [r.x_request for r in tickets.search("100%")] == []
+        assert {r.x_request for r in tickets.search("print")} == {1, 2, 4}
+
+
+class TestSearchLocal:
+    """Tests for RequestsAPI.search_local()."""
+
+    def test_search_local(self, base_url, api_token, tmp_path, httpx_mock):
+        """Test searching a mirror given by path, without API calls."""
+        path = tmp_path / "tickets.sqlite3"
+        with TicketMirror(path) as mirror:
+            mirror.upsert([Request(**_row(1, sTitle="Printer on fire")), Request(**_row(2))])
+
+        with HelpSpotClient(base_url=base_url, api_token=api_token, mirror=path) as client:
+            found = client.requests.search_local("printer", length=5)
+
+        assert [r.x_request for r in found] == [1]
+        assert httpx_mock.get_requests() == []
+
+    def test_async_search_local(self, base_url, api_token, mirror):
+        """Test search_local through AsyncHelpSpotClient with a shared mirror."""
+        mirror.upsert([Request(**_row(1, sTitle="Printer on fire"))])
+
+        async def search():
+            async with AsyncHelpSpotClient(
+                base_url=base_url, api_token=api_token, mirror=mirror
+            ) as client:
+                return await client.requests.search_local("fire")
+
+        assert [r.x_request for r in asyncio.run(search())] == [1]
+        assert len(mirror) == 1  # a mirror passed in is not closed with the client
+
+    def test_no_mirror(self, client):
+        """Test that search_local needs a mirror."""
+        with pytest.raises(ValueError, match="mirror"):
+            client.requests.search_local("printer")
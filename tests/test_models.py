@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -11,6 +13,7 @@ from helpspot.models import (
     Customer,
     FileAttachment,
     Filter,
+    LazyRequest,
     Request,
     StatusType,
     VersionInfo,
@@ -89,6 +92,40 @@ class TestRequestModel:
         assert request.gmt_opened == 1190598240
         assert request.gmt_closed == 1190699999
 
+    def test_request_formatted_dates(self):
+        """Test that formatted and string dates are parsed, not dropped."""
+        request = Request(
+            xRequest=12345,
+            dtGMTOpened="Sep 24 2007, 01:38 PM",
+            dtGMTClosed="1190699999",
+            dtGMTTrashed="",
+        )
+
+        assert request.opened_date == 1190641080
+        assert request.closed_date == 1190699999
+        assert request.trashed_date is None
+        assert request.opened_at == datetime(2007, 9, 24, 13, 38, tzinfo=UTC)
+        assert request.trashed_at is None
+
+    def test_request_unparseable_date(self, caplog):
+        """Test that a date in no known format is kept as text with a warning."""
+        request = Request(xRequest=12345, dtGMTOpened="yesterday", dtGMTClosed="1190699999")
+
+        assert request.opened_date == "yesterday"
+        assert request.opened_at is None
+        assert request.closed_date == 1190699999
+        assert "'yesterday'" in caplog.text
+
+    def test_request_empty_values(self):
+        """Test that empty IDs and flags (XML's empty elements) are missing."""
+        request = Request(xRequest="12345", xOpenedViaId="", fOpen="", fUrgent="1", fTrash="")
+
+        assert request.x_request == 12345
+        assert request.opened_via_id is None
+        assert request.is_open is None
+        assert request.is_urgent is True
+        assert request.is_trash is None
+
     def test_request_access_key(self):
         """Test Request with accesskey."""
         request = Request(
@@ -100,6 +137,54 @@ class TestRequestModel:
         assert request.accesskey == "12345abc123"
 
 
+class TestLazyRequest:
+    """Tests for LazyRequest views."""
+
+    ROW = {
+        "xRequest": "12345",
+        "fOpen": "1",
+        "sTitle": "Printer on fire",
+        "dtGMTOpened": 1190598300,
+        "tNote": "A long note body.",
+    }
+
+    def test_fields_match_request(self):
+        """Test that lazy fields convert exactly like Request fields."""
+        view = LazyRequest(self.ROW)
+        request = Request(**self.ROW)
+
+        for name in Request.model_fields:
+            assert getattr(view, name) == getattr(request, name)
+
+    def test_fields_convert_on_first_access(self):
+        """Test that only accessed fields are converted and cached."""
+        view = LazyRequest(dict(self.ROW, dtGMTClosed="Sep 24 2007, 01:38 PM"))
+
+        assert view.x_request == 12345
+        assert view.is_open is True
+        assert view._values == {"x_request": 12345, "is_open": True}
+        assert view.closed_date == 1190641080
+
+    def test_invalid_field_fails_on_access(self):
+        """Test that a bad value only raises when its field is read."""
+        view = LazyRequest({"xRequest": 1, "fOpen": "maybe"})
+
+        assert view.x_request == 1
+        with pytest.raises(ValidationError):
+            view.is_open
+        with pytest.raises(ValidationError):
+            LazyRequest({"sTitle": "no id"}).x_request
+        with pytest.raises(AttributeError):
+            view.not_a_field
+
+    def test_to_request(self):
+        """Test conversion to a full Request."""
+        view = LazyRequest(self.ROW)
+
+        assert view.to_request() == Request(**self.ROW)
+        assert view.raw is self.ROW
+
+
 class TestCategoryModel:
     """Tests for Category model."""
 
@@ -0,0 +1,108 @@
+"""Tests for client-side rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from helpspot import HelpSpotClient, RateLimiter
+from helpspot.ratelimit import SQLiteTokenBucket, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst, then paces at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now = 10
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_invalid_rate(self):
+        """Test that rate must be positive."""
+        with pytest.raises(ValueError, match="rate must be positive"):
+            TokenBucket(rate=0)
+
+    def test_sqlite_bucket_is_shared(self, tmp_path):
+        """Test that two handles on one file share a budget."""
+        clock = FakeClock()
+        path = tmp_path / "limits.sqlite3"
+        first = SQLiteTokenBucket(path, "token", rate=1, burst=2, clock=clock)
+        second = SQLiteTokenBucket(path, "token", rate=1, burst=2, clock=clock)
+        other = SQLiteTokenBucket(path, "other-token", rate=1, burst=2, clock=clock)
+
+        assert first.reserve() == 0
+        assert second.reserve() == 0
+        assert first.reserve() == pytest.approx(1.0)
+        assert other.reserve() == 0
+
+        clock.now = 5
+        assert second.reserve() == 0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_per_method_limits(self):
+        """Test that per-method limits apply on top of the overall limit."""
+        limiter = RateLimiter(rate=100, burst=100, per_method={"private.request.search": (1, 1)})
+
+        assert limiter.reserve("private.request.search") == 0
+        assert limiter.reserve("private.request.search") > 0.9
+        assert limiter.reserve("private.request.get") == 0
+
+    def test_async_shared_reserve_runs_off_the_loop(self, tmp_path, monkeypatch):
+        """Test that shared buckets are reserved in a worker thread."""
+        limiter = RateLimiter(rate=5, shared_path=tmp_path / "limits.sqlite3")
+        threads = []
+        reserve = SQLiteTokenBucket.reserve
+
+        def spy(self, tokens=1.0):
+            threads.append(threading.current_thread())
+            return reserve(self, tokens)
+
+        monkeypatch.setattr(SQLiteTokenBucket, "reserve", spy)
+        asyncio.run(limiter.aacquire("version"))
+        limiter.close()
+
+        assert threads and threading.main_thread() not in threads
+
+    def test_client_waits_for_tokens(self, base_url, api_token, httpx_mock, monkeypatch):
+        """Test that API calls wait once the burst is used up."""
+        for _ in range(3):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.user.getFilters&output=json",
+                json={"filter": []},
+            )
+        sleeps: list[float] = []
+        monkeypatch.setattr("helpspot.ratelimit.time.sleep", sleeps.append)
+
+        client = HelpSpotClient(
+            base_url=base_url,
+            api_token=api_token,
+            coalesce_requests=False,
+            rate_limit=RateLimiter(rate=1, burst=2),
+        )
+        for _ in range(3):
+            client.filters.list()
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(1.0, abs=0.1)
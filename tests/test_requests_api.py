@@ -9,7 +9,9 @@ import pytest
 from httpx import Response
 
 from helpspot import HelpSpotClient
+from helpspot.api.requests import parse_request_list
 from helpspot.exceptions import APIError, ValidationError
+from helpspot.models import Request
 
 
 @pytest.fixture
@@ -447,3 +449,191 @@ class TestRequestsAPIErrors:
 
         assert exc_info.value.error_id == 101
         assert "Required field missing" in str(exc_info.value)
+
+
+def _search_page(template: dict, request_ids: list[int]) -> dict:
+    """Build a private.request.search payload containing the given IDs."""
+    rows = []
+    for request_id in request_ids:
+        row = dict(template["requests"]["request"][0])
+        row["xRequest"] = request_id
+        rows.append(row)
+    return {"requests": {"request": rows}}
+
+
+class TestRequestsAPIIterSearch:
+    """Tests for RequestsAPI.iter_search()."""
+
+    def test_iter_search_walks_all_pages(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        request_search_data: dict,
+    ):
+        """Test that iteration stops on the first short page."""
+        pages = {0: [1, 2], 2: [3, 4], 4: [5]}
+        for start, ids in pages.items():
+            httpx_mock.add_response(
+                method="GET",
+                url=f"{base_url}/api/index.php?method=private.request.search&start={start}&length=2&orderByDir=desc&fOpen=1&output=json",
+                json=_search_page(request_search_data, ids),
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = list(client.requests.iter_search(is_open=True, page_size=2))
+
+        assert [r.x_request for r in requests] == [1, 2, 3, 4, 5]
+
+    def test_iter_search_without_prefetch(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        request_search_data: dict,
+    ):
+        """Test serial iteration, including an empty final page."""
+        pages = {0: [1, 2], 2: []}
+        for start, ids in pages.items():
+            httpx_mock.add_response(
+                method="GET",
+                url=f"{base_url}/api/index.php?method=private.request.search&start={start}&length=2&orderByDir=desc&output=json",
+                json=_search_page(request_search_data, ids),
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = list(client.requests.iter_search(page_size=2, prefetch=False))
+
+        assert [r.x_request for r in requests] == [1, 2]
+
+    def test_iter_search_is_lazy(self, base_url: str, api_token: str):
+        """Test that no request is made until iteration starts."""
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            next(client.requests.iter_search(page_size=0))
+
+
+class TestRequestsAPIGetMany:
+    """Tests for RequestsAPI.get_many()."""
+
+    def _mock_get(self, httpx_mock, base_url, request_get_data, request_id):
+        data = {"request": {**request_get_data["request"], "xRequest": request_id}}
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{base_url}/api/index.php?method=private.request.get&xRequest={request_id}&output=json",
+            json=data,
+        )
+
+    def test_get_many_in_input_order(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        request_get_data: dict,
+    ):
+        """Test that ordered results follow the input order."""
+        ids = [5, 3, 9, 1, 7]
+        for request_id in ids:
+            self._mock_get(httpx_mock, base_url, request_get_data, request_id)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(client.requests.get_many(ids, concurrency=3))
+
+        assert [r.key for r in results] == ids
+        assert all(r.ok for r in results)
+        assert [r.value.x_request for r in results] == ids
+
+    def test_get_many_completion_order(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        request_get_data: dict,
+    ):
+        """Test that unordered mode returns every ID exactly once."""
+        ids = list(range(1, 11))
+        for request_id in ids:
+            self._mock_get(httpx_mock, base_url, request_get_data, request_id)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(client.requests.get_many(ids, concurrency=4, ordered=False))
+
+        assert sorted(r.key for r in results) == ids
+
+    def test_get_many_reports_failures(
+        self,
+        base_url: str,
+        api_token: str,
+        httpx_mock,
+        request_get_data: dict,
+    ):
+        """Test that a failing ID does not abort the batch."""
+        self._mock_get(httpx_mock, base_url, request_get_data, 1)
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{base_url}/api/index.php?method=private.request.get&xRequest=2&output=json",
+            json={"errors": {"error": {"id": 201, "description": "Request not found"}}},
+        )
+        self._mock_get(httpx_mock, base_url, request_get_data, 3)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        results = list(client.requests.get_many([1, 2, 3]))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, APIError)
+        assert results[1].error.error_id == 201
+        assert results[1].value is None
+
+
+class TestResultFormat:
+    """Tests for the result_format option on list endpoints."""
+
+    def test_search_as_dicts(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that result_format="dict" returns the raw rows."""
+        data = load_fixture("request_search.json")
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.search&output=json&start=0&length=50&orderByDir=desc",
+            json=data,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        rows = client.requests.search(result_format="dict")
+
+        assert rows == parse_request_list(data, result_format="dict")
+        assert all(isinstance(row, dict) and "xRequest" in row for row in rows)
+
+    def test_trusted_models_skip_validation(self):
+        """Test that trusted mode keeps raw values and tolerates bad rows."""
+        result = {
+            "requests": {
+                "request": [
+                    {"xRequest": 1, "fOpen": 1, "sTitle": "ok", "Custom1": "x"},
+                    {"xRequest": "not-a-number", "dtGMTOpened": "yesterday"},
+                ]
+            }
+        }
+
+        first, second = parse_request_list(result, result_format="trusted")
+
+        assert isinstance(first, Request)
+        assert (first.x_request, first.is_open, first.title) == (1, 1, "ok")
+        assert first.note is None
+        assert first.model_fields_set == {"x_request", "is_open", "title"}
+        assert second.x_request == "not-a-number"
+        assert second.opened_date == "yesterday"
+
+    def test_lazy_views(self, load_fixture):
+        """Test that result_format="lazy" wraps each row."""
+        data = load_fixture("request_search.json")
+
+        views = parse_request_list(data, result_format="lazy")
+        models = parse_request_list(data)
+
+        assert [v.x_request for v in views] == [m.x_request for m in models]
+        assert [v.to_request() for v in views] == models
+
+    def test_unknown_result_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown result_format"):
+            parse_request_list({}, result_format="rows")
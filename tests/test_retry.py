@@ -0,0 +1,150 @@
+"""Tests for the retry policy."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient, RetryPolicy
+from helpspot.exceptions import HTTPError
+from helpspot.retry import parse_retry_after
+
+NO_WAIT = RetryPolicy(max_retries=2, backoff_base=0)
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://support.example.com/api/index.php")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions."""
+
+    def test_backoff_is_capped_full_jitter(self):
+        """Test that backoff stays within [0, min(max, base * 2**n)]."""
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+        for retry, cap in [(0, 1), (1, 2), (2, 4), (3, 5), (10, 5)]:
+            delays = [policy.backoff(retry) for _ in range(50)]
+            assert all(0 <= d <= cap for d in delays)
+
+    def test_retry_after(self):
+        """Test that Retry-After overrides the backoff, within max_retry_after."""
+        policy = RetryPolicy(max_retry_after=10)
+
+        assert policy.backoff(0, _status_error(429, {"Retry-After": "7"})) == 7
+        assert policy.backoff(0, _status_error(503, {"Retry-After": "600"})) == 10
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412500.0) == 10
+        assert parse_retry_after("soon") is None
+
+    def test_only_idempotent_methods_by_default(self):
+        """Test that POSTs are retried only when opted in."""
+        error = httpx.ConnectError("refused")
+        opted_in = RetryPolicy(retry_post_methods=frozenset({"private.request.create"}))
+
+        assert RetryPolicy().is_retryable("GET", "private.request.get", error)
+        assert not RetryPolicy().is_retryable("POST", "private.request.create", error)
+        assert opted_in.is_retryable("POST", "private.request.create", error)
+        assert not opted_in.is_retryable("POST", "private.request.update", error)
+
+    def test_only_transient_transport_errors(self):
+        """Test that connection failures and timeouts are retried, other errors not."""
+        policy = RetryPolicy()
+        request = httpx.Request("GET", "https://support.example.com/api/index.php")
+
+        for error in (
+            httpx.ConnectError("refused"),
+            httpx.ReadTimeout("slow", request=request),
+            httpx.RemoteProtocolError("dropped", request=request),
+        ):
+            assert policy.is_retryable("GET", "private.request.get", error)
+        for error in (
+            httpx.PoolTimeout("busy"),
+            httpx.ProxyError("bad proxy"),
+            httpx.UnsupportedProtocol("ftp"),
+        ):
+            assert not policy.is_retryable("GET", "private.request.get", error)
+
+    def test_client_errors_are_not_retried(self):
+        """Test that 4xx responses other than 429 fail immediately."""
+        policy = RetryPolicy()
+
+        assert policy.next_delay(0, "GET", "private.request.get", _status_error(404)) is None
+        assert policy.next_delay(3, "GET", "private.request.get", _status_error(503)) is None
+        assert policy.next_delay(0, "GET", "private.request.get", _status_error(503)) is not None
+
+
+class TestClientRetries:
+    """Tests for retries in BaseAPI._request."""
+
+    def test_transient_failures_are_retried(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that a GET succeeds after a connection error and a 503."""
+        url = f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345"
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=url)
+        httpx_mock.add_response(url=url, status_code=503)
+        httpx_mock.add_response(url=url, json=load_fixture("request_get.json"))
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, retry=NO_WAIT)
+        request = client.requests.get(12345)
+
+        assert request.x_request == 12745
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_retry_count_on_exception(self, base_url, api_token, httpx_mock):
+        """Test that the raised HTTPError reports the retries made."""
+        url = f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345"
+        for _ in range(3):
+            httpx_mock.add_response(url=url, status_code=502)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, retry=NO_WAIT)
+        with pytest.raises(HTTPError) as exc_info:
+            client.requests.get(12345)
+
+        assert exc_info.value.retries == 2
+        assert exc_info.value.status_code == 502
+
+    def test_creates_are_not_retried(self, base_url, api_token, httpx_mock):
+        """Test that a failed create is not repeated without opt-in."""
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{base_url}/api/index.php?method=private.request.create&output=json",
+            status_code=503,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, retry=NO_WAIT)
+        with pytest.raises(HTTPError) as exc_info:
+            client.requests.create(note="Help", email="a@example.com")
+
+        assert exc_info.value.retries == 0
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_retry_after_is_honoured(self, base_url, api_token, httpx_mock, monkeypatch):
+        """Test that the client sleeps for the server's Retry-After."""
+        url = f"{base_url}/api/index.php?method=private.user.getFilters&output=json"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "3"})
+        httpx_mock.add_response(url=url, json={"filter": []})
+        sleeps: list[float] = []
+        monkeypatch.setattr("helpspot.api.base.time.sleep", sleeps.append)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, retry=RetryPolicy())
+        assert client.filters.list() == []
+
+        assert sleeps == [3.0]
+
+    def test_async_retries(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that the async client retries too."""
+        url = f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345"
+        httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=url)
+        httpx_mock.add_response(url=url, json=load_fixture("request_get.json"))
+
+        async def main():
+            async with AsyncHelpSpotClient(
+                base_url=base_url, api_token=api_token, retry=NO_WAIT
+            ) as client:
+                return await client.requests.get(12345)
+
+        assert asyncio.run(main()).x_request == 12745
+        assert len(httpx_mock.get_requests()) == 2
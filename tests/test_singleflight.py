@@ -0,0 +1,159 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+import time
+
+import httpx
+import pytest
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient
+from helpspot.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers arriving during a call get its result."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow() -> int:
+            calls.append(1)
+            release.wait(5)
+            return 42
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while len(flight) == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 8
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+    def test_errors_are_shared_and_forgotten(self):
+        """Test that a failure is not remembered for later calls."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            flight.do("key", fail)
+        assert flight.do("key", lambda: 1) == 1
+
+    def test_async_calls_share_one_task(self):
+        """Test that concurrent coroutines share one execution."""
+        flight: AsyncSingleFlight[int] = AsyncSingleFlight()
+        calls = []
+
+        async def fetch() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 7
+
+        async def main():
+            return await asyncio.gather(*(flight.do("key", fetch) for _ in range(10)))
+
+        assert asyncio.run(main()) == [7] * 10
+        assert len(calls) == 1
+
+    def test_joiners_get_copies(self):
+        """Test that copy_result gives every joining caller its own object."""
+        flight: AsyncSingleFlight[dict] = AsyncSingleFlight(copy.deepcopy)
+
+        async def fetch() -> dict:
+            await asyncio.sleep(0.01)
+            return {"request": {"xRequest": "1"}}
+
+        async def main():
+            return await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)))
+
+        results = asyncio.run(main())
+        results[1]["request"]["xRequest"] = "2"
+
+        assert [r["request"]["xRequest"] for r in results] == ["1", "2", "1"]
+        assert results[0] is not results[2]
+
+
+class TestClientCoalescing:
+    """Tests for coalesced GETs through the clients."""
+
+    def test_threads_share_one_request(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that concurrent identical gets send one HTTP request."""
+        data = load_fixture("request_get.json")
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            return httpx.Response(200, json=data)
+
+        httpx_mock.add_callback(
+            callback,
+            url=f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345",
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, coalesce_requests=True)
+        barrier = threading.Barrier(5)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(client.requests.get(12345))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 5
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_async_tasks_share_one_request(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that gathered identical gets send one HTTP request."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345",
+            json=load_fixture("request_get.json"),
+        )
+
+        async def main():
+            async with AsyncHelpSpotClient(
+                base_url=base_url, api_token=api_token, coalesce_requests=True
+            ) as client:
+                return await asyncio.gather(*(client.requests.get(12345) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        assert len(results) == 5
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_coalescing_is_off_by_default(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that without coalesce_requests every request is sent."""
+        for _ in range(3):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.get&output=json&xRequest=12345",
+                json=load_fixture("request_get.json"),
+            )
+
+        async def main():
+            async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+                return await asyncio.gather(*(client.requests.get(12345) for _ in range(3)))
+
+        asyncio.run(main())
+
+        assert len(httpx_mock.get_requests()) == 3
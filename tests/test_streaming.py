@@ -0,0 +1,191 @@
+"""Tests for streamed parsing of request lists."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+from pytest_httpx import IteratorStream
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient, RetryPolicy
+from helpspot.exceptions import APIError, HTTPError
+from helpspot.models import Request
+from helpspot.streaming import JSONItemScanner
+
+PATH = ("filter", "request")
+
+
+def _scan(document: bytes, path=PATH, chunk_size: int | None = None, seed: int = 0):
+    """Feed a document in random (or fixed) chunk sizes; return (items, close())."""
+    rng = random.Random(seed)
+    scanner = JSONItemScanner(path)
+    items = []
+    pos = 0
+    while pos < len(document):
+        size = chunk_size or rng.randint(1, 32)
+        items += scanner.feed(document[pos : pos + size])
+        pos += size
+    return items, scanner.close()
+
+
+class TestJSONItemScanner:
+    """Tests for JSONItemScanner."""
+
+    def test_items_across_chunk_boundaries(self):
+        """Test that every split of the document yields the same elements."""
+        rows = [
+            {"xRequest": 1, "tNote": 'He said "}]" and left\\'},
+            {"xRequest": 2, "nested": {"a": [1, {"b": "}"}]}, "sTitle": "é ✓"},
+            {"xRequest": 3, "tNote": "} } } } }"},
+            7,
+            "text",
+            None,
+        ]
+        document = json.dumps(
+            {"filter": {"sFilterName": "a {b} [c]", "tFilterDef": "{}", "request": rows}}
+        ).encode()
+
+        for seed in range(50):
+            items, rest = _scan(document, seed=seed)
+            assert items == rows
+            assert rest is None
+
+    def test_single_object(self):
+        """Test that a lone object at the path is the only element."""
+        document = b'{"requests": {"request": {"xRequest": 5}}}'
+
+        assert _scan(document, ("requests", "request")) == ([{"xRequest": 5}], None)
+
+    def test_skips_other_keys(self):
+        """Test that same-named keys elsewhere in the document are ignored."""
+        document = json.dumps(
+            {"request": [0], "filter": {"x": {"request": [1]}, "request": [2]}, "after": [3]}
+        ).encode()
+
+        assert _scan(document) == ([2], None)
+
+    def test_empty_and_missing(self):
+        """Test empty lists, nulls and documents without the path."""
+        assert _scan(b'{"filter": {"request": []}}') == ([], None)
+        assert _scan(b'{"filter": {"request": null}}') == ([], None)
+
+        error = b'{"errors": {"error": [{"id": 1, "description": "Bad"}]}}'
+        assert _scan(error) == ([], error)
+
+    def test_memory_bounded_by_one_element(self):
+        """Test that the buffer only holds the element in progress."""
+        row = json.dumps({"xRequest": 1, "tNote": "x" * 1000}).encode()
+        document = b'{"filter": {"request": [' + b", ".join([row] * 200) + b"]}}"
+        scanner = JSONItemScanner(PATH)
+
+        largest = 0
+        for pos in range(0, len(document), 256):
+            scanner.feed(document[pos : pos + 256])
+            largest = max(largest, len(scanner._buf))
+
+        assert scanner.close() is None
+        assert largest < len(row) + 2 * 256
+
+    def test_truncated_document(self):
+        """Test that a document ending inside the list is an error."""
+        scanner = JSONItemScanner(PATH)
+        scanner.feed(b'{"filter": {"request": [{"xRequest": 1}, {"xReq')
+
+        with pytest.raises(ValueError, match="ended"):
+            scanner.close()
+
+
+class TestStreamEndpoints:
+    """Tests for filters.stream() and requests.stream_search()."""
+
+    def test_filter_stream(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that streamed rows match get()."""
+        data = load_fixture("filter_get.json")
+        body = json.dumps(data).encode()
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.filter.get&output=json&xFilter=42&start=0&length=50",
+            stream=IteratorStream([body[i : i + 7] for i in range(0, len(body), 7)]),
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        requests = list(client.filters.stream("42"))
+
+        assert all(isinstance(r, Request) for r in requests)
+        assert [r.x_request for r in requests] == [
+            row["xRequest"] for row in data["filter"]["request"]
+        ]
+
+    def test_search_stream_formats(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test result formats and that streamed calls bypass the cache."""
+        data = load_fixture("request_search.json")
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=f"{base_url}/api/index.php?method=private.request.search&output=json&start=0&length=50&orderByDir=desc",
+                json=data,
+            )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        rows = list(client.requests.stream_search(result_format="dict"))
+        views = list(client.requests.stream_search(result_format="lazy"))
+
+        assert rows == data["requests"]["request"]
+        assert [v.x_request for v in views] == [r["xRequest"] for r in rows]
+        assert len(httpx_mock.get_requests()) == 2
+        with pytest.raises(ValueError, match="from_rows"):
+            next(client.requests.stream_search(result_format="batch"))
+
+    def test_api_error(self, base_url, api_token, httpx_mock):
+        """Test that error replies raise APIError."""
+        httpx_mock.add_response(
+            json={"errors": {"error": [{"id": 104, "description": "Filter not found"}]}}
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        with pytest.raises(APIError, match="Filter not found"):
+            list(client.filters.stream("42"))
+
+    def test_invalid_json(self, base_url, api_token, httpx_mock):
+        """Test that a malformed list raises HTTPError."""
+        httpx_mock.add_response(content=b'{"filter": {"request": [{"xRequest": 1} !')
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        with pytest.raises(HTTPError, match="Invalid JSON"):
+            list(client.filters.stream("42"))
+
+    def test_retries_before_first_row(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that a failed status is retried before anything is yielded."""
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json=load_fixture("filter_get.json"))
+
+        client = HelpSpotClient(
+            base_url=base_url,
+            api_token=api_token,
+            retry=RetryPolicy(max_retries=1, backoff_base=0),
+        )
+
+        assert len(list(client.filters.stream("42", result_format="dict"))) == 1
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_async_stream(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test the asyncio filter stream."""
+        data = load_fixture("filter_get.json")
+        httpx_mock.add_response(json=data)
+
+        async def collect():
+            async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+                return [r async for r in client.filters.stream("42", result_format="dict")]
+
+        assert asyncio.run(collect()) == data["filter"]["request"]
+
+    def test_stream_error_status(self, base_url, api_token, httpx_mock):
+        """Test that an HTTP error without retries raises HTTPError."""
+        httpx_mock.add_response(status_code=500)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, retry=None)
+        with pytest.raises(HTTPError) as exc_info:
+            list(client.filters.stream("42"))
+        assert exc_info.value.status_code == 500
+        assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
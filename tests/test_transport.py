@@ -0,0 +1,102 @@
+"""Tests for connection pool options and shared transports."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from helpspot import AsyncHelpSpotClient, AsyncSharedTransport, HelpSpotClient, SharedTransport
+
+FILTERS_URL = "{base_url}/api/index.php?method=private.user.getFilters&output=json"
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport answering every request and recording close()."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"filter": []})
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestPoolOptions:
+    """Tests for pool limits."""
+
+    def test_limits_are_applied(self, base_url):
+        """Test that pool options reach the httpx connection pool."""
+        client = HelpSpotClient(
+            base_url=base_url, max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5
+        )
+        pool = client._http_client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 1.5
+
+
+class TestSharedTransport:
+    """Tests for SharedTransport."""
+
+    def test_clients_share_and_release_the_transport(self, base_url):
+        """Test that the pool closes only after the last client closes."""
+        inner = RecordingTransport()
+        shared = SharedTransport(transport=inner)
+
+        first = HelpSpotClient(base_url=base_url, api_token="a", transport=shared)
+        second = HelpSpotClient(base_url=base_url, api_token="b", transport=shared)
+        first.filters.list()
+        second.filters.list()
+
+        assert [r.headers["Authorization"] for r in inner.requests] == ["Bearer a", "Bearer b"]
+
+        first.close()
+        assert not inner.closed
+        second.close()
+        assert inner.closed
+
+    def test_transport_rejects_client_pool_options(self, base_url):
+        """Test that options the transport would override are rejected."""
+        shared = SharedTransport(transport=RecordingTransport())
+
+        with pytest.raises(ValueError, match="verify_ssl, connection limits"):
+            HelpSpotClient(base_url=base_url, transport=shared, verify_ssl=False, max_connections=5)
+        with pytest.raises(ValueError, match="http2"):
+            AsyncHelpSpotClient(base_url=base_url, transport=AsyncSharedTransport(), http2=True)
+
+    def test_shared_transport_uses_http_transport(self, base_url, api_token, httpx_mock):
+        """Test that the default shared pool sends real requests."""
+        for _ in range(2):
+            httpx_mock.add_response(url=FILTERS_URL.format(base_url=base_url), json={"filter": []})
+
+        shared = SharedTransport(max_connections=10)
+        with HelpSpotClient(base_url=base_url, api_token=api_token, transport=shared) as a:
+            with HelpSpotClient(base_url=base_url, api_token=api_token, transport=shared) as b:
+                a.filters.list()
+                b.filters.list()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_async_shared_transport(self, base_url, api_token, httpx_mock):
+        """Test that async clients can share a pool."""
+        for _ in range(2):
+            httpx_mock.add_response(url=FILTERS_URL.format(base_url=base_url), json={"filter": []})
+
+        async def main():
+            shared = AsyncSharedTransport()
+            async with (
+                AsyncHelpSpotClient(base_url=base_url, api_token=api_token, transport=shared) as a,
+                AsyncHelpSpotClient(base_url=base_url, api_token=api_token, transport=shared) as b,
+            ):
+                await asyncio.gather(a.filters.list(), b.filters.list())
+
+        asyncio.run(main())
+
+        assert len(httpx_mock.get_requests()) == 2
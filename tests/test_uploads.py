@@ -0,0 +1,217 @@
+"""Tests for streamed file attachments."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import os
+import tracemalloc
+from email.parser import BytesParser
+from email.policy import HTTP
+
+import pytest
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient, RetryPolicy, uploads
+from helpspot.exceptions import ValidationError
+from helpspot.uploads import FileUpload, MultipartForm, form_content
+from helpspot.utils import prepare_file_uploads
+
+CREATED = {"xRequest": 12750, "accesskey": "12750abc123"}
+
+
+def _fields(content_type: str, body: bytes) -> dict[str, str]:
+    """Parse a multipart/form-data body into its fields."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(decode=True).decode()
+        for part in message.iter_parts()
+    }
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Encode in 6-byte chunks so small files span several."""
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 6)
+
+
+class TestFileUpload:
+    """Tests for FileUpload."""
+
+    @pytest.mark.parametrize("size", [0, 1, 5, 6, 7, 100])
+    def test_path_encoding(self, tmp_path, small_chunks, size):
+        """Test that a memory-mapped file encodes like b64encode."""
+        content = os.urandom(size)
+        path = tmp_path / "report.pdf"
+        path.write_bytes(content)
+        upload = FileUpload(path)
+
+        assert b"".join(upload.iter_base64()) == base64.b64encode(content)
+        assert upload.encoded_size == len(base64.b64encode(content))
+        assert (upload.filename, upload.mime_type, upload.size) == (
+            "report.pdf",
+            "application/pdf",
+            size,
+        )
+
+    def test_file_object_from_position(self, tmp_path, small_chunks):
+        """Test that file objects are read from their position, on every pass."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"header" + b"0123456789" * 5)
+
+        with open(path, "rb") as file:
+            file.seek(6)
+            upload = FileUpload(file, mime_type="text/plain")
+            expected = base64.b64encode(b"0123456789" * 5)
+            assert b"".join(upload.iter_base64()) == expected
+            assert b"".join(upload.iter_base64()) == expected
+        assert (upload.filename, upload.mime_type) == ("data.bin", "text/plain")
+
+    def test_in_memory_file_object(self, small_chunks):
+        """Test objects that cannot be memory-mapped."""
+        upload = FileUpload(io.BytesIO(b"x" * 50), filename="x.txt")
+
+        assert b"".join(upload.iter_base64()) == base64.b64encode(b"x" * 50)
+        with pytest.raises(ValidationError, match="filename"):
+            FileUpload(io.BytesIO(b"x"))
+
+    def test_file_shrunk(self, tmp_path):
+        """Test that a file shorter than announced is an error."""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"x" * 10)
+        upload = FileUpload(path)
+        path.write_bytes(b"x" * 4)
+
+        with pytest.raises(ValidationError, match="changed size"):
+            b"".join(upload.iter_base64())
+
+    def test_memory_stays_flat(self, tmp_path):
+        """Test that encoding a large file holds a few chunks, not the file."""
+        path = tmp_path / "big.bin"
+        with open(path, "wb") as file:
+            file.truncate(32 * 1024 * 1024)
+
+        tracemalloc.start()
+        total = sum(len(chunk) for chunk in MultipartForm({"File1_bFileBody": FileUpload(path)}))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert total > 40 * 1024 * 1024
+        assert peak < 8 * uploads.CHUNK_SIZE
+
+
+class TestMultipartForm:
+    """Tests for MultipartForm and form_content."""
+
+    def test_body_and_length(self, tmp_path):
+        """Test that the body parses back to the fields and matches its length."""
+        path = tmp_path / "a.png"
+        path.write_bytes(os.urandom(1000))
+        data = {"tNote": "Bonjour ✓", **prepare_file_uploads([path])}
+        form = MultipartForm(data)
+        body = b"".join(form)
+
+        assert len(body) == len(form) == int(form.headers["Content-Length"])
+        assert _fields(form.headers["Content-Type"], body) == {
+            "tNote": "Bonjour ✓",
+            "File1_sFilename": "a.png",
+            "File1_sFileMimeType": "image/png",
+            "File1_bFileBody": base64.b64encode(path.read_bytes()).decode(),
+        }
+
+    def test_async_body_reads_off_the_loop(self, tmp_path, small_chunks, monkeypatch):
+        """Test that the async body matches the sync one, reading files in threads."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(os.urandom(100))
+        form = MultipartForm({"tNote": "hi", **prepare_file_uploads([path])})
+        calls = []
+        to_thread = asyncio.to_thread
+
+        async def counting_to_thread(func, *args):
+            calls.append(func)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(uploads.asyncio, "to_thread", counting_to_thread)
+
+        async def read():
+            return [chunk async for chunk in form.aiter()]
+
+        assert b"".join(asyncio.run(read())) == b"".join(form)
+        assert len(calls) > 1
+
+    def test_plain_data_stays_urlencoded(self):
+        """Test that forms without FileUploads are sent as before."""
+        files = [{"filename": "a.txt", "mime_type": "text/plain", "content": b"abc"}]
+        data = {"tNote": "hi", **prepare_file_uploads(files)}
+
+        assert form_content(data) == {"data": data}
+        assert data["File1_bFileBody"] == "YWJj"
+
+    def test_invalid_entry(self):
+        """Test that dict entries need content, path or file."""
+        with pytest.raises(ValidationError):
+            prepare_file_uploads([{"filename": "a.txt", "mime_type": "text/plain"}])
+
+
+class TestRequestUploads:
+    """Tests for create()/update() with streamed attachments."""
+
+    def test_create_with_path(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that a path is sent as a multipart base64 field."""
+        path = tmp_path / "screenshot.png"
+        path.write_bytes(os.urandom(5000))
+        httpx_mock.add_response(method="POST", json=CREATED)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token)
+        request = client.requests.create(note="See attached", category_id=1, files=[path])
+
+        sent = httpx_mock.get_request()
+        fields = _fields(sent.headers["Content-Type"], sent.read())
+        assert request.x_request == 12750
+        assert int(sent.headers["Content-Length"]) == len(sent.content)
+        assert fields["tNote"] == "See attached"
+        assert fields["File1_sFilename"] == "screenshot.png"
+        assert base64.b64decode(fields["File1_bFileBody"]) == path.read_bytes()
+
+    def test_retry_resends_file(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test that a retried upload sends the whole file again."""
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"hello world")
+        httpx_mock.add_response(method="POST", status_code=503)
+        httpx_mock.add_response(method="POST", json=CREATED)
+
+        client = HelpSpotClient(
+            base_url=base_url,
+            api_token=api_token,
+            retry=RetryPolicy(
+                max_retries=1,
+                backoff_base=0,
+                retry_post_methods=frozenset({"private.request.update"}),
+            ),
+        )
+        with open(path, "rb") as file:
+            client.requests.update(note="Logs", request_id=12750, files=[file])
+
+        for sent in httpx_mock.get_requests():
+            fields = _fields(sent.headers["Content-Type"], sent.read())
+            assert fields["File1_bFileBody"] == base64.b64encode(b"hello world").decode()
+
+    def test_async_create_with_path(self, base_url, api_token, httpx_mock, tmp_path):
+        """Test streamed uploads through AsyncHelpSpotClient."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"async body")
+        httpx_mock.add_response(method="POST", json=CREATED)
+
+        async def create():
+            async with AsyncHelpSpotClient(base_url=base_url, api_token=api_token) as client:
+                return await client.requests.create(
+                    note="n", category_id=1, files=[{"path": path, "mime_type": "text/plain"}]
+                )
+
+        assert asyncio.run(create()).x_request == 12750
+        sent = httpx_mock.get_request()
+        fields = _fields(sent.headers["Content-Type"], sent.content)
+        assert fields["File1_sFileMimeType"] == "text/plain"
+        assert base64.b64decode(fields["File1_bFileBody"]) == b"async body"
@@ -0,0 +1,165 @@
+"""Tests for XML output format support."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from pathlib import Path
+
+import pytest
+from pytest_httpx import IteratorStream
+
+from helpspot import AsyncHelpSpotClient, HelpSpotClient
+from helpspot.codec import decode_xml
+from helpspot.exceptions import APIError, HTTPError
+from helpspot.models import Request
+from helpspot.streaming import XMLItemScanner
+
+FILTER_XML = (Path(__file__).parent / "fixtures" / "filter_get.xml").read_bytes()
+
+
+class TestDecodeXML:
+    """Tests for decode_xml and XMLItemScanner."""
+
+    def test_decode_shape(self):
+        """Test that XML decodes to the shape of the JSON output."""
+        result = decode_xml(
+            b"<requests><request><xRequest>1</xRequest><sTitle/></request>"
+            b"<request><xRequest>2</xRequest><tags><tag>a</tag><tag>b</tag></tags></request>"
+            b"</requests>"
+        )
+
+        assert result == {
+            "requests": {
+                "request": [
+                    {"xRequest": "1", "sTitle": ""},
+                    {"xRequest": "2", "tags": {"tag": ["a", "b"]}},
+                ]
+            }
+        }
+
+    def test_scanner_matches_decode(self):
+        """Test that every split of the document yields the decoded rows."""
+        expected = decode_xml(FILTER_XML)["filter"]["request"]
+
+        for seed in range(20):
+            rng = random.Random(seed)
+            scanner = XMLItemScanner(("filter", "request"))
+            items = []
+            pos = 0
+            while pos < len(FILTER_XML):
+                size = rng.randint(1, 64)
+                items += scanner.feed(FILTER_XML[pos : pos + size])
+                pos += size
+            assert items == [expected]
+            assert scanner.close() is None
+
+    def test_scanner_detaches_items(self):
+        """Test that completed items are dropped from the tree."""
+        row = b"<request><xRequest>1</xRequest><tNote>" + b"x" * 1000 + b"</tNote></request>"
+        scanner = XMLItemScanner(("filter", "request"))
+        scanner.feed(b"<filter><sFilterName>Inbox</sFilterName>")
+
+        for _ in range(100):
+            assert len(scanner.feed(row)) == 1
+        assert len(scanner._stack[0]) == 1  # only sFilterName is kept
+        scanner.feed(b"</filter>")
+        assert scanner.close() is None
+
+    def test_scanner_other_root(self):
+        """Test that a document with another root is returned whole."""
+        error = b"<errors><error><id>104</id><description>Bad</description></error></errors>"
+        scanner = XMLItemScanner(("filter", "request"))
+
+        assert scanner.feed(error) == []
+        assert scanner.close() == error
+
+    def test_scanner_truncated(self):
+        """Test that a truncated document is an error."""
+        scanner = XMLItemScanner(("filter", "request"))
+        scanner.feed(b"<filter><request><xRequest>1</xRequest></request><requ")
+
+        with pytest.raises(ValueError):
+            scanner.close()
+
+
+class TestXMLClient:
+    """Tests for clients created with output_format="xml"."""
+
+    def test_filter_get_matches_json(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that XML replies produce the same Request objects as JSON ones."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=private.filter.get&output=xml&xFilter=42&start=0&length=50",
+            content=FILTER_XML,
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml")
+        requests = client.filters.get("42")
+        expected = [Request(**row) for row in load_fixture("filter_get.json")["filter"]["request"]]
+
+        assert requests == expected
+
+    def test_filter_stream(self, base_url, api_token, httpx_mock, load_fixture):
+        """Test that streamed XML rows match the JSON fixture."""
+        httpx_mock.add_response(
+            stream=IteratorStream([FILTER_XML[i : i + 5] for i in range(0, len(FILTER_XML), 5)])
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml")
+        requests = list(client.filters.stream("42"))
+        expected = [Request(**row) for row in load_fixture("filter_get.json")["filter"]["request"]]
+
+        assert requests == expected
+
+    def test_async_filter_stream(self, base_url, api_token, httpx_mock):
+        """Test the asyncio XML stream."""
+        httpx_mock.add_response(content=FILTER_XML)
+
+        async def collect():
+            async with AsyncHelpSpotClient(
+                base_url=base_url, api_token=api_token, output_format="xml"
+            ) as client:
+                return [r async for r in client.filters.stream("42", result_format="dict")]
+
+        assert [r["xRequest"] for r in asyncio.run(collect())] == ["12746"]
+
+    def test_api_error(self, base_url, api_token, httpx_mock):
+        """Test that XML error replies raise APIError, streamed or not."""
+        error = (
+            b"<errors><error><id>104</id>"
+            b"<description>Filter not found</description></error></errors>"
+        )
+        httpx_mock.add_response(content=error, is_reusable=True)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml")
+        with pytest.raises(APIError) as exc_info:
+            client.filters.get("42")
+        assert exc_info.value.error_id == 104
+        with pytest.raises(APIError, match="Filter not found"):
+            list(client.filters.stream("42"))
+
+    def test_invalid_xml(self, base_url, api_token, httpx_mock):
+        """Test that a malformed body raises HTTPError."""
+        httpx_mock.add_response(content=b"<filter><request>", is_reusable=True)
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml")
+        with pytest.raises(HTTPError, match="Invalid XML"):
+            client.filters.get("42")
+        with pytest.raises(HTTPError, match="Invalid XML"):
+            list(client.filters.stream("42"))
+
+    def test_version(self, base_url, api_token, httpx_mock):
+        """Test that the XML version reply is unwrapped."""
+        httpx_mock.add_response(
+            url=f"{base_url}/api/index.php?method=version&output=xml",
+            content=b"<results><version>5.0</version><min_version>4.0</min_version></results>",
+        )
+
+        client = HelpSpotClient(base_url=base_url, api_token=api_token, output_format="xml")
+
+        assert client.version().version == "5.0"
+
+    def test_unsupported_format(self, base_url, api_token):
+        """Test that formats the client cannot decode are rejected."""
+        with pytest.raises(ValueError, match="output_format"):
+            HelpSpotClient(base_url=base_url, api_token=api_token, output_format="php")